@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""Benchmark MCP server cold start: lazy tool registry vs eager imports.
+
+Each sample runs in a fresh interpreter (MCP clients spawn one process per
+session), imports twitch_mcp.server, builds the server and answers
+list_tools. The eager variant additionally imports every tool module, which
+is what create_server() used to do before the lazy registry.
+
+Usage:
+    poetry run python scripts/benchmark_cold_start.py [--runs 10]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+SNIPPET = """
+import time
+start = time.perf_counter()
+from twitch_mcp.server import create_server
+from twitch_mcp.registry import ToolRegistry
+registry = ToolRegistry()
+if {eager}:
+    registry.load_all()
+create_server(registry)
+tools = registry.list_tools()
+ready = time.perf_counter()
+registry.get_handler("twitch_get_users")
+first_call = time.perf_counter()
+print(ready - start, first_call - start, len(tools), len(registry.loaded_modules))
+"""
+
+
+def run_sample(eager: bool) -> tuple[float, float, int, int]:
+    """Run one cold start in a subprocess."""
+    env = {k: v for k, v in os.environ.items() if k not in ("CSS_TOKEN", "TWITCH_ENV_FILE")}
+    out = subprocess.run(
+        [sys.executable, "-c", SNIPPET.format(eager=eager)],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(out[0]), float(out[1]), int(out[2]), int(out[3])
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description="Cold start benchmark")
+    parser.add_argument("--runs", type=int, default=10, help="Samples per mode")
+    args = parser.parse_args()
+
+    # Warm the bytecode cache so both modes compare import cost only
+    run_sample(eager=True)
+
+    results = {}
+    for label, eager in (("eager", True), ("lazy", False)):
+        samples = [run_sample(eager) for _ in range(args.runs)]
+        results[label] = samples
+        ready = statistics.median(s[0] for s in samples) * 1000
+        first = statistics.median(s[1] for s in samples) * 1000
+        tools, modules = samples[0][2], samples[0][3]
+        print(
+            f"{label:>5}: list_tools ready {ready:7.1f} ms | "
+            f"first call resolved {first:7.1f} ms | "
+            f"{tools} tools, {modules} modules imported"
+        )
+
+    eager_ready = statistics.median(s[0] for s in results["eager"])
+    lazy_ready = statistics.median(s[0] for s in results["lazy"])
+    print(f"\nCold start improvement: {(eager_ready - lazy_ready) * 1000:.1f} ms "
+          f"({(1 - lazy_ready / eager_ready) * 100:.0f}% faster to list_tools)")
+
+
+if __name__ == "__main__":
+    main()
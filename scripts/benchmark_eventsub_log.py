@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Benchmark EventSub event logging: per-event open/write vs buffered writer.
+
+Feeds synthetic channel.chat.notification events through
+EventSubListener._handle_event with a no-op handler and a log file, and
+reports events per second plus the longest event-loop stall seen by a
+heartbeat task. The "before" variant reproduces the old logging code,
+which opened the log file and wrote one line per event on the event loop.
+
+Usage:
+    poetry run python scripts/benchmark_eventsub_log.py [--events 20000]
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+from twitch_mcp.eventsub.listener import EventSubListener
+
+
+def make_event(i: int) -> dict:
+    """Build a chat notification payload (no built-in handler, so only logging is measured)."""
+    return {
+        "subscription": {"id": "sub-1", "type": "channel.chat.notification", "version": "1"},
+        "event": {
+            "broadcaster_user_id": "1234",
+            "chatter_user_id": str(100000 + i),
+            "chatter_user_name": f"viewer{i}",
+            "message_id": f"msg-{i}",
+            "message": {"text": f"HYPE message number {i} PogChamp", "fragments": []},
+            "badges": [{"set_id": "subscriber", "id": "12", "info": "12"}],
+        },
+    }
+
+
+class LegacyLogListener(EventSubListener):
+    """Listener using the previous per-event synchronous log write."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._log_writer = None
+
+    async def _handle_event(self, event: dict) -> None:
+        timestamp = datetime.utcnow().isoformat()
+        with open(self.log_file, "a") as f:
+            f.write(json.dumps({"timestamp": timestamp, "event": event}) + "\n")
+        await super()._handle_event(event)
+
+
+async def _noop(event_type: str, data: dict) -> None:
+    pass
+
+
+async def run(listener_cls: type[EventSubListener], path: Path, events: list[dict]) -> tuple[float, float]:
+    """Process all events; return (events/sec, max loop stall in ms)."""
+    listener = listener_cls(sdk=None, log_file=path, handler=_noop)
+    max_stall = 0.0
+    running = True
+
+    async def heartbeat() -> None:
+        nonlocal max_stall
+        last = time.perf_counter()
+        while running:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            max_stall = max(max_stall, now - last - 0.001)
+            last = now
+
+    beat = asyncio.create_task(heartbeat())
+    start = time.perf_counter()
+    for i, event in enumerate(events):
+        await listener._handle_event(event)
+        # Let other tasks run now and then, as a websocket reader would
+        if i % 100 == 0:
+            await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+    if listener._log_writer:
+        await listener._log_writer.close()
+    running = False
+    await beat
+
+    lines = sum(1 for _ in open(path))
+    assert lines == len(events), f"expected {len(events)} lines, found {lines}"
+    return len(events) / elapsed, max_stall * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20000, help="Events per run (default 20000)")
+    args = parser.parse_args()
+
+    events = [make_event(i) for i in range(args.events)]
+    with tempfile.TemporaryDirectory() as tmp:
+        before = asyncio.run(run(LegacyLogListener, Path(tmp) / "before.jsonl", events))
+        after = asyncio.run(run(EventSubListener, Path(tmp) / "after.jsonl", events))
+
+    print(f"{'':<28}{'events/s':>12}{'max stall':>14}")
+    print(f"{'before (open per event)':<28}{before[0]:>12,.0f}{before[1]:>11.1f} ms")
+    print(f"{'after (buffered writer)':<28}{after[0]:>12,.0f}{after[1]:>11.1f} ms")
+    print(f"speedup: {after[0] / before[0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""Benchmark the EventSub event path under sustained synthetic load.
+
+Starts scripts/mock_eventsub_server.py in a separate process and points an
+EventSubListener (queue, dispatcher and the built-in handlers from
+handlers.py, with their output discarded) at it. After a warm-up it
+measures, over the soak:
+
+- sustained events per second handled;
+- handler latency p50/p99, overall and per handler;
+- queue lag (received -> handled);
+- RSS growth, sampled every --sample-interval seconds, with its slope.
+
+With --rate 0 (the default) the server sends as fast as the listener reads,
+so the events/s figure is the listener's capacity. With a fixed --rate the
+run shows whether that rate is sustainable and what latency it costs.
+
+Usage:
+    poetry run python scripts/benchmark_eventsub_throughput.py [--duration 600] [--rate 0] [--mix stream]
+    poetry run python scripts/benchmark_eventsub_throughput.py --duration 30 --warmup 5 --mix chat --json
+"""
+
+import argparse
+import asyncio
+import contextlib
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+from twitch_mcp.eventsub.latency import HandlerLatency
+from twitch_mcp.eventsub.listener import EventSubListener
+
+SERVER = Path(__file__).with_name("mock_eventsub_server.py")
+# Latency samples kept per handler; bounded so the recorder does not show up as RSS growth
+MAX_SAMPLES = 100_000
+
+
+def rss_mb() -> float:
+    """Current resident set size in MB (peak RSS where /proc is unavailable)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except OSError:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 1024 / 1024 if sys.platform == "darwin" else peak / 1024
+
+
+def slope_per_minute(samples: list[tuple[float, float]]) -> float:
+    """Least-squares slope of (seconds, value) samples, per minute."""
+    if len(samples) < 2:
+        return 0.0
+    n = len(samples)
+    mean_t = sum(t for t, _ in samples) / n
+    mean_v = sum(v for _, v in samples) / n
+    var = sum((t - mean_t) ** 2 for t, _ in samples)
+    cov = sum((t - mean_t) * (v - mean_v) for t, v in samples)
+    return cov / var * 60 if var else 0.0
+
+
+def start_server(args) -> tuple[subprocess.Popen, str]:
+    server = subprocess.Popen(
+        [sys.executable, str(SERVER), "--rate", str(args.rate), "--mix", args.mix],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    url = server.stdout.readline().strip()
+    if not url.startswith("ws://"):
+        server.kill()
+        raise RuntimeError("mock server did not start")
+    return server, url
+
+
+def log(message: str) -> None:
+    print(message, file=sys.stderr, flush=True)
+
+
+async def run(args, url: str) -> dict:
+    latency = HandlerLatency(max_samples=MAX_SAMPLES)
+    listener = EventSubListener(
+        SimpleNamespace(http=None),
+        workers=args.workers,
+        partition_by=None if args.partition_by == "none" else args.partition_by,
+        ws_url=url,
+        handler_latency=latency,
+    )
+    await listener.connect()
+    listening = asyncio.create_task(listener.listen())
+
+    log(f"Warming up for {args.warmup:g}s...")
+    await asyncio.sleep(args.warmup)
+    latency.reset()
+    start_handled = listener.queue.handled
+    started = time.perf_counter()
+    rss_samples = [(0.0, rss_mb())]
+    log(f"Measuring for {args.duration:g}s (RSS {rss_samples[0][1]:.1f} MB)")
+
+    while (elapsed := time.perf_counter() - started) < args.duration:
+        await asyncio.sleep(min(args.sample_interval, args.duration - elapsed))
+        elapsed = time.perf_counter() - started
+        rss_samples.append((elapsed, rss_mb()))
+        handled = listener.queue.handled - start_handled
+        log(f"  {elapsed:6.0f}s  {handled / elapsed:>10,.0f} events/s  RSS {rss_samples[-1][1]:.1f} MB")
+
+    elapsed = time.perf_counter() - started
+    handled = listener.queue.handled - start_handled
+    queue = listener.queue.stats()
+    listening.cancel()
+    await asyncio.gather(listening, return_exceptions=True)
+    await listener.stop()
+
+    return {
+        "mix": args.mix,
+        "rate": args.rate or None,
+        "workers": args.workers,
+        "duration_s": round(elapsed, 1),
+        "events": handled,
+        "events_per_sec": round(handled / elapsed, 1),
+        "latency": latency.overall(),
+        "handlers": latency.summary(),
+        "queue": {"avg_lag_ms": queue["avg_lag_ms"], "max_lag_ms": queue["max_lag_ms"], "peak_depth": queue["peak_depth"]},
+        "rss_mb": {
+            "start": round(rss_samples[0][1], 1),
+            "end": round(rss_samples[-1][1], 1),
+            "growth": round(rss_samples[-1][1] - rss_samples[0][1], 1),
+            "slope_per_min": round(slope_per_minute(rss_samples), 3),
+        },
+    }
+
+
+def format_report(report: dict) -> str:
+    rate = f"{report['rate']:g}/s offered" if report["rate"] else "unlimited"
+    lat, rss, queue = report["latency"], report["rss_mb"], report["queue"]
+    lines = [
+        f"mix {report['mix']}, {rate}, {report['workers']} workers, {report['duration_s']}s soak",
+        f"sustained:  {report['events_per_sec']:,.0f} events/s ({report['events']:,} events)",
+        f"handlers:   p50 {lat['p50_ms']} ms, p99 {lat['p99_ms']} ms, max {lat['max_ms']} ms",
+        f"queue lag:  avg {queue['avg_lag_ms']} ms, max {queue['max_lag_ms']} ms, peak depth {queue['peak_depth']}",
+        f"RSS:        {rss['start']} -> {rss['end']} MB ({rss['growth']:+} MB, {rss['slope_per_min']:+} MB/min)",
+        f"  {'handler':<32}{'calls':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}",
+    ]
+    for name, h in report["handlers"].items():
+        lines.append(f"  {name:<32}{h['count']:>10}{h['p50_ms']:>10}{h['p99_ms']:>10}{h['max_ms']:>10}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--duration", type=float, default=600, help="Soak seconds after warm-up (default: 600)")
+    parser.add_argument("--warmup", type=float, default=30, help="Warm-up seconds, not measured (default: 30)")
+    parser.add_argument("--rate", type=float, default=0, help="Events/s offered; 0 sends as fast as read (default)")
+    parser.add_argument("--mix", default="stream", help="Event mix preset or type=weight,... (default: stream)")
+    parser.add_argument("--workers", type=int, default=4, help="Listener workers (default: 4)")
+    parser.add_argument("--partition-by", default="type", help="Listener partitioning (default: type)")
+    parser.add_argument("--sample-interval", type=float, default=10, help="Seconds between RSS samples (default: 10)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    server, url = start_server(args)
+    try:
+        # Handlers print every event; discard that, keep the cost of formatting it
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            report = asyncio.run(run(args, url))
+    finally:
+        server.terminate()
+        server.wait()
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
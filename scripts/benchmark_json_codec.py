@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""Benchmark the JSON codec backends on EventSub payloads.
+
+For every backend installed (see twitch_mcp.codec) it measures, per frame:
+
+- parse: frame text -> dict, as the listener does for each message;
+- serialize: event dict -> JSON, as the event store and JSON output do;
+- log line: what the listener logs per event, either the event serialized
+  again (the previous format) or the raw frame wrapped as is.
+
+Frames come from a recorded --log file or, by default, from the generator
+in scripts/mock_eventsub_server.py (--mix picks the event mix).
+
+Usage:
+    poetry run python scripts/benchmark_json_codec.py [--frames 20000] [--mix all]
+    poetry run python scripts/benchmark_json_codec.py --log events.jsonl --json
+"""
+
+import argparse
+import json
+import time
+from datetime import datetime
+from typing import Callable
+
+from mock_eventsub_server import LoadGenerator, parse_mix
+
+from twitch_mcp import codec
+from twitch_mcp.eventsub.frames import message_event
+from twitch_mcp.eventsub.segments import iter_log_entries
+from twitch_mcp.eventsub.writer import frame_line
+
+
+def recorded_frames(log_path: str, limit: int) -> list[str]:
+    """Rebuild notification frames from the events of a listener log."""
+    frames = []
+    for entry in iter_log_entries(log_path):
+        event = dict(entry["event"])
+        if "revocation" in event:
+            continue
+        metadata = {
+            "message_id": event.pop("message_id", None),
+            "message_type": "notification",
+            "message_timestamp": event.pop("message_timestamp", None),
+        }
+        frames.append(json.dumps({"metadata": metadata, "payload": event}))
+        if len(frames) >= limit:
+            break
+    return frames
+
+
+def best_of(repeat: int, func: Callable[[], object]) -> float:
+    """Fastest of repeat runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def measure(name: str, frames: list[str], repeat: int) -> dict:
+    loads, dumps = codec._load_backend(name)
+    events = [message_event(loads(frame)) for frame in frames]
+    timestamp = datetime.utcnow().isoformat()
+
+    def log_events():
+        return [dumps({"timestamp": timestamp, "event": event}) + "\n" for event in events]
+
+    def log_frames():
+        return [frame_line(timestamp, frame) for frame in frames]
+
+    timings = {
+        "parse": best_of(repeat, lambda: [loads(frame) for frame in frames]),
+        "serialize": best_of(repeat, lambda: [dumps(event) for event in events]),
+        "log_event": best_of(repeat, log_events),
+        "log_frame": best_of(repeat, log_frames),
+    }
+    return {key: round(seconds / len(frames) * 1e6, 3) for key, seconds in timings.items()}
+
+
+def format_report(report: dict) -> str:
+    baseline = report["backends"]["json"]
+    lines = [
+        f"{report['frames']:,} frames ({report['source']}), avg {report['avg_frame_bytes']} bytes, "
+        f"default backend: {report['default']}",
+        f"  {'backend':<10}{'parse us':>14}{'serialize us':>16}{'log event us':>16}{'log frame us':>16}",
+    ]
+    for name, result in report["backends"].items():
+        cells = []
+        for key, width in (("parse", 14), ("serialize", 16), ("log_event", 16), ("log_frame", 16)):
+            speedup = baseline[key] / result[key] if result[key] else 0
+            cells.append(f"{result[key]:.2f} ({speedup:.1f}x)".rjust(width))
+        lines.append(f"  {name:<10}{''.join(cells)}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--log", help="Recorded listener log to take frames from (default: generated)")
+    parser.add_argument("--frames", type=int, default=20_000, help="Frames per run (default: 20000)")
+    parser.add_argument("--mix", default="all", help="Generated event mix (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement, best kept (default: 5)")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if args.log:
+        frames, source = recorded_frames(args.log, args.frames), args.log
+    else:
+        frames, source = LoadGenerator(parse_mix(args.mix)).frames(args.frames), f"generated, mix {args.mix}"
+    if not frames:
+        raise SystemExit("No notification frames to benchmark")
+
+    report = {
+        "source": source,
+        "frames": len(frames),
+        "avg_frame_bytes": round(sum(len(frame.encode()) for frame in frames) / len(frames)),
+        "default": codec.BACKEND,
+        "backends": {
+            name: measure(name, frames, args.repeat)
+            for name in reversed(codec.BACKENDS)
+            if codec._load_backend(name) is not None
+        },
+    }
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Check that a flood of one event type does not delay the others.
+
+Feeds an EventSubListener a burst of chat-like events whose handler is slow,
+then one raid-like event, and measures how long the raid waits to be
+handled. Partitioned by type, the raid must not queue behind the chat
+backlog:
+
+1. block, with a burst the chat partition can hold;
+2. drop-oldest, with a burst ten times the queue size (the chat partition
+   discards its oldest events, the raid is never dropped);
+3. spill, with a burst the chat partition can hold.
+
+Usage:
+    poetry run python scripts/check_eventsub_flood.py
+"""
+
+import asyncio
+import sys
+import time
+from types import SimpleNamespace
+
+from twitch_mcp.eventsub.listener import EventSubListener
+
+CHAT = "test.chat"
+RAID = "test.raid"
+CHAT_HANDLER_SECONDS = 0.005
+# The chat backlog takes seconds to clear; the raid should not notice it
+MAX_RAID_LATENCY = 0.1
+
+
+async def flood(overflow: str, queue_size: int, burst: int) -> tuple[float, dict]:
+    """Raid latency in seconds and the listener's stats after one flood."""
+    fed_at: dict[str, float] = {}
+    handled_at: dict[str, float] = {}
+
+    async def handler(event_type: str, data: dict) -> None:
+        if event_type == CHAT:
+            await asyncio.sleep(CHAT_HANDLER_SECONDS)
+        else:
+            handled_at[event_type] = time.perf_counter()
+
+    listener = EventSubListener(
+        SimpleNamespace(http=None), handler=handler, workers=4, queue_size=queue_size, overflow=overflow
+    )
+
+    async def source() -> None:
+        for i in range(burst):
+            await listener.feed({"subscription": {"type": CHAT}, "event": {"seq": i}, "message_id": f"chat-{i}"})
+            # Frames arrive one at a time: let the router run between them
+            await asyncio.sleep(0)
+        fed_at[RAID] = time.perf_counter()
+        await listener.feed({"subscription": {"type": RAID}, "event": {}, "message_id": "raid"})
+
+    await listener.listen(source())
+    return handled_at[RAID] - fed_at[RAID], listener.stats()
+
+
+async def run() -> list[str]:
+    cases = {
+        "block": ("block", 1000, 900),
+        "drop-oldest": ("drop-oldest", 100, 1000),
+        "spill": ("spill", 1000, 900),
+    }
+    failures = []
+    for name, (overflow, queue_size, burst) in cases.items():
+        latency, stats = await flood(overflow, queue_size, burst)
+        print(
+            f"{name:<14}{burst} chat events, raid handled after {latency * 1000:.1f} ms, "
+            f"{stats['dispatch']['handled']} handled, {stats['dropped']} dropped"
+        )
+        if latency > MAX_RAID_LATENCY:
+            failures.append(f"{name}: raid waited {latency * 1000:.0f} ms behind the chat backlog")
+        if stats["dispatch"]["handled"] + stats["dropped"] != burst + 1:
+            failures.append(f"{name}: {burst + 1} events fed, {stats['dispatch']['handled']} handled, {stats['dropped']} dropped")
+    return failures
+
+
+def main():
+    failures = asyncio.run(run())
+    if failures:
+        print("FAILED:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print(f"OK: raids handled within {MAX_RAID_LATENCY * 1000:.0f} ms during a chat flood")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Check EventSub reconnect handling against a local mock websocket server.
+
+Runs an EventSubListener against a scripted mock of Twitch's EventSub
+websocket and verifies that no notification is lost or handled twice when:
+
+1. Twitch sends session_reconnect and keeps delivering on the old socket
+   until (and shortly after) the listener has opened the new one;
+2. the connection drops, the first reconnect attempt is refused, and the
+   listener must back off, reconnect and subscribe again.
+
+Usage:
+    poetry run python scripts/check_eventsub_reconnect.py
+"""
+
+import asyncio
+import json
+import sys
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import websockets
+
+from twitch_mcp.eventsub import websocket as eventsub_websocket
+from twitch_mcp.eventsub.listener import EventSubListener
+
+EVENT_TYPE = "test.notification"
+
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _message(message_type: str, payload: dict, message_id: str | None = None) -> str:
+    return json.dumps({
+        "metadata": {
+            "message_id": message_id or str(uuid.uuid4()),
+            "message_type": message_type,
+            "message_timestamp": _now(),
+        },
+        "payload": payload,
+    })
+
+
+class MockEventSub:
+    """Scripted EventSub websocket server plus the subscription endpoint."""
+
+    def __init__(self):
+        self.sockets: dict[str, object] = {}
+        self.connected = asyncio.Condition()
+        self.subscribe_calls = 0
+        self.refuse = 0
+        self.url = ""
+
+    async def serve(self) -> None:
+        self._server = await websockets.serve(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://127.0.0.1:{port}/ws"
+
+    async def _handle(self, ws) -> None:
+        if self.refuse:
+            self.refuse -= 1
+            await ws.close(code=1013)
+            return
+        session_id = f"session-{len(self.sockets) + 1}"
+        await ws.send(_message("session_welcome", {"session": {
+            "id": session_id,
+            "status": "connected",
+            "connected_at": _now(),
+            "keepalive_timeout_seconds": 10,
+            "reconnect_url": None,
+        }}))
+        async with self.connected:
+            self.sockets[session_id] = ws
+            self.connected.notify_all()
+        await ws.wait_closed()
+
+    async def wait_for_session(self, n: int) -> object:
+        async with self.connected:
+            await self.connected.wait_for(lambda: len(self.sockets) >= n)
+        return list(self.sockets.values())[n - 1]
+
+    async def notify(self, ws, i: int, message_id: str | None = None) -> None:
+        await ws.send(_message(
+            "notification",
+            {"subscription": {"type": EVENT_TYPE, "version": "1"}, "event": {"seq": i}},
+            message_id or f"msg-{i}",
+        ))
+
+    async def post(self, path: str, data: dict | None = None, **kwargs) -> dict:
+        """Stand-in for TwitchHTTPClient.post (Create EventSub Subscription)."""
+        self.subscribe_calls += 1
+        return {"data": [{
+            "id": str(uuid.uuid4()),
+            "status": "enabled",
+            "type": data["type"],
+            "version": data["version"],
+            "condition": data["condition"],
+            "created_at": _now(),
+            "transport": data["transport"],
+            "cost": 0,
+        }]}
+
+
+async def wait_until(predicate, timeout: float = 10.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        if asyncio.get_running_loop().time() > deadline:
+            raise TimeoutError("condition not reached")
+        await asyncio.sleep(0.01)
+
+
+async def run() -> list[str]:
+    eventsub_websocket.RECONNECT_BASE_DELAY = 0.05
+    eventsub_websocket.DRAIN_TIMEOUT = 0.3
+    server = MockEventSub()
+    await server.serve()
+
+    received: list[int] = []
+    listener = EventSubListener(
+        SimpleNamespace(http=server),
+        handler=lambda event_type, data: received.append(data["seq"]),
+        ws_url=server.url,
+    )
+    await listener.connect()
+    await listener.subscribe(EVENT_TYPE, "1", {"broadcaster_user_id": "1"})
+    listening = asyncio.create_task(listener.listen())
+
+    # 1. Migration: events keep arriving on the old socket around the switch
+    first = await server.wait_for_session(1)
+    for i in range(0, 50):
+        await server.notify(first, i)
+    await first.send(_message("session_reconnect", {"session": {
+        "id": "session-1",
+        "status": "reconnecting",
+        "reconnect_url": server.url + "?reconnect=1",
+        "keepalive_timeout_seconds": None,
+        "connected_at": _now(),
+    }}))
+    for i in range(50, 60):
+        await server.notify(first, i)
+    second = await server.wait_for_session(2)
+    for i in range(60, 65):
+        await server.notify(first, i)
+    await first.close(code=4004)
+    # Redelivery of an event already sent on the old session
+    await server.notify(second, 64)
+    for i in range(65, 100):
+        await server.notify(second, i)
+    await wait_until(lambda: len(received) >= 100)
+
+    # 2. Connection loss: refuse the first attempt, then accept
+    server.refuse = 1
+    await second.close(code=1011)
+    third = await server.wait_for_session(3)
+    await wait_until(lambda: server.subscribe_calls >= 2)
+    for i in range(100, 150):
+        await server.notify(third, i)
+    await wait_until(lambda: len(received) >= 150)
+
+    stats = listener.stats()
+    listening.cancel()
+    await asyncio.gather(listening, return_exceptions=True)
+    await listener.stop()
+    server._server.close()
+
+    failures = []
+    if received != list(range(150)):
+        missing = sorted(set(range(150)) - set(received))
+        failures.append(f"expected events 0-149 once and in order; missing {missing[:10]}, got {len(received)}")
+    checks = {
+        "duplicates dropped": (stats["dedup"]["duplicates"], 1),
+        "migrations": (stats["sessions"][0]["migrations"], 1),
+        "reconnects": (stats["sessions"][0]["reconnects"], 1),
+        "subscribe calls": (server.subscribe_calls, 2),
+    }
+    for name, (actual, expected) in checks.items():
+        print(f"{name:<20}{actual}")
+        if actual != expected:
+            failures.append(f"{name}: expected {expected}, got {actual}")
+    return failures
+
+
+def main():
+    failures = asyncio.run(run())
+    if failures:
+        print("FAILED:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("OK: 150 events, none lost or duplicated across a migration and a reconnect")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Check how EventSubListener spreads subscriptions over its sessions and merges them.
+
+Uses stand-in sessions (no network) and verifies that:
+
+1. subscriptions fill the room left on partly full sessions, never land
+   on a full one, and are skipped once every session is full;
+2. events from two sessions, one delivering 60 ms behind the other, are
+   handled in message_timestamp order, and an event older than the
+   reorder window is still handled and counted as late.
+
+Usage:
+    poetry run python scripts/check_eventsub_sessions.py
+"""
+
+import asyncio
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from twitch_mcp.eventsub.listener import EventSubListener
+from twitch_mcp.eventsub.websocket import MAX_SUBSCRIPTIONS_PER_SESSION
+
+
+def subscriptions(n: int) -> list[dict]:
+    return [{"type": "channel.follow", "version": "2", "condition": {"broadcaster_user_id": str(i)}} for i in range(n)]
+
+
+async def placement(counts: list[int], n: int) -> tuple[list[int], int]:
+    """Subscriptions placed per session, and how many did not fit."""
+    listener = EventSubListener(SimpleNamespace(http=None), max_sessions=len(counts))
+    listener._sessions = [SimpleNamespace(subscription_count=count) for count in counts]
+    placed, unplaced = await listener._place(subscriptions(n))
+    per_session = [sum(sub["session"] is session for sub in placed) for session in listener._sessions]
+    return per_session, len(unplaced)
+
+
+class FakeSession:
+    """Session delivering events at given times after it starts reading."""
+
+    def __init__(self, deliveries: list[tuple[float, dict]]):
+        self.deliveries = deliveries
+
+    async def frames(self):
+        started = asyncio.get_running_loop().time()
+        for at, event in self.deliveries:
+            await asyncio.sleep(max(0.0, started + at - asyncio.get_running_loop().time()))
+            yield event, None
+
+
+def event(seq: int, base: datetime) -> dict:
+    return {
+        "subscription": {"type": "test.notification", "version": "1"},
+        "event": {"seq": seq},
+        "message_id": f"msg-{seq}",
+        "message_timestamp": (base + timedelta(milliseconds=10 * seq)).isoformat().replace("+00:00", "Z"),
+    }
+
+
+async def merge() -> tuple[list[int], dict]:
+    """Handled sequence numbers and reorder stats for two skewed sessions."""
+    base = datetime.now(timezone.utc)
+    received: list[int] = []
+
+    def handler(event_type: str, data: dict) -> None:
+        received.append(data["seq"])
+
+    listener = EventSubListener(SimpleNamespace(http=None), handler=handler, workers=1)
+    fast = FakeSession([(0.01 * seq, event(seq, base)) for seq in range(0, 40, 2)])
+    # 60 ms behind, then one event from before all others, 0.6 s late
+    slow = FakeSession([(0.01 * seq + 0.06, event(seq, base)) for seq in range(1, 40, 2)] + [(0.9, event(-1, base))])
+    listener._sessions = [fast, slow]
+    listener._ws = fast
+    await listener.listen()
+    return received, listener.reorder.stats()
+
+
+async def run() -> list[str]:
+    full = MAX_SUBSCRIPTIONS_PER_SESSION
+    cases = {
+        "full, empty": ([full, 0], 5, ([0, 5], 0)),
+        "partly full, full, empty": ([full - 2, full, 0], 5, ([2, 0, 3], 0)),
+        "over capacity": ([full - 1, full], 3, ([1, 0], 2)),
+    }
+    failures = []
+    for name, (counts, n, expected) in cases.items():
+        actual = await placement(counts, n)
+        print(f"{name:<28}{actual[0]} placed, {actual[1]} skipped")
+        if actual != expected:
+            failures.append(f"{name}: expected {expected}, got {actual}")
+
+    received, stats = await merge()
+    print(f"{'merged in order':<28}{received[:40] == list(range(40))}")
+    print(f"{'reordered, late':<28}{stats['reordered']}, {stats['late']}")
+    if received[:40] != list(range(40)):
+        failures.append(f"merge: expected events 0-39 in order, got {received[:40]}")
+    if received[40:] != [-1] or stats["late"] != 1:
+        failures.append(f"late event: expected it handled and counted once, got {received[40:]}, {stats['late']} late")
+    return failures
+
+
+def main():
+    failures = asyncio.run(run())
+    if failures:
+        print("FAILED:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("OK: subscriptions packed into free room only, sessions merged in timestamp order")
+
+
+if __name__ == "__main__":
+    main()
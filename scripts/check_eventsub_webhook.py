@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""Check the EventSub webhook receiver with locally signed messages.
+
+Starts a WebhookReceiver feeding an EventSubListener and sends it messages
+signed like Twitch's, over keep-alive connections:
+
+1. a webhook_callback_verification, which must be answered with the challenge;
+2. notifications with bad signatures, stale or future timestamps, a
+   non-object body, a wrong path and a redelivered message ID, which must
+   be rejected or dropped;
+3. a revocation;
+4. a burst of notifications from many concurrent connections, reporting
+   requests per second and checking every one was handled exactly once.
+
+Usage:
+    poetry run python scripts/check_eventsub_webhook.py [--requests 20000] [--connections 50]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from twitch_mcp.eventsub.listener import EventSubListener
+from twitch_mcp.eventsub.webhook import WebhookReceiver, sign
+
+SECRET = "local-check-secret-0123456789"
+EVENT_TYPE = "test.notification"
+
+
+def _timestamp(age: timedelta = timedelta()) -> str:
+    # Nanosecond precision, like Twitch
+    return (datetime.now(timezone.utc) - age).strftime("%Y-%m-%dT%H:%M:%S.%f") + "123Z"
+
+
+def signed_request(
+    message_type: str,
+    payload: dict,
+    message_id: str | None = None,
+    secret: str = SECRET,
+    age: timedelta = timedelta(),
+    path: str = "/",
+    body: bytes | None = None,
+) -> bytes:
+    """Build an HTTP request as Twitch would send it (body overrides the payload's JSON)."""
+    body = json.dumps(payload).encode() if body is None else body
+    message_id = message_id or str(uuid.uuid4())
+    timestamp = _timestamp(age)
+    headers = {
+        "Host": "localhost",
+        "Content-Type": "application/json",
+        "Content-Length": str(len(body)),
+        "Twitch-Eventsub-Message-Id": message_id,
+        "Twitch-Eventsub-Message-Retry": "0",
+        "Twitch-Eventsub-Message-Type": message_type,
+        "Twitch-Eventsub-Message-Signature": sign(secret, message_id, timestamp, body),
+        "Twitch-Eventsub-Message-Timestamp": timestamp,
+        "Twitch-Eventsub-Subscription-Type": payload["subscription"]["type"],
+        "Twitch-Eventsub-Subscription-Version": "1",
+    }
+    head = f"POST {path} HTTP/1.1\r\n" + "".join(f"{k}: {v}\r\n" for k, v in headers.items()) + "\r\n"
+    return head.encode() + body
+
+
+def notification(seq: int) -> dict:
+    return {
+        "subscription": {"id": "sub-1", "type": EVENT_TYPE, "version": "1", "status": "enabled"},
+        "event": {"seq": seq},
+    }
+
+
+class Client:
+    """One keep-alive connection sending requests sequentially."""
+
+    def __init__(self, port: int):
+        self.port = port
+
+    async def open(self) -> "Client":
+        self.reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+        return self
+
+    async def send(self, request: bytes) -> tuple[int, bytes]:
+        self.writer.write(request)
+        head = await self.reader.readuntil(b"\r\n\r\n")
+        lines = head.decode("latin-1").split("\r\n")
+        length = next(int(line.split(":")[1]) for line in lines if line.lower().startswith("content-length"))
+        body = await self.reader.readexactly(length) if length else b""
+        return int(lines[0].split(" ")[1]), body
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+async def run(requests: int, connections: int) -> list[str]:
+    received: list[int] = []
+    revoked: list[dict] = []
+
+    def handler(event_type: str, data: dict) -> None:
+        received.append(data["seq"])
+
+    listener = EventSubListener(SimpleNamespace(http=None), handler=handler, queue_size=10_000)
+    original = listener._handle_event
+
+    async def handle_event(event: dict, timestamp: str | None = None, frame: str | None = None) -> None:
+        if "revocation" in event:
+            revoked.append(event)
+            return
+        await original(event, timestamp, frame)
+
+    listener._handle_event = handle_event
+    receiver = WebhookReceiver(listener, SECRET, port=0)
+    port = await receiver.start()
+    listening = asyncio.create_task(listener.listen(receiver.serve()))
+
+    failures = []
+    client = await Client(port).open()
+
+    def expect(name: str, actual, expected) -> None:
+        print(f"{name:<28}{actual}")
+        if actual != expected:
+            failures.append(f"{name}: expected {expected}, got {actual}")
+
+    # 1. Challenge
+    challenge = {"challenge": "pogchamp-kappa-360noscope-vohiyo", **notification(0)}
+    status, body = await client.send(signed_request("webhook_callback_verification", challenge))
+    expect("challenge", (status, body), (200, challenge["challenge"].encode()))
+
+    # 2. Rejections and redelivery (all on the same keep-alive connection)
+    expect("bad signature", (await client.send(signed_request("notification", notification(0), secret="wrong-secret-0000")))[0], 403)
+    expect("stale timestamp", (await client.send(signed_request("notification", notification(0), age=timedelta(minutes=11))))[0], 403)
+    expect("future timestamp", (await client.send(signed_request("notification", notification(0), age=-timedelta(minutes=11))))[0], 403)
+    expect("non-object body", (await client.send(signed_request("notification", notification(0), body=b"[1, 2]")))[0], 400)
+    expect("wrong path", (await client.send(signed_request("notification", notification(0), path="/other")))[0], 404)
+    expect("notification", (await client.send(signed_request("notification", notification(0), message_id="msg-0")))[0], 204)
+    expect("redelivery", (await client.send(signed_request("notification", notification(0), message_id="msg-0")))[0], 204)
+
+    # 3. Revocation
+    revocation = {"subscription": {**notification(0)["subscription"], "status": "authorization_revoked"}}
+    expect("revocation", (await client.send(signed_request("revocation", revocation)))[0], 204)
+    client.close()
+
+    # 4. Burst over keep-alive connections (requests signed up front)
+    batches = [
+        [signed_request("notification", notification(i)) for i in range(c + 1, requests + 1, connections)]
+        for c in range(connections)
+    ]
+    clients = [await Client(port).open() for _ in range(connections)]
+
+    async def send_all(client: Client, batch: list[bytes]) -> list[int]:
+        return [(await client.send(request))[0] for request in batch]
+
+    started = time.perf_counter()
+    statuses = await asyncio.gather(*(send_all(c, b) for c, b in zip(clients, batches)))
+    elapsed = time.perf_counter() - started
+    await listener.queue.join()
+    for c in clients:
+        c.close()
+    print(f"{'burst':<28}{requests} requests in {elapsed:.2f}s ({requests / elapsed:,.0f} req/s, {connections} connections)")
+    expect("burst non-204 responses", sum(s != 204 for batch in statuses for s in batch), 0)
+
+    listening.cancel()
+    await asyncio.gather(listening, return_exceptions=True)
+    await listener.stop()
+
+    expect("handled once, all", sorted(received) == list(range(requests + 1)), True)
+    expect("revocations handled", len(revoked), 1)
+    expect("rejected", receiver.rejected, 3)
+    expect("duplicates", receiver.duplicates, 1)
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=20_000)
+    parser.add_argument("--connections", type=int, default=50)
+    args = parser.parse_args()
+
+    failures = asyncio.run(run(args.requests, args.connections))
+    if failures:
+        print("FAILED:\n  " + "\n  ".join(failures))
+        sys.exit(1)
+    print("OK: challenge answered, forged and stale messages rejected, redelivery dropped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Generate the static tool manifest used by the lazy tool registry.
+
+Imports every module in twitch_mcp.tools, collects get_tools() and writes
+src/twitch_mcp/tools/manifest.py. User ID fields get a ``*_login``
+alternative (see twitch_mcp.logins), recorded under the entry's "logins"
+key, and every tool gets the ``output``/``fields`` arguments (see
+twitch_mcp.output). Run with --check to verify the committed manifest is
+up to date (exits 1 if it is stale).
+"""
+
+import argparse
+import importlib
+import sys
+from pathlib import Path
+
+from twitch_mcp.logins import add_login_alternatives
+from twitch_mcp.output import add_output_properties
+from twitch_mcp.tools import __all__ as TOOL_MODULES
+
+MANIFEST_PATH = Path(__file__).resolve().parent.parent / "src" / "twitch_mcp" / "tools" / "manifest.py"
+
+HEADER = '''"""Static tool manifest: name -> module, description and inputSchema.
+
+Generated by scripts/generate_tool_manifest.py - do not edit by hand.
+"""
+
+'''
+
+
+def build_manifest() -> dict[str, dict]:
+    """Collect tool definitions from every tool module."""
+    manifest: dict[str, dict] = {}
+    for module_name in TOOL_MODULES:
+        module = importlib.import_module(f"twitch_mcp.tools.{module_name}")
+        for tool in module.get_tools():
+            if tool.name in manifest:
+                raise ValueError(f"Duplicate tool name: {tool.name}")
+            schema, logins = add_login_alternatives(add_output_properties(tool.inputSchema))
+            manifest[tool.name] = {
+                "module": module_name,
+                "description": tool.description,
+                "inputSchema": schema,
+            }
+            if logins:
+                manifest[tool.name]["logins"] = logins
+    return manifest
+
+
+def _render(value, indent: int = 0) -> str:
+    """Render a JSON-compatible value as a Python literal, one key per line."""
+    pad = "    " * (indent + 1)
+    if isinstance(value, dict):
+        if not value:
+            return "{}"
+        items = [f"{pad}{key!r}: {_render(item, indent + 1)}," for key, item in value.items()]
+        return "{\n" + "\n".join(items) + "\n" + "    " * indent + "}"
+    if isinstance(value, list):
+        if all(isinstance(item, str) for item in value):
+            return repr(value)
+        items = [f"{pad}{_render(item, indent + 1)}," for item in value]
+        return "[\n" + "\n".join(items) + "\n" + "    " * indent + "]"
+    return repr(value)
+
+
+def render_manifest(manifest: dict[str, dict]) -> str:
+    """Render the manifest as a Python module."""
+    return f"{HEADER}TOOL_MANIFEST: dict[str, dict] = {_render(manifest)}\n"
+
+
+def main():
+    """Entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="Fail if the manifest is out of date")
+    args = parser.parse_args()
+
+    rendered = render_manifest(build_manifest())
+
+    if args.check:
+        current = MANIFEST_PATH.read_text() if MANIFEST_PATH.exists() else ""
+        if current != rendered:
+            print(f"{MANIFEST_PATH} is out of date; run scripts/generate_tool_manifest.py", file=sys.stderr)
+            sys.exit(1)
+        print("Tool manifest is up to date")
+        return
+
+    MANIFEST_PATH.write_text(rendered)
+    print(f"Wrote {MANIFEST_PATH}")
+
+
+if __name__ == "__main__":
+    main()
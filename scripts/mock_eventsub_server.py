@@ -0,0 +1,440 @@
+#!/usr/bin/env python3
+"""Mock EventSub websocket server and synthetic load generator.
+
+Speaks the EventSub websocket protocol (session_welcome, keepalives,
+notifications) and streams realistic notification payloads for every event
+type with a built-in handler in twitch_mcp/eventsub/handlers.py, at a
+configurable rate and mix, to every connected session.
+
+Point a listener at it with --ws-url. Subscriptions are not needed (and
+creating them against Twitch will fail for the mock session); events are
+sent to every session regardless:
+
+    python scripts/mock_eventsub_server.py --port 8765 --rate 2000 --mix stream
+    eventsub-listen --ws-url ws://127.0.0.1:8765/ws
+
+Mixes are a preset (see MIXES) or "type=weight,..." with full event types
+or their short names (chat, follow, cheer, ...). --rate 0 sends as fast as
+the client reads.
+
+Usage:
+    python scripts/mock_eventsub_server.py [--port 0] [--rate 1000] [--mix stream] [--duration 0]
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import sys
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import websockets
+
+BROADCASTER = {"broadcaster_user_id": "1234", "broadcaster_user_login": "streamer", "broadcaster_user_name": "Streamer"}
+WORDS = "PogChamp LUL Kappa gg hype lets go monkaS KEKW this stream is great nice play clip it W".split()
+TIERS = ("1000", "1000", "1000", "2000", "3000")
+# Distinct payloads pre-serialized per event type
+VARIANTS = 64
+
+
+def _user(rng: random.Random, prefix: str = "user") -> dict:
+    n = rng.randrange(1, 200_000)
+    return {f"{prefix}_id": str(10_000_000 + n), f"{prefix}_login": f"viewer{n}", f"{prefix}_name": f"Viewer{n}"}
+
+
+def _text(rng: random.Random, words: int = 8) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(rng.randrange(1, words + 1)))
+
+
+def _now(offset: float = 0) -> str:
+    return (datetime.now(timezone.utc) + timedelta(seconds=offset)).isoformat().replace("+00:00", "Z")
+
+
+def chat_message(rng: random.Random) -> dict:
+    chatter = _user(rng, "chatter_user")
+    text = _text(rng, 15)
+    badges = rng.sample([
+        {"set_id": "subscriber", "id": "12", "info": "16"},
+        {"set_id": "moderator", "id": "1", "info": ""},
+        {"set_id": "vip", "id": "1", "info": ""},
+        {"set_id": "sub-gifter", "id": "5", "info": ""},
+    ], rng.randrange(0, 3))
+    return {
+        **BROADCASTER, **chatter,
+        "message_id": str(uuid.UUID(int=rng.getrandbits(128))),
+        "message": {"text": text, "fragments": [{"type": "text", "text": text, "cheermote": None, "emote": None, "mention": None}]},
+        "color": rng.choice(["#FF4500", "#1E90FF", "#9ACD32", ""]),
+        "badges": badges,
+        "message_type": "text",
+        "cheer": None,
+        "reply": None,
+        "channel_points_custom_reward_id": None,
+    }
+
+
+def follow(rng: random.Random) -> dict:
+    return {**_user(rng), **BROADCASTER, "followed_at": _now()}
+
+
+def subscribe(rng: random.Random) -> dict:
+    return {**_user(rng), **BROADCASTER, "tier": rng.choice(TIERS), "is_gift": rng.random() < 0.3}
+
+
+def subscription_gift(rng: random.Random) -> dict:
+    anonymous = rng.random() < 0.1
+    return {
+        **({"user_id": None, "user_login": None, "user_name": None} if anonymous else _user(rng)),
+        **BROADCASTER,
+        "total": rng.choice([1, 1, 5, 10, 20, 50]),
+        "tier": rng.choice(TIERS),
+        "cumulative_total": None if anonymous else rng.randrange(1, 500),
+        "is_anonymous": anonymous,
+    }
+
+
+def subscription_message(rng: random.Random) -> dict:
+    text = _text(rng)
+    return {
+        **_user(rng), **BROADCASTER,
+        "tier": rng.choice(TIERS),
+        "message": {"text": text, "emotes": [{"begin": 0, "end": 7, "id": "305954156"}] if text.startswith("PogChamp") else []},
+        "cumulative_months": rng.randrange(2, 80),
+        "streak_months": rng.choice([None, rng.randrange(1, 24)]),
+        "duration_months": 1,
+    }
+
+
+def cheer(rng: random.Random) -> dict:
+    bits = rng.choice([1, 100, 100, 500, 1000, 5000])
+    anonymous = rng.random() < 0.05
+    return {
+        "is_anonymous": anonymous,
+        **({"user_id": None, "user_login": None, "user_name": None} if anonymous else _user(rng)),
+        **BROADCASTER,
+        "message": f"Cheer{bits} {_text(rng)}",
+        "bits": bits,
+    }
+
+
+def raid(rng: random.Random) -> dict:
+    raider = _user(rng, "from_broadcaster_user")
+    return {
+        **raider,
+        "to_broadcaster_user_id": "1234", "to_broadcaster_user_login": "streamer", "to_broadcaster_user_name": "Streamer",
+        "viewers": rng.randrange(1, 5000),
+    }
+
+
+def _choices(rng: random.Random, votes: bool) -> list[dict]:
+    return [
+        {"id": str(uuid.UUID(int=rng.getrandbits(128))), "title": title,
+         **({"votes": rng.randrange(0, 1000), "channel_points_votes": rng.randrange(0, 100), "bits_votes": 0} if votes else {})}
+        for title in rng.sample(["Yes", "No", "Maybe", "Next game", "One more run"], rng.randrange(2, 5))
+    ]
+
+
+def poll_begin(rng: random.Random) -> dict:
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))), **BROADCASTER,
+        "title": rng.choice(["Which boss next?", "Should I speedrun?", "Pick the map"]),
+        "choices": _choices(rng, votes=False),
+        "bits_voting": {"is_enabled": False, "amount_per_vote": 0},
+        "channel_points_voting": {"is_enabled": True, "amount_per_vote": 10},
+        "started_at": _now(), "ends_at": _now(120),
+    }
+
+
+def poll_end(rng: random.Random) -> dict:
+    return {**poll_begin(rng), "choices": _choices(rng, votes=True), "status": rng.choice(["completed", "terminated"]), "ended_at": _now()}
+
+
+def _outcomes(rng: random.Random) -> list[dict]:
+    return [
+        {"id": str(uuid.UUID(int=rng.getrandbits(128))), "title": title, "color": color,
+         "users": rng.randrange(0, 500), "channel_points": rng.randrange(0, 500_000), "top_predictors": []}
+        for title, color in (("Win", "blue"), ("Lose", "pink"))
+    ]
+
+
+def prediction_begin(rng: random.Random) -> dict:
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))), **BROADCASTER,
+        "title": rng.choice(["Will we beat the boss?", "Top 3 this round?"]),
+        "outcomes": _outcomes(rng), "started_at": _now(), "locks_at": _now(300),
+    }
+
+
+def prediction_end(rng: random.Random) -> dict:
+    data = prediction_begin(rng)
+    return {**data, "winning_outcome_id": data["outcomes"][rng.randrange(2)]["id"], "status": "resolved", "ended_at": _now()}
+
+
+def _contribution(rng: random.Random) -> dict:
+    return {**_user(rng), "type": rng.choice(["bits", "subscription", "other"]), "total": rng.randrange(100, 2000)}
+
+
+def hype_train_begin(rng: random.Random) -> dict:
+    return {
+        "id": str(uuid.UUID(int=rng.getrandbits(128))), **BROADCASTER,
+        "total": 137, "progress": 137, "goal": 500, "level": 1,
+        "top_contributions": [_contribution(rng)], "last_contribution": _contribution(rng),
+        "started_at": _now(), "expires_at": _now(300),
+    }
+
+
+def hype_train_progress(rng: random.Random) -> dict:
+    level = rng.randrange(1, 6)
+    goal = 500 * level
+    return {
+        **hype_train_begin(rng), "level": level, "goal": goal,
+        "progress": rng.randrange(0, goal), "total": rng.randrange(goal, goal * 3),
+        "top_contributions": [_contribution(rng) for _ in range(2)],
+    }
+
+
+def hype_train_end(rng: random.Random) -> dict:
+    data = hype_train_progress(rng)
+    for key in ("progress", "goal", "last_contribution", "expires_at"):
+        data.pop(key)
+    return {**data, "ended_at": _now(), "cooldown_ends_at": _now(3600)}
+
+
+def stream_online(rng: random.Random) -> dict:
+    return {"id": str(rng.randrange(10**10, 10**11)), **BROADCASTER, "type": "live", "started_at": _now()}
+
+
+def stream_offline(rng: random.Random) -> dict:
+    return dict(BROADCASTER)
+
+
+def _moderator(rng: random.Random) -> dict:
+    return {"moderator_user_id": "4321", "moderator_user_login": "modperson", "moderator_user_name": "ModPerson"}
+
+
+def ban(rng: random.Random) -> dict:
+    permanent = rng.random() < 0.3
+    return {
+        **_user(rng), **BROADCASTER, **_moderator(rng),
+        "reason": rng.choice(["spam", "", "rude", "bot"]),
+        "banned_at": _now(), "ends_at": None if permanent else _now(600), "is_permanent": permanent,
+    }
+
+
+def unban(rng: random.Random) -> dict:
+    return {**_user(rng), **BROADCASTER, **_moderator(rng)}
+
+
+def moderator_change(rng: random.Random) -> dict:
+    return {**BROADCASTER, **_user(rng)}
+
+
+# Event type -> (short name, subscription version, payload factory)
+PAYLOADS = {
+    "channel.chat.message": ("chat", "1", chat_message),
+    "channel.follow": ("follow", "2", follow),
+    "channel.subscribe": ("sub", "1", subscribe),
+    "channel.subscription.gift": ("gift", "1", subscription_gift),
+    "channel.subscription.message": ("resub", "1", subscription_message),
+    "channel.cheer": ("cheer", "1", cheer),
+    "channel.raid": ("raid", "1", raid),
+    "channel.poll.begin": ("poll_begin", "1", poll_begin),
+    "channel.poll.end": ("poll_end", "1", poll_end),
+    "channel.prediction.begin": ("prediction_begin", "1", prediction_begin),
+    "channel.prediction.end": ("prediction_end", "1", prediction_end),
+    "channel.hype_train.begin": ("hype_begin", "1", hype_train_begin),
+    "channel.hype_train.progress": ("hype_progress", "1", hype_train_progress),
+    "channel.hype_train.end": ("hype_end", "1", hype_train_end),
+    "stream.online": ("online", "1", stream_online),
+    "stream.offline": ("offline", "1", stream_offline),
+    "channel.ban": ("ban", "1", ban),
+    "channel.unban": ("unban", "1", unban),
+    "channel.moderator.add": ("mod_add", "1", moderator_change),
+    "channel.moderator.remove": ("mod_remove", "1", moderator_change),
+}
+SHORT_NAMES = {short: event_type for event_type, (short, _, _) in PAYLOADS.items()}
+
+MIXES = {
+    # A busy channel: mostly chat, a steady trickle of everything else
+    "stream": "chat=90,follow=3,sub=1.5,resub=1,gift=0.5,cheer=2,raid=0.1,ban=0.5,unban=0.1,"
+              "poll_begin=0.05,poll_end=0.05,prediction_begin=0.05,prediction_end=0.05",
+    # A hype train: chat plus a flood of subs, gifts and bits
+    "hype": "chat=60,sub=10,resub=8,gift=6,cheer=10,hype_begin=0.2,hype_progress=5,hype_end=0.2,follow=0.6",
+    "chat": "chat=1",
+    # Every handled type equally often
+    "all": ",".join(f"{short}=1" for short, _, _ in PAYLOADS.values()),
+}
+
+
+def parse_mix(spec: str) -> dict[str, float]:
+    """Turn a preset name or "type=weight,..." into {event type: weight}."""
+    spec = MIXES.get(spec, spec)
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.strip().partition("=")
+        event_type = SHORT_NAMES.get(name, name)
+        if event_type not in PAYLOADS:
+            raise ValueError(f"unknown event type {name!r}; known: {', '.join(SHORT_NAMES)}")
+        mix[event_type] = float(weight or 1)
+    return mix
+
+
+class LoadGenerator:
+    """Produces notification frames in the configured mix.
+
+    Payloads are generated and serialized once (VARIANTS per type); each
+    frame only formats a fresh message ID and timestamp around one, so the
+    generator is not the bottleneck of a benchmark.
+    """
+
+    def __init__(self, mix: dict[str, float], seed: int = 1):
+        rng = random.Random(seed)
+        self._rng = rng
+        self._types = list(mix)
+        self._cum_weights = list(itertools.accumulate(mix.values()))
+        self._payloads = {}
+        for event_type in self._types:
+            _, version, factory = PAYLOADS[event_type]
+            subscription = json.dumps({
+                "id": str(uuid.UUID(int=rng.getrandbits(128))), "status": "enabled", "type": event_type,
+                "version": version, "cost": 0, "condition": {"broadcaster_user_id": "1234"},
+                "transport": {"method": "websocket", "session_id": "mock"}, "created_at": _now(),
+            })
+            self._payloads[event_type] = (version, [
+                f'{{"subscription":{subscription},"event":{json.dumps(factory(rng))}}}' for _ in range(VARIANTS)
+            ])
+        self._ids = itertools.count(1)
+
+    def frames(self, n: int) -> list[str]:
+        """Build the next n notification frames."""
+        timestamp = _now()
+        types = self._rng.choices(self._types, cum_weights=self._cum_weights, k=n)
+        frames = []
+        for event_type in types:
+            version, payloads = self._payloads[event_type]
+            frames.append(
+                '{"metadata":{"message_id":"mock-%d","message_type":"notification","message_timestamp":"%s",'
+                '"subscription_type":"%s","subscription_version":"%s"},"payload":%s}'
+                % (next(self._ids), timestamp, event_type, version, self._rng.choice(payloads))
+            )
+        return frames
+
+
+def _control(message_type: str, payload: dict) -> str:
+    return json.dumps({
+        "metadata": {"message_id": str(uuid.uuid4()), "message_type": message_type, "message_timestamp": _now()},
+        "payload": payload,
+    })
+
+
+class MockEventSubServer:
+    """EventSub websocket mock streaming generated notifications to each session."""
+
+    def __init__(
+        self,
+        mix: dict[str, float],
+        rate: float = 1000,
+        duration: float = 0,
+        keepalive: int = 10,
+        seed: int = 1,
+    ):
+        """Initialize the server.
+
+        Args:
+            mix: Event type -> relative weight
+            rate: Events per second per session (0: as fast as the client reads)
+            duration: Seconds to stream per session (0: until disconnected)
+            keepalive: keepalive_timeout_seconds announced in the welcome
+            seed: Random seed for payload generation
+        """
+        self.mix = mix
+        self.rate = rate
+        self.duration = duration
+        self.keepalive = keepalive
+        self.seed = seed
+        self.sent = 0
+        self.sessions = 0
+        self.url = ""
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start listening; returns the websocket URL."""
+        self._server = await websockets.serve(self._handle, host, port, max_queue=None, compression=None)
+        port = self._server.sockets[0].getsockname()[1]
+        self.url = f"ws://{host}:{port}/ws"
+        return self.url
+
+    async def close(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, ws) -> None:
+        self.sessions += 1
+        await ws.send(_control("session_welcome", {"session": {
+            "id": f"mock-session-{self.sessions}", "status": "connected", "connected_at": _now(),
+            "keepalive_timeout_seconds": self.keepalive, "reconnect_url": None,
+        }}))
+        generator = LoadGenerator(self.mix, self.seed + self.sessions)
+        try:
+            await self._stream(ws, generator)
+            await ws.wait_closed()
+        except websockets.ConnectionClosed:
+            pass
+
+    async def _stream(self, ws, generator: LoadGenerator) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        # Send in 10 ms ticks; unlimited rate sends fixed batches back to back
+        batch = max(1, round(self.rate * 0.01)) if self.rate else 100
+        sent = 0
+        while not self.duration or loop.time() - started < self.duration:
+            for frame in generator.frames(batch):
+                await ws.send(frame)
+            sent += batch
+            self.sent += batch
+            if self.rate:
+                due = started + sent / self.rate
+                # Low rates: keep the session alive while waiting
+                while (delay := due - loop.time()) > 0:
+                    await asyncio.sleep(min(delay, self.keepalive / 2))
+                    if loop.time() < due:
+                        await ws.send(_control("session_keepalive", {}))
+
+
+async def serve(args) -> None:
+    server = MockEventSubServer(parse_mix(args.mix), args.rate, args.duration, seed=args.seed)
+    url = await server.start(args.host, args.port)
+    # First line is machine-readable for scripts starting the server
+    print(url, flush=True)
+    print(f"Streaming mix {args.mix!r} at {args.rate or 'unlimited'} events/s per session", file=sys.stderr)
+    try:
+        await asyncio.Future()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mock EventSub websocket server and load generator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="Port (default: pick a free one and print the URL)")
+    parser.add_argument("--rate", type=float, default=1000, help="Events/s per session; 0 sends as fast as read")
+    parser.add_argument(
+        "--mix",
+        default="stream",
+        help=f"Preset ({', '.join(MIXES)}) or type=weight,... (default: stream)",
+    )
+    parser.add_argument("--duration", type=float, default=0, help="Seconds to stream per session (0: forever)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    try:
+        parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -2,13 +2,14 @@
 """AI-powered Twitch EventSub listener for live streams."""
 
 import asyncio
-import json
 import random
 import sys
 from datetime import datetime
 
 import websockets
 
+from twitch_mcp.codec import loads
+
 # Configuration
 MOCK_WS_URL = "ws://127.0.0.1:8765/ws"
 REAL_WS_URL = "wss://eventsub.wss.twitch.tv/ws"
@@ -212,7 +213,7 @@ async def listen_to_events(ws_url: str):
         async with websockets.connect(ws_url) as ws:
             # Wait for welcome
             raw = await asyncio.wait_for(ws.recv(), timeout=10)
-            msg = json.loads(raw)
+            msg = loads(raw)
             session_id = msg.get("payload", {}).get("session", {}).get("id")
             print(f"Connected! Session: {session_id}", flush=True)
             print("-" * 60, flush=True)
@@ -222,7 +223,7 @@ async def listen_to_events(ws_url: str):
             while True:
                 try:
                     raw = await ws.recv()
-                    message = json.loads(raw)
+                    message = loads(raw)
 
                     msg_type = message.get("metadata", {}).get("message_type")
 
@@ -240,7 +241,7 @@ async def listen_to_events(ws_url: str):
                             print(f"  AI: {ai_response}", flush=True)
                         print("", flush=True)
 
-                except json.JSONDecodeError:
+                except ValueError:
                     continue
 
     except ConnectionRefusedError:
@@ -0,0 +1,205 @@
+"""TTL + LRU response cache for read-only tools.
+
+Results of cacheable read tools are kept for a per-tool TTL, keyed on the
+tool name plus normalized arguments. The cache is bounded by the total size
+of the cached text and evicts least recently used entries first. Running a
+write tool invalidates the reads it affects, e.g. twitch_modify_channel_info
+drops cached twitch_get_channel_info results for that broadcaster.
+
+The size bound is read from TWITCH_MCP_CACHE_MAX_BYTES (default 4 MiB,
+0 disables caching).
+"""
+
+import json
+import os
+import time
+from collections import OrderedDict
+from typing import Any
+
+from mcp.types import TextContent
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+
+# Cacheable read tools and their TTL in seconds
+CACHE_TTLS: dict[str, float] = {
+    "twitch_get_automod_settings": 30,
+    "twitch_get_channel_emotes": 600,
+    "twitch_get_channel_info": 30,
+    "twitch_get_channel_teams": 600,
+    "twitch_get_chat_settings": 30,
+    "twitch_get_cheermotes": 600,
+    "twitch_get_custom_rewards": 30,
+    "twitch_get_games": 3600,
+    "twitch_get_teams": 600,
+    "twitch_get_top_games": 60,
+    "twitch_get_users": 300,
+}
+
+# Write tools and the cached reads they make stale
+INVALIDATED_BY: dict[str, tuple[str, ...]] = {
+    "twitch_create_custom_reward": ("twitch_get_custom_rewards",),
+    "twitch_delete_custom_reward": ("twitch_get_custom_rewards",),
+    "twitch_modify_channel_info": ("twitch_get_channel_info",),
+    "twitch_update_automod_settings": ("twitch_get_automod_settings",),
+    "twitch_update_chat_settings": ("twitch_get_chat_settings",),
+    "twitch_update_custom_reward": ("twitch_get_custom_rewards",),
+    "twitch_update_user": ("twitch_get_users",),
+}
+
+
+def make_key(name: str, arguments: dict) -> str:
+    """Build a cache key from a tool name and its arguments.
+
+    None values are dropped and keys sorted, so equivalent calls share a key.
+    """
+    normalized = {k: v for k, v in arguments.items() if v is not None}
+    return name + ":" + json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+
+
+def _concerns(value: Any, broadcaster_id: str) -> bool:
+    """Check whether a cached call's broadcaster_id argument covers a broadcaster."""
+    if value is None:
+        return True
+    if isinstance(value, list):
+        return broadcaster_id in value
+    return value == broadcaster_id
+
+
+def _result_size(result: list[Any]) -> int:
+    return sum(len(item.text) for item in result if isinstance(item, TextContent))
+
+
+class _Entry:
+    __slots__ = ("name", "arguments", "result", "expires_at", "size")
+
+    def __init__(self, name: str, arguments: dict, result: list, expires_at: float, size: int):
+        self.name = name
+        self.arguments = arguments
+        self.result = result
+        self.expires_at = expires_at
+        self.size = size
+
+
+class ResponseCache:
+    """Size-bounded LRU cache with per-tool TTLs and write invalidation."""
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttls: dict[str, float] | None = None,
+        invalidated_by: dict[str, tuple[str, ...]] | None = None,
+    ):
+        """Initialize the cache.
+
+        Args:
+            max_bytes: Maximum total size of cached text (0 disables caching)
+            ttls: Cacheable tool name -> TTL in seconds
+            invalidated_by: Write tool name -> read tools it invalidates
+        """
+        self.max_bytes = max_bytes
+        self.ttls = CACHE_TTLS if ttls is None else ttls
+        self.invalidated_by = INVALIDATED_BY if invalidated_by is None else invalidated_by
+        self._entries: OrderedDict[str, _Entry] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._tool_counts: dict[str, list[int]] = {}
+
+    def is_cacheable(self, name: str) -> bool:
+        """Check whether a tool's results are cached."""
+        return self.max_bytes > 0 and name in self.ttls
+
+    def get(self, name: str, arguments: dict) -> list | None:
+        """Get a cached result, or None on a miss."""
+        key = make_key(name, arguments)
+        counts = self._tool_counts.setdefault(name, [0, 0])
+        entry = self._entries.get(key)
+        if entry is not None and entry.expires_at > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            counts[0] += 1
+            return entry.result
+        if entry is not None:
+            self._remove(key)
+        self.misses += 1
+        counts[1] += 1
+        return None
+
+    def put(self, name: str, arguments: dict, result: list) -> None:
+        """Store a result for a cacheable tool."""
+        if not self.is_cacheable(name):
+            return
+        key = make_key(name, arguments)
+        size = _result_size(result) + len(key)
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = _Entry(name, dict(arguments), result, time.monotonic() + self.ttls[name], size)
+        self._bytes += size
+        while self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    def invalidate_for(self, name: str, arguments: dict) -> int:
+        """Drop cached reads made stale by a write tool call.
+
+        If the write names a broadcaster, only entries that include that
+        broadcaster (or name no broadcaster) are dropped.
+
+        Returns:
+            Number of entries removed.
+        """
+        targets = self.invalidated_by.get(name)
+        if not targets:
+            return 0
+        broadcaster_id = arguments.get("broadcaster_id")
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry.name in targets
+            and (broadcaster_id is None or _concerns(entry.arguments.get("broadcaster_id"), broadcaster_id))
+        ]
+        for key in stale:
+            self._remove(key)
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        self._entries.clear()
+        self._bytes = 0
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._bytes -= entry.size
+
+    def stats(self) -> dict:
+        """Get hit/miss counters and memory usage."""
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+            "tools": {name: {"hits": c[0], "misses": c[1]} for name, c in sorted(self._tool_counts.items())},
+        }
+
+
+# Global cache instance
+_cache: ResponseCache | None = None
+
+
+def get_cache() -> ResponseCache:
+    """Get the global response cache, configured from the environment."""
+    global _cache
+    if _cache is None:
+        _cache = ResponseCache(int(os.environ.get("TWITCH_MCP_CACHE_MAX_BYTES", DEFAULT_MAX_BYTES)))
+    return _cache
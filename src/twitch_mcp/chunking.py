@@ -0,0 +1,97 @@
+"""Chunked lookups for Helix endpoints capped at 100 IDs per request.
+
+Get Users, Get Streams and Get Games accept at most 100 ``id``/``login``
+(or ``name``) values per request. fetch_chunked splits larger lookups into
+100-value chunks, sends them concurrently (each request still goes through
+the rate-limit governor) and merges the results back into input order.
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+from pydantic import BaseModel
+
+HELIX_MAX_IDS = 100
+MAX_CONCURRENT_CHUNKS = 8
+
+
+def _norm(value: Any) -> Any:
+    return value.lower() if isinstance(value, str) else value
+
+
+async def fetch_chunked(
+    fetch: Callable[[BaseModel | None], Awaitable[Any]],
+    request_cls: type[BaseModel],
+    arguments: dict,
+    fields: dict[str, Callable[[Any], Any]],
+    item_key: Callable[[Any], Any],
+    chunk_overrides: dict | None = None,
+    chunk_size: int = HELIX_MAX_IDS,
+) -> list:
+    """Fetch a lookup of any size in chunks and merge results in input order.
+
+    Args:
+        fetch: Coroutine function taking request params, returning a response
+            with a ``data`` list
+        request_cls: Request model built from each chunk's arguments
+        arguments: Tool arguments
+        fields: Lookup list fields -> function extracting the matching value
+            from a result item (e.g. {"id": lambda u: u.id})
+        item_key: Identity of a result item, used to drop duplicates when the
+            same entity is looked up by more than one field
+        chunk_overrides: Extra arguments applied to every chunk when the
+            lookup is split (e.g. {"first": 100} for Get Streams)
+        chunk_size: Maximum lookup values per request (combined across fields)
+
+    Returns:
+        Result items ordered by the position of their first matching input
+        value; items that match no input value keep their response order
+        at the end.
+    """
+    pairs: list[tuple[str, Any]] = []
+    seen: set[tuple[str, Any]] = set()
+    for field in fields:
+        for value in arguments.get(field) or []:
+            key = (field, _norm(value))
+            if key not in seen:
+                seen.add(key)
+                pairs.append((field, value))
+
+    if not pairs:
+        response = await fetch(request_cls(**arguments) if arguments else None)
+        return response.data
+
+    base = {k: v for k, v in arguments.items() if k not in fields}
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    split = len(chunks) > 1
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+
+    async def fetch_chunk(chunk: list[tuple[str, Any]]) -> list:
+        chunk_args = dict(base)
+        for field, value in chunk:
+            chunk_args.setdefault(field, []).append(value)
+        if split and chunk_overrides:
+            chunk_args.update(chunk_overrides)
+        async with semaphore:
+            response = await fetch(request_cls(**chunk_args))
+        return response.data
+
+    pages = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+
+    positions = {(field, _norm(value)): i for i, (field, value) in enumerate(pairs)}
+    unmatched = len(pairs)
+    merged: dict[Any, tuple[int, int, Any]] = {}
+    arrival = 0
+    for page in pages:
+        for item in page:
+            matches = [
+                positions[(field, _norm(extract(item)))]
+                for field, extract in fields.items()
+                if (field, _norm(extract(item))) in positions
+            ]
+            position = min(matches) if matches else unmatched
+            key = item_key(item)
+            if key not in merged or (position, arrival) < merged[key][:2]:
+                merged[key] = (position, arrival, item)
+            arrival += 1
+    return [item for _, _, item in sorted(merged.values(), key=lambda m: m[:2])]
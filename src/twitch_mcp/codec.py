@@ -0,0 +1,87 @@
+"""JSON codec used on hot paths (EventSub frames, event logs, tool output).
+
+Uses the fastest library installed: orjson (``pip install
+twitch-mcp[orjson]``), then msgspec, then the standard library. All
+backends produce compact JSON with non-ASCII characters kept as-is, so
+output does not depend on which one is installed. TWITCH_MCP_JSON
+("orjson", "msgspec" or "json") picks a backend explicitly, e.g. to
+compare them.
+
+Values only the standard library handles (such as integers beyond 64
+bits for orjson) fall back to it transparently.
+"""
+
+import json
+import os
+from typing import Any, Callable
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _stdlib_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _load_backend(name: str) -> tuple[Callable[[str | bytes], Any], Callable[[Any], str]] | None:
+    """(loads, dumps) for a backend, or None if it is not installed."""
+    if name == "orjson":
+        try:
+            import orjson
+        except ImportError:  # optional dependency
+            return None
+
+        def dumps(obj: Any) -> str:
+            try:
+                return orjson.dumps(obj).decode()
+            except TypeError:
+                return _stdlib_dumps(obj)
+
+        return orjson.loads, dumps
+    if name == "msgspec":
+        try:
+            import msgspec
+        except ImportError:  # optional dependency
+            return None
+        encode, decode = msgspec.json.encode, msgspec.json.decode
+
+        def dumps(obj: Any) -> str:
+            try:
+                return encode(obj).decode()
+            except (TypeError, OverflowError):
+                return _stdlib_dumps(obj)
+
+        def loads(data: str | bytes) -> Any:
+            try:
+                return decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        return loads, dumps
+    return json.loads, _stdlib_dumps
+
+
+def _select() -> tuple[str, Callable[[str | bytes], Any], Callable[[Any], str]]:
+    requested = os.environ.get("TWITCH_MCP_JSON")
+    for name in (requested,) + BACKENDS if requested in BACKENDS else BACKENDS:
+        functions = _load_backend(name)
+        if functions is not None:
+            return (name, *functions)
+    raise AssertionError("the json backend is always available")
+
+
+BACKEND, _loads, _dumps = _select()
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON text (str or UTF-8 bytes).
+
+    Raises:
+        ValueError: If data is not valid JSON (json.JSONDecodeError and
+            orjson.JSONDecodeError are subclasses).
+    """
+    return _loads(data)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize as compact JSON, keeping non-ASCII characters."""
+    return _dumps(obj)
@@ -0,0 +1,272 @@
+"""Bounded, priority-aware dispatcher for MCP tool calls.
+
+Limits how many tool calls run against Helix at once and decides who goes
+next when the limit is reached: writes (bans, chat messages, ...) jump ahead
+of single reads, which jump ahead of bulk list reads such as followers or
+chatters.
+
+The limit is read from TWITCH_MCP_MAX_CONCURRENCY (default 8).
+
+SingleFlight coalesces identical concurrent reads so that a burst of the
+same twitch_get_users or twitch_get_streams call makes one Helix request.
+"""
+
+import asyncio
+import heapq
+import itertools
+import os
+import time
+from enum import IntEnum
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+class Priority(IntEnum):
+    """Priority classes for tool calls (lower runs first)."""
+
+    WRITE = 0
+    READ = 1
+    BULK = 2
+
+
+READ_PREFIXES = ("twitch_get_", "twitch_search_", "twitch_check_", "twitch_query_")
+
+# Reads that list potentially large collections
+BULK_READ_TOOLS = {
+    "twitch_get_banned_users",
+    "twitch_get_bits_leaderboard",
+    "twitch_get_blocked_terms",
+    "twitch_get_broadcaster_subscriptions",
+    "twitch_get_channel_followers",
+    "twitch_get_charity_donations",
+    "twitch_get_chatters",
+    "twitch_get_clips",
+    "twitch_get_eventsub_subscriptions",
+    "twitch_get_extension_transactions",
+    "twitch_get_followed_channels",
+    "twitch_get_followed_streams",
+    "twitch_get_moderators",
+    "twitch_get_redemptions",
+    "twitch_get_unban_requests",
+    "twitch_get_user_block_list",
+    "twitch_get_videos",
+    "twitch_get_vips",
+}
+
+# Tools answered locally without touching Helix; never queued
+LOCAL_TOOLS = {
+    "twitch_get_server_stats",
+    "twitch_query_events",
+}
+
+
+def classify(name: str) -> Priority:
+    """Get the priority class for a tool."""
+    if name in BULK_READ_TOOLS:
+        return Priority.BULK
+    if name.startswith(READ_PREFIXES):
+        return Priority.READ
+    return Priority.WRITE
+
+
+class _ClassStats:
+    """Counters for one priority class."""
+
+    def __init__(self):
+        self.queued = 0
+        self.dispatched = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def record_wait(self, wait: float) -> None:
+        self.dispatched += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+
+    def as_dict(self) -> dict:
+        avg = self.total_wait / self.dispatched if self.dispatched else 0.0
+        return {
+            "queued": self.queued,
+            "dispatched": self.dispatched,
+            "avg_wait_ms": round(avg * 1000, 1),
+            "max_wait_ms": round(self.max_wait * 1000, 1),
+        }
+
+
+class ToolDispatcher:
+    """Runs tool calls with bounded concurrency and priority ordering.
+
+    When all slots are busy, callers wait in a priority queue; a finished
+    call hands its slot directly to the highest-priority waiter (FIFO within
+    a class).
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        """Initialize the dispatcher.
+
+        Args:
+            max_concurrency: Maximum number of tool calls running at once
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self.max_concurrency = max_concurrency
+        self._in_flight = 0
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._seq = itertools.count()
+        self._stats = {priority: _ClassStats() for priority in Priority}
+
+    @property
+    def in_flight(self) -> int:
+        """Number of tool calls currently running."""
+        return self._in_flight
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of tool calls waiting for a slot."""
+        return sum(s.queued for s in self._stats.values())
+
+    async def run(self, name: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run a tool call once a slot is available.
+
+        Args:
+            name: Tool name, used to pick the priority class
+            func: Zero-argument coroutine function performing the call
+
+        Returns:
+            The result of func().
+        """
+        if name in LOCAL_TOOLS:
+            return await func()
+
+        priority = classify(name)
+        enqueued_at = time.monotonic()
+        await self._acquire(priority)
+        self._stats[priority].record_wait(time.monotonic() - enqueued_at)
+        try:
+            return await func()
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: Priority) -> None:
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        entry = (priority, next(self._seq), future)
+        heapq.heappush(self._waiters, entry)
+        stats = self._stats[priority]
+        stats.queued += 1
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+            else:
+                # Slot was handed over just before cancellation; pass it on
+                self._release()
+            raise
+        finally:
+            stats.queued -= 1
+
+    def _release(self) -> None:
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                # Hand the slot over; in-flight count stays the same
+                future.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def stats(self) -> dict:
+        """Get queue depth, in-flight count and wait times per class."""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "classes": {priority.name.lower(): s.as_dict() for priority, s in self._stats.items()},
+        }
+
+
+class SingleFlight:
+    """Shares one in-flight execution among identical concurrent calls.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task. Cancelling one caller does not cancel
+    the shared work for the others.
+    """
+
+    def __init__(self):
+        """Initialize with no calls in flight."""
+        self._pending: dict[str, asyncio.Task] = {}
+        self.executed = 0
+        self.coalesced = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls currently running."""
+        return len(self._pending)
+
+    async def run(self, key: str, func: Callable[[], Awaitable[T]]) -> T:
+        """Run func for key, or join the run already in flight.
+
+        Args:
+            key: Identity of the call (tool name plus normalized arguments)
+            func: Zero-argument coroutine function performing the call
+
+        Returns:
+            The shared result of func().
+        """
+        task = self._pending.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._pending[key] = task
+            task.add_done_callback(lambda t: self._done(key, t))
+            self.executed += 1
+        else:
+            self.coalesced += 1
+        return await asyncio.shield(task)
+
+    def _done(self, key: str, task: asyncio.Task) -> None:
+        if self._pending.get(key) is task:
+            del self._pending[key]
+        if not task.cancelled():
+            # Mark the exception retrieved even if every caller went away
+            task.exception()
+
+    def stats(self) -> dict:
+        """Get executed/coalesced counters."""
+        return {
+            "in_flight": self.in_flight,
+            "executed": self.executed,
+            "coalesced": self.coalesced,
+        }
+
+
+# Global dispatcher instance
+_dispatcher: ToolDispatcher | None = None
+
+
+def get_dispatcher() -> ToolDispatcher:
+    """Get the global dispatcher, configured from the environment."""
+    global _dispatcher
+    if _dispatcher is None:
+        max_concurrency = int(os.environ.get("TWITCH_MCP_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY))
+        _dispatcher = ToolDispatcher(max_concurrency)
+    return _dispatcher
+
+
+# Global single-flight group for reads
+_single_flight: SingleFlight | None = None
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the global single-flight group."""
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
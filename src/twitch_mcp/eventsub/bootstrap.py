@@ -0,0 +1,147 @@
+"""Concurrent creation of EventSub subscriptions.
+
+Twitch closes a websocket session that has no subscription 10 seconds after
+its welcome message, so a listener subscribing to many event types (or many
+broadcasters) creates them concurrently rather than one request at a time.
+
+Before anything is sent, the subscriptions are checked against the
+account's cost budget (max_total_cost from Get EventSub Subscriptions).
+Subscriptions for users who authorized the token cost 0; others, such as
+stream.online for someone else's channel, cost 1. Subscriptions that would
+exceed the budget are skipped instead of failing one by one at Twitch.
+"""
+
+import asyncio
+from typing import Awaitable, Callable
+
+from twitch_client import TwitchAPIError
+from twitch_sdk.endpoints import eventsub
+from twitch_sdk.schemas.eventsub import EventSubSubscription, GetEventSubSubscriptionsRequest
+
+DEFAULT_CONCURRENCY = 10
+
+# Condition fields naming a user whose authorization makes a subscription free
+USER_CONDITION_FIELDS = (
+    "broadcaster_user_id",
+    "to_broadcaster_user_id",
+    "from_broadcaster_user_id",
+    "moderator_user_id",
+    "user_id",
+)
+
+# Called with a subscription config ({"type", "version", "condition", ...})
+Subscribe = Callable[[dict], Awaitable[EventSubSubscription]]
+
+
+def subscription_cost(condition: dict, user_id: str | None) -> int:
+    """Estimate what a subscription counts against max_total_cost.
+
+    Args:
+        condition: Subscription condition
+        user_id: User the token belongs to (None: assume every
+            subscription costs 1)
+    """
+    if user_id and any(condition.get(field) == user_id for field in USER_CONDITION_FIELDS):
+        return 0
+    return 1
+
+
+async def fetch_budget(http) -> tuple[int, int] | None:
+    """Get (total_cost, max_total_cost) of the account's subscriptions.
+
+    Returns:
+        The current cost and the limit, or None if they could not be read.
+    """
+    try:
+        result = await eventsub.get_eventsub_subscriptions(http, GetEventSubSubscriptionsRequest(status="enabled"))
+    except Exception as e:
+        print(f"[EventSub] Could not read subscription cost budget: {e}")
+        return None
+    return result.total_cost, result.max_total_cost
+
+
+async def subscribe_all(
+    subscribe: Subscribe,
+    subscriptions: list[dict],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    budget: tuple[int, int] | None = None,
+    user_id: str | None = None,
+) -> list[dict]:
+    """Create subscriptions concurrently and report each outcome.
+
+    Args:
+        subscribe: Coroutine function taking a config, returning the subscription
+        subscriptions: Configs with type, version and condition
+        concurrency: Maximum subscription requests in flight
+        budget: (total_cost, max_total_cost) to check against, or None to
+            skip the check
+        user_id: User the token belongs to, for cost estimates
+
+    Returns:
+        One result per config, in order, with type, version, condition,
+        status ("enabled" or the status Twitch returned, "exists" when
+        Twitch reports the subscription already exists, "failed" or
+        "skipped"), id, cost and error.
+    """
+    results = [_result(sub, user_id) for sub in subscriptions]
+
+    if budget is not None:
+        total_cost, max_total_cost = budget
+        for result in results:
+            if total_cost + result["cost"] > max_total_cost:
+                result["status"] = "skipped"
+                result["error"] = f"would exceed max_total_cost ({total_cost}/{max_total_cost} used)"
+            else:
+                total_cost += result["cost"]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(sub: dict, result: dict) -> None:
+        async with semaphore:
+            try:
+                subscription = await subscribe(sub)
+            except TwitchAPIError as e:
+                # 409 Conflict: e.g. another conduit member created it first
+                if e.status_code == 409:
+                    result.update(status="exists", cost=0)
+                else:
+                    result.update(status="failed", error=str(e))
+                return
+            except Exception as e:
+                result["status"] = "failed"
+                result["error"] = str(e)
+                return
+        result.update(status=subscription.status, id=subscription.id, cost=subscription.cost)
+
+    await asyncio.gather(*(create(s, r) for s, r in zip(subscriptions, results) if r["status"] is None))
+    return results
+
+
+def _result(sub: dict, user_id: str | None) -> dict:
+    return {
+        "type": sub["type"],
+        "version": sub["version"],
+        "condition": sub["condition"],
+        "status": None,
+        "id": None,
+        "cost": subscription_cost(sub["condition"], user_id),
+        "error": None,
+    }
+
+
+def skipped(sub: dict, reason: str) -> dict:
+    """Result for a subscription that was not sent."""
+    return {**_result(sub, None), "status": "skipped", "cost": 0, "error": reason}
+
+
+def summarize(results: list[dict]) -> str:
+    """One-line summary of subscribe_all() results."""
+    created = sum(1 for r in results if r["status"] not in ("failed", "skipped", "exists"))
+    existing = sum(1 for r in results if r["status"] == "exists")
+    failed = sum(1 for r in results if r["status"] == "failed")
+    not_sent = sum(1 for r in results if r["status"] == "skipped")
+    cost = sum(r["cost"] for r in results if r["status"] not in ("failed", "skipped"))
+    summary = f"{created}/{len(results)} subscriptions created (cost {cost}), {failed} failed, {not_sent} skipped"
+    if existing:
+        summary += f", {existing} already existed"
+    return summary
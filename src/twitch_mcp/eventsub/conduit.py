@@ -0,0 +1,262 @@
+"""Conduit mode: several listener processes share one conduit's events.
+
+A conduit is a pool of shards. Twitch load-balances the notifications of
+the conduit's subscriptions across its enabled shards, so running one
+listener process per shard spreads event handling over several cores or
+machines. In conduit mode each process opens its websocket session and
+claims a shard for it with Update Conduit Shards; subscriptions are created
+once against the conduit (with the app access token) instead of per
+session, and any process may create them (409 Conflict means another
+already did).
+
+Every process also watches the conduit's shards:
+
+- a shard that stays disabled for two checks in a row (its process died
+  and was not restarted) is adopted: a survivor opens an extra session for
+  it, so that shard's share of events keeps being handled;
+- when another session takes over a shard a process holds (a restarted
+  process claiming its shard back with --conduit-shard), the process
+  releases it, closing the extra session;
+- a session that had to reconnect (new session ID) is assigned to its
+  shard again.
+
+Update Conduit Shards answers 200 even when some shards could not be
+updated (they are listed in ``errors``), so a shard only counts as held
+once the response lists it as updated. A failed adoption closes its extra
+session and is retried on a later check; if the listener's own session
+loses or fails to get its shard, the next check claims one again.
+
+A process claims the shard given with --conduit-shard, else the first
+disabled shard, else grows the conduit by one shard and claims the new one.
+"""
+
+import asyncio
+import random
+
+from twitch_sdk.endpoints import eventsub
+from twitch_sdk.schemas.base import TwitchResponse
+from twitch_sdk.schemas.eventsub import (
+    ConduitShard,
+    CreateConduitRequest,
+    EventSubSubscription,
+    GetConduitShardsRequest,
+    UpdateConduitRequest,
+)
+
+from .bootstrap import DEFAULT_CONCURRENCY, subscribe_all, summarize
+from .websocket import EventSubConnection
+
+DEFAULT_CHECK_INTERVAL = 30.0
+
+
+async def create_conduit(http, shard_count: int = 1) -> str:
+    """Create a conduit and return its ID (app access token)."""
+    result = await eventsub.create_conduit(http, CreateConduitRequest(shard_count=shard_count))
+    return result.data[0].id
+
+
+class ConduitMember:
+    """One listener process's membership in a conduit."""
+
+    def __init__(
+        self,
+        listener,
+        conduit_id: str,
+        shard_id: str | None = None,
+        check_interval: float = DEFAULT_CHECK_INTERVAL,
+    ):
+        """Initialize the membership.
+
+        Args:
+            listener: Connected EventSubListener; its first session claims
+                the shard, and adopted shards get sessions of their own
+            conduit_id: Conduit to join
+            shard_id: Shard to claim (default: a disabled one, or a new one)
+            check_interval: Seconds between checks of the conduit's shards
+        """
+        self.listener = listener
+        self.http = listener.sdk.http
+        self.conduit_id = conduit_id
+        self.shard_id = shard_id
+        self.check_interval = check_interval
+        # Shard ID -> session holding it (the listener's own session or an adopted one)
+        self._owned: dict[str, EventSubConnection] = {}
+        self._suspect: set[str] = set()
+        self._task: asyncio.Task | None = None
+        self.adopted = 0
+        self.released = 0
+
+    async def _shards(self) -> dict[str, ConduitShard]:
+        shards: dict[str, ConduitShard] = {}
+        params = GetConduitShardsRequest(conduit_id=self.conduit_id)
+        while True:
+            result = await eventsub.get_conduit_shards(self.http, params)
+            shards.update((shard.id, shard) for shard in result.data)
+            cursor = result.pagination.cursor if result.pagination else None
+            if not cursor:
+                return shards
+            params = GetConduitShardsRequest(conduit_id=self.conduit_id, after=cursor)
+
+    def _is_primary(self, session: EventSubConnection) -> bool:
+        """Whether a session is the listener's own (never closed by the member)."""
+        return session is self.listener._ws
+
+    def _primary_shard(self) -> str | None:
+        """Shard held by the listener's own session, if any."""
+        return next((shard_id for shard_id, s in self._owned.items() if self._is_primary(s)), None)
+
+    async def _assign(self, shard_id: str, session: EventSubConnection) -> bool:
+        """Point a shard at a session and record it as held if Twitch accepted.
+
+        Returns:
+            Whether the shard was assigned.
+        """
+        # Called directly: the SDK's response model drops the per-shard errors
+        response = await self.http.patch_app("/eventsub/conduits/shards", data={
+            "conduit_id": self.conduit_id,
+            "shards": [{"id": shard_id, "transport": {"method": "websocket", "session_id": session.session_id}}],
+        })
+        errors = [e for e in response.get("errors") or [] if e.get("id") == shard_id]
+        if errors or not any(s.get("id") == shard_id for s in response.get("data") or []):
+            reason = errors[0].get("message") or errors[0].get("code") if errors else "not in response"
+            print(f"[EventSub] Could not assign shard {shard_id}: {reason}")
+            if self._owned.get(shard_id) is session:
+                del self._owned[shard_id]
+            return False
+        self._owned[shard_id] = session
+        session.on_reconnect = lambda s, shard_id=shard_id: self._reassign(shard_id, s)
+        return True
+
+    async def _reassign(self, shard_id: str, session: EventSubConnection) -> None:
+        """Assign a reconnected session to its shard again."""
+        if not await self._assign(shard_id, session) and not self._is_primary(session):
+            await self.listener.close_session(session)
+
+    async def _claim(self) -> str | None:
+        """Claim a shard for the listener's own session.
+
+        Returns:
+            The claimed shard ID, or None if Twitch refused the assignment.
+        """
+        shard_id = await self._pick_shard()
+        if not await self._assign(shard_id, self.listener._ws):
+            return None
+        print(f"[EventSub] Claimed shard {shard_id} of conduit {self.conduit_id}")
+        return shard_id
+
+    async def _pick_shard(self) -> str:
+        """The requested shard, a disabled one, or a newly added one."""
+        if self.shard_id is not None:
+            return self.shard_id
+        shards = await self._shards()
+        free = sorted((s.id for s in shards.values() if s.status != "enabled"), key=int)
+        if free:
+            return free[0]
+        await eventsub.update_conduit(self.http, UpdateConduitRequest(id=self.conduit_id, shard_count=len(shards) + 1))
+        return str(len(shards))
+
+    async def start(self) -> str | None:
+        """Claim a shard for the listener's session and start watching.
+
+        Returns:
+            The claimed shard ID, or None if the claim failed (the watcher
+            retries it on every check).
+        """
+        shard_id = await self._claim()
+        self._task = asyncio.create_task(self._watch())
+        return shard_id
+
+    async def subscribe_all(
+        self,
+        subscriptions: list[dict],
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[dict]:
+        """Create the conduit's subscriptions (existing ones are kept).
+
+        Args:
+            subscriptions: Configs with type, version and condition
+            concurrency: Maximum subscription requests in flight
+
+        Returns:
+            Per-subscription results (see bootstrap.subscribe_all).
+        """
+        results = await subscribe_all(self._subscribe, subscriptions, concurrency)
+        for result in results:
+            if result["status"] == "failed":
+                print(f"[EventSub] Failed {result['type']}: {result['error']}")
+        print(f"[EventSub] Conduit {summarize(results)}")
+        return results
+
+    async def _subscribe(self, sub: dict) -> EventSubSubscription:
+        response = await self.http.post_app("/eventsub/subscriptions", data={
+            "type": sub["type"],
+            "version": sub["version"],
+            "condition": sub["condition"],
+            "transport": {"method": "conduit", "conduit_id": self.conduit_id},
+        })
+        return TwitchResponse[EventSubSubscription].model_validate(response).data[0]
+
+    async def _watch(self) -> None:
+        while True:
+            # Jitter so processes do not all react to a dead shard at once
+            await asyncio.sleep(self.check_interval * random.uniform(0.8, 1.2))
+            try:
+                await self.check()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Keep watching: a failed check must not end shard reassignment
+                print(f"[EventSub] Conduit check failed: {type(e).__name__}: {e}")
+
+    async def check(self) -> None:
+        """Reconcile held shards with the conduit and adopt dead shards."""
+        shards = await self._shards()
+
+        for shard_id, session in list(self._owned.items()):
+            shard = shards.get(shard_id)
+            if shard is not None and shard.transport.session_id == session.session_id:
+                continue
+            if shard is not None and shard.status == "enabled":
+                # Another session took this shard over
+                del self._owned[shard_id]
+                if self._is_primary(session):
+                    self.shard_id = None
+                    print(f"[EventSub] Shard {shard_id} was taken over")
+                else:
+                    self.released += 1
+                    print(f"[EventSub] Released adopted shard {shard_id}")
+                    await self.listener.close_session(session)
+            elif session.session_id:
+                # Disabled or gone while we are connected: assign it again
+                await self._reassign(shard_id, session)
+
+        if self._primary_shard() is None and self.listener._ws is not None:
+            await self._claim()
+
+        disabled = {s.id for s in shards.values() if s.status != "enabled" and s.id not in self._owned}
+        for shard_id in sorted(disabled & self._suspect, key=int):
+            if len(self.listener._sessions) >= self.listener.max_sessions:
+                break
+            session = await self.listener.open_session()
+            if not await self._assign(shard_id, session):
+                await self.listener.close_session(session)
+                continue
+            self.adopted += 1
+            print(f"[EventSub] Adopted shard {shard_id} (disabled for two checks)")
+        self._suspect = disabled
+
+    async def stop(self) -> None:
+        """Stop watching the conduit."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def stats(self) -> dict:
+        """Get held shards and adoption counters."""
+        return {
+            "conduit_id": self.conduit_id,
+            "shards": list(self._owned),
+            "adopted": self.adopted,
+            "released": self.released,
+        }
@@ -0,0 +1,79 @@
+"""Message ID deduplication for EventSub notifications.
+
+Twitch may deliver a notification more than once (notably around
+reconnects), always with the same message_id. The listener checks each
+message_id against a window of recently seen IDs and drops repeats before
+they are logged, stored or handled, so cheers and subs are not counted
+twice.
+"""
+
+import time
+from collections import deque
+
+DEFAULT_WINDOW_SECONDS = 600.0
+DEFAULT_MAX_IDS = 100_000
+BUCKETS = 10
+
+
+class MessageDeduplicator:
+    """Time-bucketed set of recently seen message IDs.
+
+    IDs are kept in BUCKETS sets each covering window / BUCKETS seconds;
+    whole buckets expire at once, so memory stays bounded without tracking
+    a timestamp per ID. If more than max_ids arrive within the window, the
+    oldest buckets are dropped early.
+    """
+
+    def __init__(self, window: float = DEFAULT_WINDOW_SECONDS, max_ids: int = DEFAULT_MAX_IDS):
+        """Initialize the deduplicator.
+
+        Args:
+            window: Seconds a message ID is remembered (Twitch redelivers
+                within minutes; 10 minutes by default)
+            max_ids: Upper bound on remembered IDs
+        """
+        self.window = window
+        self.max_ids = max_ids
+        self._bucket_seconds = window / BUCKETS
+        self._buckets: deque[tuple[float, set[str]]] = deque()
+        self._size = 0
+        self.checked = 0
+        self.duplicates = 0
+
+    def _expire(self, now: float) -> None:
+        while self._buckets and (
+            self._buckets[0][0] <= now - self.window or self._size > self.max_ids
+        ):
+            _, ids = self._buckets.popleft()
+            self._size -= len(ids)
+
+    def is_duplicate(self, message_id: str | None) -> bool:
+        """Check a message ID and remember it.
+
+        Returns:
+            True if the ID was already seen within the window. Messages
+            without an ID are never treated as duplicates.
+        """
+        if not message_id:
+            return False
+        self.checked += 1
+        now = time.monotonic()
+        self._expire(now)
+        for _, ids in self._buckets:
+            if message_id in ids:
+                self.duplicates += 1
+                return True
+        if not self._buckets or now - self._buckets[-1][0] >= self._bucket_seconds:
+            self._buckets.append((now, set()))
+        self._buckets[-1][1].add(message_id)
+        self._size += 1
+        return False
+
+    def stats(self) -> dict:
+        """Get check and duplicate counters."""
+        return {
+            "window_seconds": self.window,
+            "tracked": self._size,
+            "checked": self.checked,
+            "duplicates": self.duplicates,
+        }
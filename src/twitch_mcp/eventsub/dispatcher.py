@@ -0,0 +1,199 @@
+"""Partitioned event dispatch: ordered within a partition, parallel across them.
+
+Every event gets a partition key (its subscription type by default, or a
+field of the event such as ``user_id``). Events with the same key are
+handled one at a time in arrival order; events with different keys are
+handled concurrently. A flood of chat messages then only backs up the
+``channel.chat.message`` partition, and a ``channel.raid`` or
+``channel.ban`` is handled as soon as it arrives.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable
+
+PartitionBy = str | Callable[[dict], Any] | None
+
+
+def partition_key(event: dict, partition_by: PartitionBy) -> Any:
+    """Get the partition key of an EventSub notification payload.
+
+    Args:
+        event: Notification payload ({"subscription": ..., "event": ...})
+        partition_by: "type" for the subscription type, another string for
+            that field of the event data (events without it fall back to
+            their type), a callable taking the payload, or None for no
+            ordering at all
+
+    Returns:
+        Hashable key, or None if the event has no ordering constraint.
+    """
+    if partition_by is None:
+        return None
+    if callable(partition_by):
+        return partition_by(event)
+    event_type = event.get("subscription", {}).get("type", "unknown")
+    if partition_by == "type":
+        return event_type
+    value = (event.get("event") or {}).get(partition_by)
+    return (partition_by, value) if value is not None else event_type
+
+
+class _Partition:
+    """Events waiting in one partition, drained by a single task."""
+
+    __slots__ = ("items", "task")
+
+    def __init__(self):
+        self.items: deque = deque()
+        self.task: asyncio.Task | None = None
+
+
+class PartitionedDispatcher:
+    """Run a handler over events, ordered per partition key.
+
+    submit() hands an event to its partition and returns without waiting for
+    it to be handled, unless that partition already has max_partition events
+    waiting: only a full partition holds up submit(), never a busy one next
+    to it. With on_drop set, a full partition discards its oldest waiting
+    event instead of waiting. Each partition with pending events has one
+    task draining it; at most concurrency events are handled at the same
+    time across partitions. Partitions are created on first use and dropped
+    once drained, so keying by user does not accumulate state.
+    """
+
+    def __init__(
+        self,
+        handle: Callable[[Any], Awaitable[None]],
+        concurrency: int = 4,
+        max_partition: int = 1000,
+        on_drop: Callable[[Any], None] | None = None,
+    ):
+        """Initialize the dispatcher.
+
+        Args:
+            handle: Coroutine function called with each submitted item
+            concurrency: Maximum items handled at once across partitions
+            max_partition: Items that may wait in one partition (unordered
+                items count as one partition)
+            on_drop: Called with each item a full partition discards; when
+                None, submit() waits for room instead
+        """
+        self._handle = handle
+        self.concurrency = concurrency
+        self.max_partition = max_partition
+        self._on_drop = on_drop
+        self._slots = asyncio.Semaphore(concurrency)
+        self._partitions: dict[Any, _Partition] = {}
+        self._unordered: set[asyncio.Task] = set()
+        self._room = asyncio.Event()
+        self._room.set()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self.pending = 0
+        self.peak_pending = 0
+        self.peak_partitions = 0
+        self.handled = 0
+        self.dropped = 0
+        self.waited = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    async def submit(self, item: Any, key: Any = None) -> None:
+        """Queue an item behind the earlier items of its partition.
+
+        Args:
+            item: Item passed to the handler
+            key: Partition key; None handles the item without ordering
+        """
+        await self._make_room(key)
+        self.pending += 1
+        self.peak_pending = max(self.peak_pending, self.pending)
+        self._idle.clear()
+        entry = (time.monotonic(), item)
+        if key is None:
+            task = asyncio.create_task(self._run_one(entry))
+            self._unordered.add(task)
+            task.add_done_callback(self._unordered.discard)
+            return
+        partition = self._partitions.get(key)
+        if partition is None:
+            partition = self._partitions[key] = _Partition()
+            self.peak_partitions = max(self.peak_partitions, len(self._partitions))
+        partition.items.append(entry)
+        if partition.task is None:
+            partition.task = asyncio.create_task(self._drain(key, partition))
+
+    def _waiting(self, key: Any) -> int:
+        if key is None:
+            return len(self._unordered)
+        partition = self._partitions.get(key)
+        return len(partition.items) if partition else 0
+
+    async def _make_room(self, key: Any) -> None:
+        """Drop the partition's oldest item or wait while it is full."""
+        if self._waiting(key) < self.max_partition:
+            return
+        partition = self._partitions.get(key) if key is not None else None
+        if self._on_drop is not None and partition is not None:
+            _, item = partition.items.popleft()
+            self.pending -= 1
+            self.dropped += 1
+            self._on_drop(item)
+            return
+        self.waited += 1
+        while self._waiting(key) >= self.max_partition:
+            self._room.clear()
+            await self._room.wait()
+
+    async def _drain(self, key: Any, partition: _Partition) -> None:
+        try:
+            while partition.items:
+                await self._run_one(partition.items.popleft())
+        finally:
+            partition.task = None
+            if not partition.items and self._partitions.get(key) is partition:
+                del self._partitions[key]
+
+    async def _run_one(self, entry: tuple[float, Any]) -> None:
+        submitted_at, item = entry
+        try:
+            async with self._slots:
+                wait = time.monotonic() - submitted_at
+                self.wait_total += wait
+                self.wait_max = max(self.wait_max, wait)
+                await self._handle(item)
+        finally:
+            self.handled += 1
+            self.pending -= 1
+            self._room.set()
+            if not self.pending:
+                self._idle.set()
+
+    async def join(self) -> None:
+        """Wait until every submitted item has been handled."""
+        await self._idle.wait()
+
+    async def cancel(self) -> None:
+        """Cancel all partition tasks, dropping items not yet handled."""
+        tasks = [p.task for p in self._partitions.values() if p.task] + list(self._unordered)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._partitions.clear()
+
+    def stats(self) -> dict:
+        """Get partition and wait counters."""
+        return {
+            "concurrency": self.concurrency,
+            "pending": self.pending,
+            "peak_pending": self.peak_pending,
+            "partitions": len(self._partitions),
+            "peak_partitions": self.peak_partitions,
+            "handled": self.handled,
+            "dropped": self.dropped,
+            "waited": self.waited,
+            "avg_wait_ms": round(self.wait_total / self.handled * 1000, 2) if self.handled else 0.0,
+            "max_wait_ms": round(self.wait_max * 1000, 2),
+        }
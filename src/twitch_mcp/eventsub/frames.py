@@ -0,0 +1,35 @@
+"""EventSub message frames and the event dicts the listener passes around.
+
+A frame is one EventSub message as Twitch sends it:
+``{"metadata": {...}, "payload": {...}}``. The listener turns notifications
+into ``payload + message_id + message_timestamp`` and revocations into
+``{"revocation": payload, ...}``; the event log stores the raw frame
+instead (no re-serialization), and readers convert it back with
+message_event().
+"""
+
+from ..codec import dumps
+
+
+def message_event(message: dict) -> dict | None:
+    """Event dict for a parsed frame, or None for session messages."""
+    metadata = message.get("metadata", {})
+    message_type = metadata.get("message_type")
+    payload = message.get("payload", {})
+    if message_type == "notification":
+        event = payload
+    elif message_type == "revocation":
+        event = {"revocation": payload}
+    else:
+        return None
+    event["message_id"] = metadata.get("message_id")
+    event["message_timestamp"] = metadata.get("message_timestamp")
+    return event
+
+
+def webhook_frame(message_id: str, message_type: str, timestamp: str, body: str) -> str:
+    """Frame text for a webhook message, wrapping its body without re-serializing it."""
+    return (
+        '{"metadata":{"message_id":%s,"message_type":%s,"message_timestamp":%s},"payload":%s}'
+        % (dumps(message_id), dumps(message_type), dumps(timestamp), body)
+    )
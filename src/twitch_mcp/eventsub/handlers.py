@@ -1,28 +1,100 @@
-"""Event handlers for EventSub events."""
+"""Event handlers for EventSub events.
 
-from typing import Callable
+Any number of handlers can be registered per event type, or per wildcard
+pattern such as "channel.subscription.*". Registrations are compiled into
+an immutable dispatch table mapping each event type to its handlers in
+priority order, with sync/async already resolved, so dispatching an event
+is one dict lookup. The table is rebuilt on registration (copy-on-write),
+and the first event of a type that only matches wildcards adds its entry.
+"""
 
-# Registry of event handlers
-_handlers: dict[str, Callable] = {}
+import asyncio
+from fnmatch import fnmatchcase
+from types import MappingProxyType
+from typing import Callable, Mapping, NamedTuple
 
 
-def register_handler(event_type: str):
+class HandlerEntry(NamedTuple):
+    """A registered handler with its sync/async kind resolved."""
+
+    func: Callable
+    is_async: bool
+    priority: int
+    pattern: str
+
+
+# Registrations in order, and the dispatch table compiled from them
+_registrations: list[HandlerEntry] = []
+_dispatch: Mapping[str, tuple[HandlerEntry, ...]] = MappingProxyType({})
+
+
+def _is_pattern(event_type: str) -> bool:
+    return any(c in event_type for c in "*?[")
+
+
+def _match(event_type: str) -> tuple[HandlerEntry, ...]:
+    """Handlers for an event type: highest priority first, then registration order."""
+    matched = [
+        (index, entry)
+        for index, entry in enumerate(_registrations)
+        if entry.pattern == event_type or fnmatchcase(event_type, entry.pattern)
+    ]
+    matched.sort(key=lambda m: (-m[1].priority, m[0]))
+    return tuple(entry for _, entry in matched)
+
+
+def _rebuild(extra_types: tuple[str, ...] = ()) -> None:
+    global _dispatch
+    types = {e.pattern for e in _registrations if not _is_pattern(e.pattern)}
+    types.update(_dispatch, extra_types)
+    _dispatch = MappingProxyType({t: _match(t) for t in types})
+
+
+def register_handler(event_type: str, priority: int = 0):
     """Decorator to register an event handler.
 
+    Handlers for the same event type all run, highest priority first
+    (registration order breaks ties).
+
+    Args:
+        event_type: Event type, or a wildcard pattern ("channel.subscription.*", "*")
+        priority: Handlers with higher priority run first
+
     Usage:
         @register_handler("channel.chat.message")
         def handle_chat_message(event_type: str, data: dict):
             print(f"Chat: {data['chatter_user_name']}: {data['message']['text']}")
     """
     def decorator(func: Callable):
-        _handlers[event_type] = func
+        _registrations.append(HandlerEntry(func, asyncio.iscoroutinefunction(func), priority, event_type))
+        _rebuild()
         return func
     return decorator
 
 
+def unregister_handler(func: Callable, event_type: str | None = None) -> None:
+    """Remove a handler (from one event type or pattern, or from all of them)."""
+    _registrations[:] = [
+        e for e in _registrations
+        if not (e.func is func and (event_type is None or e.pattern == event_type))
+    ]
+    _rebuild()
+
+
+def get_handlers(event_type: str) -> tuple[HandlerEntry, ...]:
+    """Get the handlers for an event type, in the order they run."""
+    handlers = _dispatch.get(event_type)
+    if handlers is None:
+        # First event of a type without an exact registration
+        _rebuild((event_type,))
+        handlers = _dispatch[event_type]
+    return handlers
+
+
 def get_handler(event_type: str) -> Callable | None:
-    """Get the registered handler for an event type."""
-    return _handlers.get(event_type)
+    """Get the first handler for an event type."""
+    handlers = get_handlers(event_type)
+    return handlers[0].func if handlers else None
 
 
 def default_handler(event_type: str, data: dict) -> None:
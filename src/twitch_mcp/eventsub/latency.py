@@ -0,0 +1,98 @@
+"""Per-handler latency recording for replays and benchmarks."""
+
+import random
+from array import array
+from typing import Callable
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values (0 if empty)."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, round(fraction * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class HandlerLatency:
+    """Collects how long each handler takes per event.
+
+    Pass one to EventSubListener(handler_latency=...) and every handler call
+    is timed. Samples are kept in compact float arrays (8 bytes each), so
+    millions of events fit comfortably; for long runs, max_samples keeps a
+    uniform random sample per handler instead (reservoir sampling), so
+    memory stays flat.
+    """
+
+    def __init__(self, max_samples: int | None = None):
+        """Initialize the recorder.
+
+        Args:
+            max_samples: Samples kept per handler (None: all)
+        """
+        self.max_samples = max_samples
+        self._samples: dict[Callable, array] = {}
+        self._calls: dict[Callable, int] = {}
+
+    def record(self, func: Callable, seconds: float) -> None:
+        """Add one handler call's duration."""
+        samples = self._samples.get(func)
+        if samples is None:
+            samples = self._samples[func] = array("d")
+        calls = self._calls[func] = self._calls.get(func, 0) + 1
+        if self.max_samples is None or len(samples) < self.max_samples:
+            samples.append(seconds)
+        else:
+            slot = random.randrange(calls)
+            if slot < self.max_samples:
+                samples[slot] = seconds
+
+    def reset(self) -> None:
+        """Forget all samples (e.g. after a warm-up)."""
+        self._samples.clear()
+        self._calls.clear()
+
+    def summary(self) -> dict[str, dict]:
+        """Get call count and p50/p90/p99/max milliseconds per handler, slowest p99 first."""
+        result = {
+            getattr(func, "__qualname__", repr(func)): _describe(samples, self._calls[func])
+            for func, samples in self._samples.items()
+        }
+        return dict(sorted(result.items(), key=lambda item: item[1]["p99_ms"], reverse=True))
+
+    def overall(self) -> dict:
+        """Get count and percentiles over every handler call.
+
+        With max_samples, each handler's samples are weighted by how many
+        calls they stand for, so frequent handlers count as much as they ran.
+        """
+        weighted = sorted(
+            (value, self._calls[func] / len(samples))
+            for func, samples in self._samples.items()
+            for value in samples
+        )
+        total = sum(weight for _, weight in weighted)
+        points = {"p50_ms": 0.50, "p90_ms": 0.90, "p99_ms": 0.99}
+        result = {"count": sum(self._calls.values()), **dict.fromkeys(points, 0.0)}
+        remaining = iter(points.items())
+        key, fraction = next(remaining)
+        seen = 0.0
+        for value, weight in weighted:
+            seen += weight
+            while seen >= fraction * total:
+                result[key] = round(value * 1000, 3)
+                key, fraction = next(remaining, (None, 2.0))
+            if key is None:
+                break
+        result["max_ms"] = round(weighted[-1][0] * 1000, 3) if weighted else 0.0
+        return result
+
+
+def _describe(samples: array, calls: int) -> dict:
+    values = sorted(samples)
+    return {
+        "count": calls,
+        "p50_ms": round(percentile(values, 0.50) * 1000, 3),
+        "p90_ms": round(percentile(values, 0.90) * 1000, 3),
+        "p99_ms": round(percentile(values, 0.99) * 1000, 3),
+        "max_ms": round(values[-1] * 1000, 3) if values else 0.0,
+    }
@@ -1,17 +1,32 @@
 """EventSub WebSocket listener for real-time Twitch events."""
 
 import asyncio
-import json
+import math
 import os
 import sys
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Callable
+from typing import Awaitable, Callable
 
 from twitch_sdk import TwitchSDK
-from twitch_sdk.endpoints.eventsub import EventSubWebSocket
+from twitch_sdk.schemas.eventsub import EventSubSubscription
 
-from .handlers import default_handler, get_handler
+from .bootstrap import DEFAULT_CONCURRENCY, fetch_budget, skipped, subscribe_all, summarize
+from .conduit import DEFAULT_CHECK_INTERVAL, ConduitMember, create_conduit
+from .dedup import DEFAULT_WINDOW_SECONDS, MessageDeduplicator
+from .dispatcher import PartitionBy, PartitionedDispatcher, partition_key
+from .handlers import HandlerEntry, default_handler, get_handlers
+from .latency import HandlerLatency
+from .queue import DEFAULT_QUEUE_SIZE, OVERFLOW_POLICIES, EventQueue
+from .reorder import DEFAULT_REORDER_WINDOW, ReorderBuffer
+from .segments import default_compression
+from .store import DEFAULT_STORE_PATH, EventStore
+from .websocket import MAX_SESSIONS, MAX_SUBSCRIPTIONS_PER_SESSION, EventSubConnection
+from .webhook import DEFAULT_PORT, WebhookReceiver
+from .writer import EventLogWriter
+
+DEFAULT_STATS_INTERVAL = 60.0
 
 
 class EventSubListener:
@@ -19,9 +34,18 @@ class EventSubListener:
 
     Features:
     - Connects to Twitch EventSub WebSocket
-    - Subscribes to configured event types
-    - Routes events to handlers
-    - Optionally logs events to a file
+    - Subscribes to configured event types, opening more sessions when
+      one session's 300-subscription limit is reached (e.g. many channels)
+      and merging their events into one stream, ordered by message
+      timestamp within a short reorder window
+    - Follows session_reconnect migrations and reconnects (and
+      resubscribes) with backoff when the connection is lost
+    - Drops notifications Twitch delivers more than once (same message_id)
+    - Routes events to handlers off the websocket reader, so slow handlers
+      never stall reading (and missing keepalives)
+    - Handles events of one partition (by default, one event type) in
+      order, and different partitions concurrently
+    - Optionally logs events to a file (buffered, batched writes)
     """
 
     def __init__(
@@ -29,6 +53,19 @@ class EventSubListener:
         sdk: TwitchSDK,
         log_file: str | Path | None = None,
         handler: Callable[[dict], None] | None = None,
+        log_writer: EventLogWriter | None = None,
+        event_store: EventStore | None = None,
+        workers: int = 4,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = "block",
+        spill_path: str | Path | None = None,
+        partition_by: PartitionBy = "type",
+        dedup_window: float | None = DEFAULT_WINDOW_SECONDS,
+        ws_url: str | None = None,
+        max_sessions: int = MAX_SESSIONS,
+        handler_latency: HandlerLatency | None = None,
+        stats_interval: float | None = None,
+        reorder_window: float | None = DEFAULT_REORDER_WINDOW,
     ):
         """Initialize the EventSub listener.
 
@@ -36,11 +73,63 @@ class EventSubListener:
             sdk: TwitchSDK instance for API calls
             log_file: Optional path to log events (JSON lines format)
             handler: Optional custom event handler function
+            log_writer: Optional configured log writer (e.g. with rotation);
+                takes precedence over log_file
+            event_store: Optional store that records every notification
+                for twitch_query_events
+            workers: Maximum events handled at once across partitions
+            queue_size: Events buffered between the websocket and the
+                handlers, and events that may wait in each partition
+            overflow: What to do when the queue is full: "block" (pause
+                reading), "drop-oldest" or "spill" (overflow to disk)
+            spill_path: Spill file for overflow="spill"
+            partition_by: How events are ordered (see dispatcher.partition_key):
+                "type" (default), an event field such as "user_id", a
+                callable, or None to handle every event independently
+            dedup_window: Seconds a message_id is remembered to drop
+                redelivered notifications (None disables deduplication)
+            ws_url: EventSub WebSocket URL (default: Twitch; e.g. a local
+                Twitch CLI mock server)
+            max_sessions: Most websocket sessions to spread subscriptions
+                over (Twitch allows 3 per client ID and user)
+            handler_latency: Optional recorder timing every handler call
+            stats_interval: Seconds between queue stats lines while
+                listening (None disables them)
+            reorder_window: Seconds events are held, with more than one
+                session open, to merge the sessions in message_timestamp
+                order (None merges in arrival order)
         """
         self.sdk = sdk
-        self.log_file = Path(log_file) if log_file else None
+        if log_writer is None and log_file:
+            log_writer = EventLogWriter(log_file)
+        self.log_file = log_writer.path if log_writer else None
+        self._log_writer = log_writer
+        self.event_store = event_store
         self.handler = handler or default_handler
-        self._ws: EventSubWebSocket | None = None
+        # Runs for event types without registered handlers
+        self._fallback = (HandlerEntry(self.handler, asyncio.iscoroutinefunction(self.handler), 0, "*"),)
+        self.workers = workers
+        self.queue_size = queue_size
+        self.queue = EventQueue(queue_size, overflow, spill_path)
+        self.partition_by = partition_by
+        # Each partition gets its own bound, so a flooded partition never
+        # holds up events bound for the others
+        self.dispatcher = PartitionedDispatcher(
+            self._dispatch,
+            concurrency=workers,
+            max_partition=queue_size,
+            on_drop=(lambda item: self.queue.drop()) if overflow == "drop-oldest" else None,
+        )
+        self.dedup = MessageDeduplicator(dedup_window) if dedup_window else None
+        self.reorder = ReorderBuffer(self.queue.put, reorder_window) if reorder_window else None
+        self.ws_url = ws_url
+        self.max_sessions = max_sessions
+        self.handler_latency = handler_latency
+        self.stats_interval = stats_interval
+        # First session, used by subscribe() unless another is given
+        self._ws: EventSubConnection | None = None
+        self._sessions: list[EventSubConnection] = []
+        self._readers: list[asyncio.Task] = []
         self._running = False
 
     async def connect(self) -> str:
@@ -49,92 +138,320 @@ class EventSubListener:
         Returns:
             Session ID for creating subscriptions.
         """
-        self._ws = EventSubWebSocket(self.sdk.http)
-        session_id = await self._ws.connect()
-        print(f"[EventSub] Connected with session ID: {session_id}")
-        return session_id
+        session = await self.open_session()
+        return session.session_id
+
+    async def open_session(self) -> EventSubConnection:
+        """Open another websocket session; read it too if already listening."""
+        session = EventSubConnection(self.sdk.http, url=self.ws_url)
+        session_id = await session.connect()
+        self._sessions.append(session)
+        if self._ws is None:
+            self._ws = session
+        print(f"[EventSub] Connected with session ID: {session_id} ({len(self._sessions)} of {self.max_sessions})")
+        if self._running:
+            self._readers.append(asyncio.create_task(self._read(session)))
+        return session
+
+    async def close_session(self, session: EventSubConnection) -> None:
+        """Close one session; its reader ends once the socket is closed."""
+        if session is self._ws:
+            raise ValueError("Cannot close the first session; use stop()")
+        session_id = session.session_id
+        self._sessions.remove(session)
+        await session.close()
+        print(f"[EventSub] Closed session {session_id} ({len(self._sessions)} of {self.max_sessions})")
 
     async def subscribe(
         self,
         event_type: str,
         version: str,
         condition: dict,
-    ) -> None:
+        session: EventSubConnection | None = None,
+    ) -> EventSubSubscription:
         """Subscribe to an event type.
 
         Args:
             event_type: Event type (e.g., "channel.chat.message")
             version: Subscription version
             condition: Event condition (broadcaster_user_id, etc.)
+            session: Session to subscribe on (default: the first one)
+
+        Returns:
+            The created subscription.
         """
         if not self._ws:
             raise RuntimeError("Not connected. Call connect() first.")
 
-        subscription = await self._ws.subscribe(event_type, version, condition)
+        subscription = await (session or self._ws).subscribe(event_type, version, condition)
         print(f"[EventSub] Subscribed to {event_type}: {subscription.status}")
+        return subscription
+
+    async def subscribe_all(
+        self,
+        subscriptions: list[dict],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        user_id: str | None = None,
+        check_budget: bool = True,
+    ) -> list[dict]:
+        """Subscribe to many event types concurrently.
+
+        Subscriptions fill the open sessions up to Twitch's limit of 300
+        each; more sessions are opened as needed, up to max_sessions, and
+        whatever does not fit is skipped.
 
-    async def listen(self) -> None:
-        """Start listening for events. Runs until stopped."""
+        Args:
+            subscriptions: Configs with type, version and condition
+            concurrency: Maximum subscription requests in flight
+            user_id: User the token belongs to, for cost estimates
+            check_budget: Skip subscriptions that would exceed the
+                account's max_total_cost
+
+        Returns:
+            Per-subscription results (see bootstrap.subscribe_all).
+        """
         if not self._ws:
             raise RuntimeError("Not connected. Call connect() first.")
 
+        budget = await fetch_budget(self.sdk.http) if check_budget else None
+        placed, unplaced = await self._place(subscriptions)
+        results = await subscribe_all(
+            lambda sub: self.subscribe(sub["type"], sub["version"], sub["condition"], session=sub["session"]),
+            placed,
+            concurrency,
+            budget,
+            user_id,
+        )
+        results += [
+            skipped(sub, f"no room: {self.max_sessions} sessions of {MAX_SUBSCRIPTIONS_PER_SESSION} subscriptions")
+            for sub in unplaced
+        ]
+        for result in results:
+            if result["status"] in ("failed", "skipped"):
+                print(f"[EventSub] {result['status'].capitalize()} {result['type']}: {result['error']}")
+        print(f"[EventSub] {summarize(results)}")
+        return results
+
+    async def _place(self, subscriptions: list[dict]) -> tuple[list[dict], list[dict]]:
+        """Assign subscriptions to sessions, opening sessions as needed.
+
+        Returns:
+            (configs with a "session" added, configs that did not fit)
+        """
+        room = sum(MAX_SUBSCRIPTIONS_PER_SESSION - s.subscription_count for s in self._sessions)
+        needed = math.ceil(max(0, len(subscriptions) - room) / MAX_SUBSCRIPTIONS_PER_SESSION)
+        needed = min(needed, self.max_sessions - len(self._sessions))
+        if needed > 0:
+            # Concurrently: each new session must get a subscription within 10s
+            await asyncio.gather(*(self.open_session() for _ in range(needed)))
+
+        placed: list[dict] = []
+        remaining = iter(subscriptions)
+        for session in self._sessions:
+            free = MAX_SUBSCRIPTIONS_PER_SESSION - session.subscription_count
+            while free > 0:
+                sub = next(remaining, None)
+                if sub is None:
+                    break
+                placed.append({**sub, "session": session})
+                free -= 1
+        return placed, list(remaining)
+
+    async def listen(self, *sources: Awaitable[None]) -> None:
+        """Start listening for events on every session. Runs until stopped.
+
+        Args:
+            sources: Other event sources to run alongside the sessions,
+                feeding events through feed() (e.g. WebhookReceiver.serve());
+                with sources, no websocket session is required
+        """
+        if not self._ws and not sources:
+            raise RuntimeError("Not connected. Call connect() first.")
+
         self._running = True
         print("[EventSub] Listening for events... (Ctrl+C to stop)")
 
+        router = asyncio.create_task(self._route())
+        reporter = asyncio.create_task(self._report()) if self.stats_interval else None
+        self._readers = [asyncio.create_task(self._read(session)) for session in self._sessions]
+        self._readers.extend(asyncio.create_task(source) for source in sources)
         try:
-            async for event in self._ws.events():
-                await self._handle_event(event)
+            # Sessions opened while listening add readers; wait for all of them
+            while True:
+                readers = list(self._readers)
+                await asyncio.gather(*readers)
+                if len(self._readers) == len(readers):
+                    break
+            if self.reorder:
+                await self.reorder.flush()
+            await self.queue.join()
         except asyncio.CancelledError:
             print("[EventSub] Listener stopped")
         finally:
             self._running = False
+            background = [router, reporter] if reporter else [router]
+            for task in (*self._readers, *background):
+                task.cancel()
+            await asyncio.gather(*self._readers, *background, return_exceptions=True)
+            if self.reorder:
+                await self.reorder.close()
+            await self.dispatcher.cancel()
+            self.queue.close()
+
+    async def _read(self, session: EventSubConnection) -> None:
+        """Read one session into the shared queue.
+
+        Events from all sessions are merged into one stream (see feed()
+        for the ordering); the reader only timestamps and enqueues them,
+        the dispatcher does the handling.
+        """
+        async for event, frame in session.frames():
+            await self.feed(event, frame)
+
+    async def feed(self, event: dict, frame: str | None = None) -> bool:
+        """Queue an event for the handlers unless it is a redelivery.
+
+        With more than one session open, events pass through the reorder
+        buffer first, so the sessions are merged in message_timestamp
+        order; a single session or webhook source is already in order
+        and is queued directly.
 
-    async def _handle_event(self, event: dict) -> None:
+        Args:
+            event: Notification payload ({"subscription", "event"}) or
+                {"revocation": ...}, with message_id and message_timestamp
+            frame: Raw text of the message the event came from; logged
+                as is instead of serializing the event again
+
+        Returns:
+            False if the event was dropped as a duplicate.
+        """
+        if self.dedup and self.dedup.is_duplicate(event.get("message_id")):
+            return False
+        item = (datetime.utcnow().isoformat(), event, frame if self._log_writer else None)
+        if self.reorder and (len(self._sessions) > 1 or self.reorder.held):
+            await self.reorder.push(event.get("message_timestamp"), item)
+        else:
+            await self.queue.put(item)
+        return True
+
+    async def _route(self) -> None:
+        """Move queued events to their partitions until cancelled.
+
+        Events are taken off the queue straight away; the router only waits
+        when the event's own partition is full (with drop-oldest, that
+        partition discards its oldest event instead), and the backlog then
+        builds up in the queue, where the overflow policy decides.
+        """
+        while True:
+            item = await self.queue.get()
+            await self.dispatcher.submit(item, partition_key(item[1], self.partition_by))
+
+    async def _dispatch(self, item: tuple[str, dict, str | None]) -> None:
+        timestamp, event, frame = item
+        try:
+            await self._handle_event(event, timestamp, frame)
+        finally:
+            self.queue.task_done()
+
+    async def _handle_event(self, event: dict, timestamp: str | None = None, frame: str | None = None) -> None:
         """Handle an incoming event.
 
         Args:
             event: Event payload from WebSocket
+            timestamp: ISO timestamp the event was received (default: now)
+            frame: Raw message text, logged instead of the event if given
         """
-        timestamp = datetime.utcnow().isoformat()
+        timestamp = timestamp or datetime.utcnow().isoformat()
 
-        # Log to file if configured
-        if self.log_file:
-            log_entry = {
+        # Log to file if configured (buffered, written off the event loop)
+        if self._log_writer and frame is not None:
+            self._log_writer.write_frame(timestamp, frame)
+        elif self._log_writer:
+            self._log_writer.write({
                 "timestamp": timestamp,
                 "event": event,
-            }
-            with open(self.log_file, "a") as f:
-                f.write(json.dumps(log_entry) + "\n")
+            })
 
         # Check for revocation
         if "revocation" in event:
             print(f"[EventSub] Subscription revoked: {event['revocation']}")
             return
 
+        if self.event_store:
+            self.event_store.add(timestamp, event)
+
         # Get subscription type
         subscription = event.get("subscription", {})
         event_type = subscription.get("type", "unknown")
         event_data = event.get("event", {})
 
-        # Route to handler
-        handler = get_handler(event_type) or self.handler
-
-        try:
-            # Handlers can be sync or async
-            if asyncio.iscoroutinefunction(handler):
-                await handler(event_type, event_data)
-            else:
-                handler(event_type, event_data)
-        except Exception as e:
-            print(f"[EventSub] Handler error for {event_type}: {e}")
+        # Route to every matching handler, in priority order
+        latency = self.handler_latency
+        for handler in get_handlers(event_type) or self._fallback:
+            started = time.perf_counter() if latency else 0.0
+            try:
+                if handler.is_async:
+                    await handler.func(event_type, event_data)
+                else:
+                    handler.func(event_type, event_data)
+            except Exception as e:
+                print(f"[EventSub] Handler error for {event_type}: {e}")
+            if latency:
+                latency.record(handler.func, time.perf_counter() - started)
+
+    async def _report(self) -> None:
+        """Print a queue stats line every stats_interval seconds."""
+        while True:
+            await asyncio.sleep(self.stats_interval)
+            queue = self.queue.stats()
+            dispatch = self.dispatcher.stats()
+            print(
+                f"[EventSub] Queue {queue['depth']}/{self.queue_size}, {dispatch['pending']} in "
+                f"{dispatch['partitions']} partitions, {dispatch['handled']}/{queue['received']} handled, "
+                f"{queue['dropped']} dropped, {queue['spilled']} spilled, spill pending {queue['spill_pending']}, "
+                f"queue lag avg {queue['avg_lag_ms']}ms max {queue['max_lag_ms']}ms, "
+                f"partition wait avg {dispatch['avg_wait_ms']}ms max {dispatch['max_wait_ms']}ms"
+            )
+
+    def stats(self) -> dict:
+        """Get queue depth, overflow and handler lag counters."""
+        stats = {
+            "workers": self.workers,
+            "queue_size": self.queue_size,
+            "buffered": self.queue.qsize() + self.dispatcher.pending,
+            **self.queue.stats(),
+            "dispatch": self.dispatcher.stats(),
+        }
+        if self._sessions:
+            stats["sessions"] = [session.stats() for session in self._sessions]
+        if self.dedup:
+            stats["dedup"] = self.dedup.stats()
+        if self.reorder:
+            stats["reorder"] = self.reorder.stats()
+        if self._log_writer:
+            stats["log"] = self._log_writer.stats()
+        return stats
 
     async def stop(self) -> None:
         """Stop the listener and close connection."""
         self._running = False
-        if self._ws:
-            await self._ws.close()
-            self._ws = None
-        print("[EventSub] Disconnected")
+        for session in self._sessions:
+            await session.close()
+        self._sessions = []
+        self._ws = None
+        if self._log_writer:
+            await self._log_writer.close()
+        if self.event_store:
+            await self.event_store.close()
+        queue = self.queue.stats()
+        dispatch = self.dispatcher.stats()
+        duplicates = self.dedup.duplicates if self.dedup else 0
+        print(
+            f"[EventSub] Disconnected ({dispatch['handled']}/{queue['received']} events handled, "
+            f"{duplicates} duplicates, {queue['dropped']} dropped, {queue['spilled']} spilled, peak queue {queue['peak_depth']}, "
+            f"avg lag {queue['avg_lag_ms']}ms, max lag {queue['max_lag_ms']}ms, "
+            f"avg partition wait {dispatch['avg_wait_ms']}ms, max {dispatch['max_wait_ms']}ms)"
+        )
 
     async def __aenter__(self) -> "EventSubListener":
         """Async context manager entry."""
@@ -146,9 +463,68 @@ class EventSubListener:
         await self.stop()
 
 
+def default_subscriptions(broadcaster_id: str, user_id: str) -> list[dict]:
+    """Default subscriptions for one channel.
+
+    Args:
+        broadcaster_id: Channel to watch
+        user_id: User the token belongs to (reads chat, moderates follows)
+    """
+    return [
+        {
+            "type": "channel.chat.message",
+            "version": "1",
+            "condition": {
+                "broadcaster_user_id": broadcaster_id,
+                "user_id": user_id,
+            },
+        },
+        {
+            "type": "channel.follow",
+            "version": "2",
+            "condition": {
+                "broadcaster_user_id": broadcaster_id,
+                "moderator_user_id": user_id,
+            },
+        },
+        {
+            "type": "channel.subscribe",
+            "version": "1",
+            "condition": {
+                "broadcaster_user_id": broadcaster_id,
+            },
+        },
+        {
+            "type": "channel.raid",
+            "version": "1",
+            "condition": {
+                "to_broadcaster_user_id": broadcaster_id,
+            },
+        },
+    ]
+
+
 async def run_listener(
     subscriptions: list[dict] | None = None,
     log_file: str | None = None,
+    log_max_bytes: int | None = None,
+    log_rotate_hourly: bool = False,
+    log_compression: str | None = None,
+    store_path: str | None = None,
+    workers: int = 4,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    overflow: str = "block",
+    stats_interval: float | None = DEFAULT_STATS_INTERVAL,
+    partition_by: str | None = "type",
+    dedup_window: float | None = DEFAULT_WINDOW_SECONDS,
+    reorder_window: float | None = DEFAULT_REORDER_WINDOW,
+    ws_url: str | None = None,
+    conduit_id: str | None = None,
+    conduit_shard: str | None = None,
+    conduit_check_interval: float = DEFAULT_CHECK_INTERVAL,
+    webhook_port: int | None = None,
+    webhook_host: str = "127.0.0.1",
+    webhook_callback: str | None = None,
 ) -> None:
     """Run the EventSub listener with default subscriptions.
 
@@ -158,6 +534,33 @@ async def run_listener(
             - version: Subscription version
             - condition: Event condition dict
         log_file: Optional path to log events
+        log_max_bytes: Rotate the log into segments of at most this size
+        log_rotate_hourly: Rotate the log every UTC hour
+        log_compression: Compression for closed segments ("gzip", "zstd",
+            or None); defaults to zstd if installed, else gzip, when rotating
+        store_path: Optional SQLite event store to record events in
+        workers: Maximum events handled at once across partitions
+        queue_size: Events buffered between the websocket and the handlers,
+            and events that may wait in each partition
+        overflow: Queue overflow policy ("block", "drop-oldest" or "spill")
+        stats_interval: Seconds between queue stats lines (None disables them)
+        partition_by: Order events per "type", per event field (e.g.
+            "user_id"), or not at all (None)
+        dedup_window: Seconds message IDs are remembered to drop
+            redelivered notifications (None disables deduplication)
+        reorder_window: Seconds events are held to merge several sessions
+            in message_timestamp order (None: arrival order)
+        ws_url: EventSub WebSocket URL (default: Twitch)
+        conduit_id: Run as one member of this conduit ("new" creates one)
+            instead of subscribing this process's own session
+        conduit_shard: Conduit shard to claim (default: a disabled one,
+            or a new one)
+        conduit_check_interval: Seconds between checks for dead shards
+        webhook_port: Receive webhook messages on this port instead of
+            using a websocket (secret: TWITCH_MCP_WEBHOOK_SECRET)
+        webhook_host: Interface for the webhook receiver
+        webhook_callback: Public HTTPS URL of the receiver; when set,
+            webhook subscriptions are created for it
     """
     # Load .env file if TWITCH_ENV_FILE is set
     env_file = os.getenv("TWITCH_ENV_FILE")
@@ -172,64 +575,80 @@ async def run_listener(
     # Initialize SDK
     sdk = TwitchSDK()
 
-    # Get broadcaster ID from environment or SDK
-    broadcaster_id = os.getenv("TWITCH_BROADCASTER_ID")
-    user_id = os.getenv("TWITCH_USER_ID")
+    # Get broadcaster IDs (comma-separated for several channels) from environment
+    broadcaster_ids = [b.strip() for b in os.getenv("TWITCH_BROADCASTER_ID", "").split(",") if b.strip()]
+    # The token's user; the (first) broadcaster if not set
+    user_id = os.getenv("TWITCH_USER_ID") or (broadcaster_ids[0] if broadcaster_ids else None)
 
     # Default subscriptions if none provided
     if not subscriptions:
-        if not broadcaster_id:
+        if not broadcaster_ids:
             print("[EventSub] No TWITCH_BROADCASTER_ID set, skipping default subscriptions")
             subscriptions = []
         else:
             subscriptions = [
-                {
-                    "type": "channel.chat.message",
-                    "version": "1",
-                    "condition": {
-                        "broadcaster_user_id": broadcaster_id,
-                        "user_id": user_id or broadcaster_id,
-                    },
-                },
-                {
-                    "type": "channel.follow",
-                    "version": "2",
-                    "condition": {
-                        "broadcaster_user_id": broadcaster_id,
-                        "moderator_user_id": user_id or broadcaster_id,
-                    },
-                },
-                {
-                    "type": "channel.subscribe",
-                    "version": "1",
-                    "condition": {
-                        "broadcaster_user_id": broadcaster_id,
-                    },
-                },
-                {
-                    "type": "channel.raid",
-                    "version": "1",
-                    "condition": {
-                        "to_broadcaster_user_id": broadcaster_id,
-                    },
-                },
+                sub
+                for broadcaster_id in broadcaster_ids
+                for sub in default_subscriptions(broadcaster_id, user_id)
             ]
 
+    log_writer = None
+    if log_file:
+        rotating = bool(log_max_bytes or log_rotate_hourly)
+        log_writer = EventLogWriter(
+            log_file,
+            max_segment_bytes=log_max_bytes,
+            rotate_hourly=log_rotate_hourly,
+            compression=(log_compression or default_compression()) if rotating else None,
+        )
+
     try:
-        async with EventSubListener(sdk, log_file=log_file) as listener:
-            # Subscribe to events
-            for sub in subscriptions:
+        event_store = EventStore(store_path) if store_path else None
+        listener = EventSubListener(
+            sdk,
+            log_writer=log_writer,
+            event_store=event_store,
+            workers=workers,
+            queue_size=queue_size,
+            overflow=overflow,
+            stats_interval=stats_interval,
+            partition_by=partition_by,
+            dedup_window=dedup_window,
+            reorder_window=reorder_window,
+            ws_url=ws_url,
+        )
+        if webhook_port is not None:
+            secret = os.getenv("TWITCH_MCP_WEBHOOK_SECRET")
+            if not secret:
+                raise SystemExit("[EventSub] TWITCH_MCP_WEBHOOK_SECRET must be set to receive webhooks")
+            receiver = WebhookReceiver(listener, secret, webhook_host, webhook_port)
+            try:
+                await receiver.start()
+                if webhook_callback:
+                    await receiver.subscribe_all(subscriptions, webhook_callback)
+                await listener.listen(receiver.serve())
+            finally:
+                await listener.stop()
+            return
+
+        async with listener:
+            if conduit_id:
+                if conduit_id == "new":
+                    conduit_id = await create_conduit(sdk.http)
+                    print(f"[EventSub] Created conduit {conduit_id}")
+                member = ConduitMember(listener, conduit_id, conduit_shard, conduit_check_interval)
+                await member.start()
                 try:
-                    await listener.subscribe(
-                        sub["type"],
-                        sub["version"],
-                        sub["condition"],
-                    )
-                except Exception as e:
-                    print(f"[EventSub] Failed to subscribe to {sub['type']}: {e}")
+                    await member.subscribe_all(subscriptions)
+                    await listener.listen()
+                finally:
+                    await member.stop()
+            else:
+                # Subscribe to events (concurrently: Twitch drops idle sessions after 10s)
+                await listener.subscribe_all(subscriptions, user_id=user_id)
 
-            # Listen for events
-            await listener.listen()
+                # Listen for events
+                await listener.listen()
 
     finally:
         await sdk.close()
@@ -245,19 +664,149 @@ def main():
         "-l",
         help="Path to log events (JSON lines format)",
     )
+    parser.add_argument(
+        "--log-max-mb",
+        type=float,
+        help="Rotate the log into compressed segments of at most this many MB",
+    )
+    parser.add_argument(
+        "--log-rotate-hourly",
+        action="store_true",
+        help="Rotate the log into compressed segments every UTC hour",
+    )
+    parser.add_argument(
+        "--log-compression",
+        choices=["gzip", "zstd"],
+        help="Compression for closed log segments (default: zstd if installed, else gzip)",
+    )
+    parser.add_argument(
+        "--store",
+        nargs="?",
+        const=os.environ.get("TWITCH_MCP_EVENT_STORE", str(DEFAULT_STORE_PATH)),
+        help="Record events in a SQLite store queried by twitch_query_events "
+        "(default path: TWITCH_MCP_EVENT_STORE or ~/.cache/twitch-mcp/events.db)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum events handled at once (default: 4)",
+    )
+    parser.add_argument(
+        "--partition-by",
+        default="type",
+        help="Handle events in order per subscription type (type, the default), per event "
+        "field such as user_id, or in no particular order (none)",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=DEFAULT_QUEUE_SIZE,
+        help="Events buffered between the websocket and the handlers, and per partition "
+        f"(default: {DEFAULT_QUEUE_SIZE})",
+    )
+    parser.add_argument(
+        "--overflow",
+        choices=list(OVERFLOW_POLICIES),
+        default="block",
+        help="When the queue is full: pause reading (block), discard the oldest event "
+        "(drop-oldest) or overflow to a temp file (spill). Default: block",
+    )
+    parser.add_argument(
+        "--stats-interval",
+        type=float,
+        default=DEFAULT_STATS_INTERVAL,
+        help=f"Seconds between queue depth and lag lines, 0 to disable (default: {DEFAULT_STATS_INTERVAL:g})",
+    )
+    parser.add_argument(
+        "--dedup-window",
+        type=float,
+        default=DEFAULT_WINDOW_SECONDS,
+        help="Seconds to remember message IDs and drop redelivered notifications "
+        f"(default: {DEFAULT_WINDOW_SECONDS:.0f}, 0 disables)",
+    )
+    parser.add_argument(
+        "--reorder-window",
+        type=float,
+        default=DEFAULT_REORDER_WINDOW,
+        help="Seconds to hold events from several sessions to merge them in message timestamp order "
+        f"(default: {DEFAULT_REORDER_WINDOW:g}, 0 merges in arrival order)",
+    )
+    parser.add_argument(
+        "--ws-url",
+        help="EventSub WebSocket URL, e.g. ws://127.0.0.1:8080/ws for the Twitch CLI mock server",
+    )
     parser.add_argument(
         "--broadcaster",
         "-b",
-        help="Broadcaster user ID (overrides TWITCH_BROADCASTER_ID)",
+        action="append",
+        help="Broadcaster user ID (overrides TWITCH_BROADCASTER_ID). Repeat or separate "
+        "with commas to watch several channels; subscriptions are spread over as many "
+        "websocket sessions as needed",
+    )
+    parser.add_argument(
+        "--conduit",
+        default=os.environ.get("TWITCH_MCP_CONDUIT_ID"),
+        help="Run as one of several listener processes sharing this conduit's events "
+        "(default: TWITCH_MCP_CONDUIT_ID; \"new\" creates a conduit). Needs an app access token",
+    )
+    parser.add_argument(
+        "--conduit-shard",
+        help="Conduit shard to claim (default: a disabled shard, else a new one)",
+    )
+    parser.add_argument(
+        "--conduit-check-interval",
+        type=float,
+        default=DEFAULT_CHECK_INTERVAL,
+        help="Seconds between checks for shards of dead processes to adopt "
+        f"(default: {DEFAULT_CHECK_INTERVAL:.0f})",
+    )
+    parser.add_argument(
+        "--webhook-port",
+        type=int,
+        nargs="?",
+        const=DEFAULT_PORT,
+        help=f"Receive EventSub webhooks on this port (default: {DEFAULT_PORT}) instead of a websocket; "
+        "messages are verified with TWITCH_MCP_WEBHOOK_SECRET",
+    )
+    parser.add_argument(
+        "--webhook-host",
+        default="127.0.0.1",
+        help="Interface for the webhook receiver (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--webhook-callback",
+        help="Public HTTPS URL reaching the webhook receiver (e.g. through a tunnel); "
+        "webhook subscriptions are created for it with the app access token",
     )
     args = parser.parse_args()
 
     # Override env vars if provided
     if args.broadcaster:
-        os.environ["TWITCH_BROADCASTER_ID"] = args.broadcaster
+        os.environ["TWITCH_BROADCASTER_ID"] = ",".join(args.broadcaster)
 
     try:
-        asyncio.run(run_listener(log_file=args.log))
+        asyncio.run(run_listener(
+            log_file=args.log,
+            log_max_bytes=int(args.log_max_mb * 1024 * 1024) if args.log_max_mb else None,
+            log_rotate_hourly=args.log_rotate_hourly,
+            log_compression=args.log_compression,
+            store_path=args.store,
+            workers=args.workers,
+            queue_size=args.queue_size,
+            overflow=args.overflow,
+            stats_interval=args.stats_interval or None,
+            partition_by=None if args.partition_by == "none" else args.partition_by,
+            dedup_window=args.dedup_window or None,
+            reorder_window=args.reorder_window or None,
+            ws_url=args.ws_url,
+            conduit_id=args.conduit,
+            conduit_shard=args.conduit_shard,
+            conduit_check_interval=args.conduit_check_interval,
+            webhook_port=args.webhook_port,
+            webhook_host=args.webhook_host,
+            webhook_callback=args.webhook_callback,
+        ))
     except KeyboardInterrupt:
         print("\n[EventSub] Shutting down...")
 
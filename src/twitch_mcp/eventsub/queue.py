@@ -0,0 +1,201 @@
+"""Bounded event queue between the websocket reader and handler workers."""
+
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from ..codec import dumps, loads
+
+OVERFLOW_POLICIES = ("block", "drop-oldest", "spill")
+DEFAULT_QUEUE_SIZE = 1000
+SPILL_READ_BATCH = 200
+
+
+class _DiskSpill:
+    """FIFO overflow of queue items in a JSON lines file."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.pending = 0
+        self._unwritten: list[str] = []
+        self._file = None
+        self._read_offset = 0
+
+    def append(self, item: Any) -> None:
+        self._unwritten.append(dumps(item) + "\n")
+        self.pending += 1
+
+    def take_unwritten(self) -> list[str]:
+        """Take the lines not yet written (called on the event loop)."""
+        lines, self._unwritten = self._unwritten, []
+        return lines
+
+    def write_and_read(self, lines: list[str], limit: int) -> list[Any]:
+        """Append lines, then read up to limit of the oldest items (runs in a thread)."""
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "w+", encoding="utf-8")
+        if lines:
+            self._file.seek(0, os.SEEK_END)
+            self._file.write("".join(lines))
+            self._file.flush()
+        self._file.seek(self._read_offset)
+        items = []
+        for _ in range(limit):
+            line = self._file.readline()
+            if not line:
+                break
+            items.append(loads(line))
+        self._read_offset = self._file.tell()
+        return items
+
+    def reset(self) -> None:
+        """Truncate the file once everything has been read back (runs in a thread)."""
+        if self._file is not None:
+            self._file.seek(0)
+            self._file.truncate()
+            self._read_offset = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self.path.unlink(missing_ok=True)
+
+
+class EventQueue:
+    """Bounded asyncio queue with an overflow policy and lag metrics.
+
+    Overflow policies when the queue is full:
+        block: put() waits for a free slot (the websocket reader pauses)
+        drop-oldest: the oldest queued item is discarded
+        spill: items overflow to a file and are fed back in order as slots
+            free up; once spilling, new items go behind the spilled ones
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+        overflow: str = "block",
+        spill_path: str | Path | None = None,
+    ):
+        """Initialize the queue.
+
+        Args:
+            maxsize: Maximum items held in memory
+            overflow: "block", "drop-oldest" or "spill"
+            spill_path: Spill file (default: a file in the temp directory)
+        """
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow} (expected one of {', '.join(OVERFLOW_POLICIES)})")
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self._queue: asyncio.Queue = asyncio.Queue(maxsize)
+        self._spill: _DiskSpill | None = None
+        if overflow == "spill":
+            path = Path(spill_path) if spill_path else Path(tempfile.gettempdir()) / f"eventsub-spill-{os.getpid()}.jsonl"
+            self._spill = _DiskSpill(path)
+        self._refill_task: asyncio.Task | None = None
+        self.received = 0
+        self.dropped = 0
+        self.spilled = 0
+        self.blocked = 0
+        self.blocked_seconds = 0.0
+        self.peak_depth = 0
+        self.handled = 0
+        self.lag_total = 0.0
+        self.lag_max = 0.0
+
+    async def put(self, item: Any) -> None:
+        """Add an item, applying the overflow policy if the queue is full."""
+        self.received += 1
+        entry = (time.monotonic(), item)
+        if self._spill is not None and (self._spill.pending or self._queue.full()):
+            self._spill.append(entry)
+            self.spilled += 1
+            if self._refill_task is None or self._refill_task.done():
+                self._refill_task = asyncio.create_task(self._refill())
+        elif self._queue.full() and self.overflow == "drop-oldest":
+            self._queue.get_nowait()
+            self._queue.task_done()
+            self.dropped += 1
+            self._queue.put_nowait(entry)
+        elif self._queue.full():
+            self.blocked += 1
+            started = time.monotonic()
+            await self._queue.put(entry)
+            self.blocked_seconds += time.monotonic() - started
+        else:
+            self._queue.put_nowait(entry)
+        self.peak_depth = max(self.peak_depth, self._queue.qsize())
+
+    async def _refill(self) -> None:
+        """Feed spilled items back into the queue, oldest first."""
+        spill = self._spill
+        while spill.pending:
+            items = await asyncio.to_thread(spill.write_and_read, spill.take_unwritten(), SPILL_READ_BATCH)
+            for enqueued_at, item in items:
+                await self._queue.put((enqueued_at, item))
+                spill.pending -= 1
+            if not spill.pending:
+                await asyncio.to_thread(spill.reset)
+
+    async def get(self) -> Any:
+        """Remove and return the next item, recording how long it waited."""
+        enqueued_at, item = await self._queue.get()
+        lag = time.monotonic() - enqueued_at
+        self.handled += 1
+        self.lag_total += lag
+        self.lag_max = max(self.lag_max, lag)
+        return item
+
+    def task_done(self) -> None:
+        """Mark an item returned by get() as processed."""
+        self._queue.task_done()
+
+    def drop(self) -> None:
+        """Mark an item returned by get() as discarded (drop-oldest downstream)."""
+        self.dropped += 1
+        self._queue.task_done()
+
+    async def join(self) -> None:
+        """Wait until every item, including spilled ones, has been processed."""
+        while True:
+            if self._refill_task is not None and not self._refill_task.done():
+                await self._refill_task
+            await self._queue.join()
+            if not (self._spill and self._spill.pending):
+                return
+
+    def close(self) -> None:
+        """Stop refilling and remove the spill file."""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            self._refill_task = None
+        if self._spill is not None:
+            self._spill.close()
+
+    def qsize(self) -> int:
+        """Items waiting in memory (not counting spilled ones)."""
+        return self._queue.qsize()
+
+    def stats(self) -> dict:
+        """Get depth, overflow and lag counters."""
+        return {
+            "depth": self._queue.qsize(),
+            "peak_depth": self.peak_depth,
+            "max_size": self.maxsize,
+            "overflow": self.overflow,
+            "spill_pending": self._spill.pending if self._spill else 0,
+            "received": self.received,
+            "handled": self.handled,
+            "dropped": self.dropped,
+            "spilled": self.spilled,
+            "blocked": self.blocked,
+            "blocked_seconds": round(self.blocked_seconds, 3),
+            "avg_lag_ms": round(self.lag_total / self.handled * 1000, 2) if self.handled else 0.0,
+            "max_lag_ms": round(self.lag_max * 1000, 2),
+        }
@@ -0,0 +1,167 @@
+"""Reorder stage: merge events from several sessions by message_timestamp.
+
+Each websocket session delivers its own events in order, but sessions are
+read concurrently, so a merge in arrival order interleaves them by network
+timing. The reorder buffer holds each event for up to ``window`` seconds
+and releases held events oldest message_timestamp first: events from
+different sessions that arrive within the window of each other reach the
+queue in timestamp order. An event older than one already released (it
+arrived more than the window late) cannot be put back in order; it is
+released right away and counted as late.
+"""
+
+import asyncio
+import heapq
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable
+
+DEFAULT_REORDER_WINDOW = 0.25
+DEFAULT_MAX_HELD = 1000
+
+
+def _parse(timestamp: str | None) -> datetime | None:
+    if not timestamp:
+        return None
+    try:
+        dt = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)
+
+
+class ReorderBuffer:
+    """Hold events briefly and release them in message_timestamp order.
+
+    push() never holds more than max_held events: beyond that it releases
+    the oldest one itself, waiting on emit, so a full queue still pushes
+    back on the readers. Events without a usable timestamp pass straight
+    through.
+    """
+
+    def __init__(
+        self,
+        emit: Callable[[Any], Awaitable[None]],
+        window: float = DEFAULT_REORDER_WINDOW,
+        max_held: int = DEFAULT_MAX_HELD,
+    ):
+        """Initialize the buffer.
+
+        Args:
+            emit: Coroutine function called with each item, in order
+            window: Longest time in seconds an event is held
+            max_held: Most events held at once
+        """
+        self._emit = emit
+        self.window = window
+        self.max_held = max_held
+        self._heap: list[tuple[datetime, int, Any]] = []
+        # (release deadline, seq) in arrival order; entries already released are skipped
+        self._deadlines: deque[tuple[float, int]] = deque()
+        self._held: set[int] = set()
+        self._seq = 0
+        self._last: datetime | None = None
+        # Releases run one at a time so emit() sees them in order
+        self._lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self.peak_held = 0
+        self.released = 0
+        self.reordered = 0
+        self.late = 0
+
+    @property
+    def held(self) -> int:
+        """Events currently held."""
+        return len(self._held)
+
+    async def push(self, timestamp: str | None, item: Any) -> None:
+        """Hold an item until it can be released in timestamp order.
+
+        Args:
+            timestamp: The event's message_timestamp (ISO, UTC)
+            item: Item passed to emit
+        """
+        key = _parse(timestamp)
+        if key is None or (self._last is not None and key < self._last):
+            if key is not None:
+                self.late += 1
+            async with self._lock:
+                self.released += 1
+                await self._emit(item)
+            return
+        seq = self._seq
+        self._seq += 1
+        heapq.heappush(self._heap, (key, seq, item))
+        if not self._held:
+            self._wakeup.set()
+        self._held.add(seq)
+        self._deadlines.append((time.monotonic() + self.window, seq))
+        self.peak_held = max(self.peak_held, len(self._held))
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+        if len(self._held) > self.max_held:
+            async with self._lock:
+                if len(self._held) > self.max_held:
+                    await self._release_one()
+
+    async def _release_one(self) -> None:
+        """Release the held item with the oldest timestamp (lock held)."""
+        key, seq, item = heapq.heappop(self._heap)
+        self._held.discard(seq)
+        self._skip_released()
+        if self._deadlines and self._deadlines[0][1] < seq:
+            # An earlier arrival is still held: this one overtook it
+            self.reordered += 1
+        self._last = key
+        self.released += 1
+        await self._emit(item)
+
+    def _skip_released(self) -> None:
+        while self._deadlines and self._deadlines[0][1] not in self._held:
+            self._deadlines.popleft()
+
+    async def _run(self) -> None:
+        while True:
+            self._skip_released()
+            if not self._deadlines:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            deadline, seq = self._deadlines[0]
+            delay = deadline - time.monotonic()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            # Release in timestamp order until the overdue event is out
+            async with self._lock:
+                while seq in self._held:
+                    await self._release_one()
+
+    async def flush(self) -> None:
+        """Release everything held, in timestamp order."""
+        async with self._lock:
+            while self._heap:
+                await self._release_one()
+
+    async def close(self) -> None:
+        """Stop the release task, dropping events still held."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        self._heap.clear()
+        self._deadlines.clear()
+        self._held.clear()
+
+    def stats(self) -> dict:
+        """Get hold and reordering counters."""
+        return {
+            "window_seconds": self.window,
+            "held": len(self._held),
+            "peak_held": self.peak_held,
+            "released": self.released,
+            "reordered": self.reordered,
+            "late": self.late,
+        }
@@ -0,0 +1,220 @@
+"""Replay a recorded EventSub log through the registered handlers.
+
+Reads the JSON lines written by ``eventsub-listen --log`` (plain or rotated
+into segments) and feeds every event through an EventSubListener's queue,
+dispatcher and handlers, exactly as if it had arrived on the websocket:
+
+- real time (--speed 1, the default): events keep their recorded spacing;
+- N times faster (--speed N);
+- as fast as possible (--fast): measures the handler path's throughput.
+
+The report gives events per second, how far paced replay fell behind
+schedule, and per-handler latency percentiles.
+
+Usage:
+    eventsub-replay events.jsonl --speed 10
+    eventsub-replay events.jsonl --fast --quiet --json
+"""
+
+import asyncio
+import contextlib
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+from .dispatcher import PartitionBy
+from .latency import HandlerLatency
+from .listener import EventSubListener
+from .queue import DEFAULT_QUEUE_SIZE
+from .segments import iter_log_entries, manifest_path
+
+
+def _seconds(timestamp: str) -> float | None:
+    try:
+        return datetime.fromisoformat(timestamp.replace("Z", "+00:00")).timestamp()
+    except (AttributeError, ValueError):
+        return None
+
+
+async def replay(
+    log_path: str | Path,
+    speed: float | None = 1.0,
+    since: str | None = None,
+    until: str | None = None,
+    workers: int = 4,
+    partition_by: PartitionBy = "type",
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    listener: EventSubListener | None = None,
+) -> dict:
+    """Replay a log through the handlers and report throughput and latency.
+
+    Args:
+        log_path: The --log path given to the listener
+        speed: Replay speed relative to the recording (1.0: real time),
+            or None for as fast as possible
+        since: Skip entries before this ISO timestamp
+        until: Stop after this ISO timestamp
+        workers: Maximum events handled at once across partitions
+        partition_by: How events are ordered (see EventSubListener)
+        queue_size: Events buffered ahead of the handlers
+        listener: Listener to replay into (default: a new one with no log,
+            store or deduplication, so replays leave no trace)
+
+    Returns:
+        Report with events, revocations, per-type counts, elapsed_s,
+        events_per_sec, max_behind_ms (paced replay only) and handlers
+        (per-handler count and p50/p90/p99/max milliseconds).
+    """
+    if speed is not None and speed <= 0:
+        raise ValueError("speed must be positive (or None for as fast as possible)")
+    if listener is None:
+        listener = EventSubListener(
+            None,
+            workers=workers,
+            queue_size=queue_size,
+            partition_by=partition_by,
+            dedup_window=None,
+        )
+    latency = listener.handler_latency = listener.handler_latency or HandlerLatency()
+
+    types: Counter = Counter()
+    revocations = 0
+    max_behind = 0.0
+    loop = asyncio.get_running_loop()
+
+    async def produce() -> None:
+        nonlocal revocations, max_behind
+        origin: tuple[float, float] | None = None  # (recorded, wall clock) of the first event
+        for entry in iter_log_entries(log_path, since, until):
+            event = entry.get("event")
+            if not isinstance(event, dict):
+                continue
+            timestamp = entry.get("timestamp") or ""
+            if speed is not None:
+                recorded = _seconds(timestamp)
+                if recorded is not None:
+                    if origin is None:
+                        origin = (recorded, loop.time())
+                    due = origin[1] + (recorded - origin[0]) / speed
+                    delay = due - loop.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    else:
+                        max_behind = max(max_behind, -delay)
+            if "revocation" in event:
+                revocations += 1
+            else:
+                types[event.get("subscription", {}).get("type", "unknown")] += 1
+            await listener.queue.put((timestamp, event, None))
+
+    started = time.perf_counter()
+    try:
+        await listener.listen(produce())
+    finally:
+        await listener.stop()
+    elapsed = time.perf_counter() - started
+
+    events = sum(types.values()) + revocations
+    return {
+        "events": events,
+        "revocations": revocations,
+        "types": dict(types.most_common()),
+        "speed": speed,
+        "elapsed_s": round(elapsed, 3),
+        "events_per_sec": round(events / elapsed, 1) if elapsed else 0.0,
+        "max_behind_ms": round(max_behind * 1000, 2) if speed is not None else None,
+        "handlers": latency.summary(),
+    }
+
+
+def format_report(report: dict) -> str:
+    """Human-readable replay report."""
+    mode = "as fast as possible" if report["speed"] is None else f"{report['speed']:g}x"
+    lines = [
+        f"Replayed {report['events']} events ({report['revocations']} revocations) at {mode} "
+        f"in {report['elapsed_s']}s: {report['events_per_sec']:,.1f} events/s",
+    ]
+    if report["max_behind_ms"] is not None:
+        lines.append(f"Max behind schedule: {report['max_behind_ms']}ms")
+    if report["types"]:
+        lines.append("Events by type:")
+        lines.extend(f"  {count:>8}  {event_type}" for event_type, count in report["types"].items())
+    if report["handlers"]:
+        lines.append(f"  {'handler':<32}{'calls':>8}{'p50 ms':>10}{'p90 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        for name, h in report["handlers"].items():
+            lines.append(
+                f"  {name:<32}{h['count']:>8}{h['p50_ms']:>10}{h['p90_ms']:>10}{h['p99_ms']:>10}{h['max_ms']:>10}"
+            )
+    return "\n".join(lines)
+
+
+def main():
+    """CLI entry point for eventsub-replay command."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Replay a recorded EventSub log through the handlers")
+    parser.add_argument("log", help="Log path given to eventsub-listen --log (plain or rotated)")
+    pace = parser.add_mutually_exclusive_group()
+    pace.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="Replay speed relative to the recording (default: 1, real time)",
+    )
+    pace.add_argument(
+        "--fast",
+        action="store_true",
+        help="Replay as fast as possible to measure throughput",
+    )
+    parser.add_argument("--since", help="Skip events before this ISO timestamp")
+    parser.add_argument("--until", help="Stop after this ISO timestamp")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Maximum events handled at once (default: 4)",
+    )
+    parser.add_argument(
+        "--partition-by",
+        default="type",
+        help="Handle events in order per type (default), per event field, or not at all (none)",
+    )
+    parser.add_argument(
+        "--quiet",
+        "-q",
+        action="store_true",
+        help="Silence handler output; print only the report",
+    )
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if not Path(args.log).exists() and not manifest_path(args.log).exists():
+        parser.error(f"no log at {args.log}")
+    if args.speed <= 0:
+        parser.error("--speed must be positive (use --fast for as fast as possible)")
+
+    run = replay(
+        args.log,
+        speed=None if args.fast else args.speed,
+        since=args.since,
+        until=args.until,
+        workers=args.workers,
+        partition_by=None if args.partition_by == "none" else args.partition_by,
+    )
+    try:
+        if args.quiet:
+            with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+                report = asyncio.run(run)
+        else:
+            report = asyncio.run(run)
+    except KeyboardInterrupt:
+        sys.exit(130)
+    print(json.dumps(report, indent=2) if args.json else format_report(report))
+
+
+if __name__ == "__main__":
+    main()
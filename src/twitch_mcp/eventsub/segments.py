@@ -0,0 +1,177 @@
+"""Segmented EventSub logs: manifest, compression and reading.
+
+A rotating log ``events.jsonl`` is stored as segments next to it:
+
+    events.20261018T140000.0001.jsonl.gz
+    events.20261018T150000.0002.jsonl.gz
+    events.20261018T153012.0003.jsonl        (segment being written)
+    events.manifest.json
+
+The manifest lists every segment with the timestamps of its first and last
+event, so a reader looking for a time range opens only the segments that
+overlap it. Closed segments are compressed with zstd when the optional
+``zstandard`` package is installed (``pip install twitch-mcp[zstd]``),
+otherwise with gzip.
+"""
+
+import gzip
+import io
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import IO, Iterator
+
+from ..codec import loads
+from .frames import message_event
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+COMPRESSION_SUFFIXES = {"gzip": ".gz", "zstd": ".zst"}
+
+
+def default_compression() -> str:
+    """Best compression available: zstd if installed, else gzip."""
+    return "zstd" if zstandard is not None else "gzip"
+
+
+def manifest_path(log_path: str | Path) -> Path:
+    """Manifest file for a log path (events.jsonl -> events.manifest.json)."""
+    log_path = Path(log_path)
+    return log_path.with_name(f"{log_path.stem}.manifest.json")
+
+
+def segment_path(log_path: str | Path, opened: str, seq: int) -> Path:
+    """Path of a new segment (events.jsonl -> events.<opened>.<seq>.jsonl)."""
+    log_path = Path(log_path)
+    return log_path.with_name(f"{log_path.stem}.{opened}.{seq:04d}{log_path.suffix or '.jsonl'}")
+
+
+def load_manifest(log_path: str | Path) -> list[dict]:
+    """Load the segment list of a log (empty if it has no manifest)."""
+    path = manifest_path(log_path)
+    if not path.exists():
+        return []
+    with open(path) as f:
+        return json.load(f)["segments"]
+
+
+def save_manifest(log_path: str | Path, segments: list[dict]) -> None:
+    """Write the manifest atomically, so readers never see a partial file."""
+    path = manifest_path(log_path)
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        json.dump({"version": 1, "segments": segments}, f, indent=1)
+    os.replace(tmp, path)
+
+
+def compress_file(path: Path, compression: str) -> Path:
+    """Compress a closed segment next to itself and remove the original.
+
+    Returns:
+        Path of the compressed file.
+    """
+    target = path.with_name(path.name + COMPRESSION_SUFFIXES[compression])
+    with open(path, "rb") as src, open(target, "wb") as dst:
+        if compression == "zstd":
+            if zstandard is None:
+                raise RuntimeError("zstd compression requires the zstandard package")
+            zstandard.ZstdCompressor(level=6).copy_stream(src, dst)
+        else:
+            with gzip.GzipFile(fileobj=dst, mode="wb", compresslevel=6) as gz:
+                shutil.copyfileobj(src, gz)
+    path.unlink()
+    return target
+
+
+def open_segment(path: Path) -> IO[str]:
+    """Open a plain, gzip or zstd segment for reading text."""
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        if zstandard is None:
+            raise RuntimeError(f"Reading {path.name} requires the zstandard package")
+        return io.TextIOWrapper(
+            zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True), encoding="utf-8"
+        )
+    return open(path, encoding="utf-8")
+
+
+def scan_segment(path: Path) -> tuple[int, str | None, str | None, int]:
+    """Count the events of a segment left open by a crash.
+
+    Returns:
+        (events, first timestamp, last timestamp, bytes)
+    """
+    events, first, last = 0, None, None
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                timestamp = loads(line).get("timestamp")
+            except ValueError:
+                continue  # torn final line
+            events += 1
+            first = first or timestamp
+            last = timestamp or last
+    return events, first, last, path.stat().st_size
+
+
+def select_segments(segments: list[dict], since: str | None = None, until: str | None = None) -> list[dict]:
+    """Segments whose time range overlaps [since, until] (ISO timestamps)."""
+    selected = []
+    for segment in segments:
+        start, end = segment.get("start"), segment.get("end")
+        if since and end and end < since:
+            continue
+        if until and start and start > until:
+            continue
+        selected.append(segment)
+    return selected
+
+
+def iter_log_entries(
+    log_path: str | Path,
+    since: str | None = None,
+    until: str | None = None,
+) -> Iterator[dict]:
+    """Iterate logged entries ({"timestamp", "event"}) in write order.
+
+    Works for plain logs and rotated logs; for rotated logs only the
+    segments overlapping the time range are opened. Entries logged as raw
+    frames are converted to events.
+
+    Args:
+        log_path: The --log path given to the listener
+        since: Skip entries before this ISO timestamp
+        until: Stop after this ISO timestamp
+    """
+    log_path = Path(log_path)
+    segments = load_manifest(log_path)
+    if segments:
+        paths = [log_path.with_name(s["file"]) for s in select_segments(segments, since, until)]
+    else:
+        paths = [log_path]
+    for path in paths:
+        if not path.exists():
+            continue
+        with open_segment(path) as f:
+            for line in f:
+                try:
+                    entry = loads(line)
+                except ValueError:
+                    continue
+                timestamp = entry.get("timestamp") or ""
+                if since and timestamp < since:
+                    continue
+                if until and timestamp > until:
+                    return
+                if "frame" in entry:
+                    # Raw frame written by EventLogWriter.write_frame()
+                    event = message_event(entry.pop("frame"))
+                    if event is None:
+                        continue
+                    entry["event"] = event
+                yield entry
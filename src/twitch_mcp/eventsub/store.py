@@ -0,0 +1,370 @@
+"""Indexed SQLite store of received EventSub events.
+
+The listener adds every notification it handles; the twitch_query_events
+tool filters and aggregates them by type, user and time range. Rows carry
+the fields queries filter on (event type, timestamp, broadcaster, user,
+amount) as indexed columns, and the full event as JSON.
+
+Inserts are buffered and written in batches from a worker thread, like the
+JSONL log. The database uses WAL mode so the MCP server can query it while
+the listener (a separate process) writes.
+
+The path is read from TWITCH_MCP_EVENT_STORE (default
+~/.cache/twitch-mcp/events.db).
+"""
+
+import asyncio
+import os
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any
+
+from ..codec import dumps, loads
+
+DEFAULT_STORE_PATH = Path.home() / ".cache" / "twitch-mcp" / "events.db"
+DEFAULT_FLUSH_INTERVAL = 0.5
+DEFAULT_MAX_BATCH = 1000
+# Batches kept for retry while inserts fail, before the oldest events are dropped
+MAX_BUFFERED_BATCHES = 10
+
+# Event fields holding the user an event is about, in order of preference
+USER_ID_FIELDS = ("user_id", "chatter_user_id", "from_broadcaster_user_id", "requester_user_id")
+USER_LOGIN_FIELDS = ("user_login", "chatter_user_login", "from_broadcaster_user_login", "requester_user_login")
+BROADCASTER_ID_FIELDS = ("broadcaster_user_id", "to_broadcaster_user_id")
+
+# Numeric field summed by aggregate="sum", per event type
+AMOUNT_FIELDS = {
+    "channel.cheer": "bits",
+    "channel.raid": "viewers",
+    "channel.subscription.gift": "total",
+    "channel.subscription.message": "cumulative_months",
+    "channel.channel_points_custom_reward_redemption.add": "reward.cost",
+    "channel.hype_train.progress": "total",
+    "channel.hype_train.end": "total",
+}
+
+GROUP_BY_COLUMNS = {
+    "event_type": "event_type",
+    "user": "COALESCE(user_login, user_id)",
+    "hour": "substr(timestamp, 1, 13)",
+    "day": "substr(timestamp, 1, 10)",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    message_id TEXT,
+    event_type TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    broadcaster_id TEXT,
+    user_id TEXT,
+    user_login TEXT,
+    amount INTEGER,
+    payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_events_type_time_user ON events (event_type, timestamp, user_id);
+CREATE INDEX IF NOT EXISTS idx_events_user_time ON events (user_id, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_login_time ON events (user_login, timestamp);
+CREATE INDEX IF NOT EXISTS idx_events_time ON events (timestamp);
+"""
+
+
+def _first(data: dict, fields: tuple[str, ...]) -> Any:
+    for field in fields:
+        value = data.get(field)
+        if value:
+            return value
+    return None
+
+
+def _amount(event_type: str, data: dict) -> int | None:
+    path = AMOUNT_FIELDS.get(event_type)
+    if path is None:
+        return None
+    value: Any = data
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value if isinstance(value, int) else None
+
+
+def parse_time(value: str | None) -> str | None:
+    """Parse an ISO timestamp or a relative age ("90s", "15m", "1h", "7d").
+
+    Returns:
+        ISO timestamp (UTC, like the listener's), or None.
+    """
+    if not value:
+        return None
+    units = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+    if value[-1] in units and value[:-1].replace(".", "", 1).isdigit():
+        delta = timedelta(**{units[value[-1]]: float(value[:-1])})
+        return (datetime.now(timezone.utc) - delta).replace(tzinfo=None).isoformat()
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return dt.isoformat()
+
+
+class EventStore:
+    """SQLite event store with buffered inserts and indexed queries."""
+
+    def __init__(
+        self,
+        path: str | Path = DEFAULT_STORE_PATH,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+    ):
+        """Initialize the store.
+
+        Args:
+            path: SQLite file, or ":memory:"
+            max_batch: Flush once this many events are buffered
+            flush_interval: Longest time in seconds an event stays buffered
+        """
+        self.path = str(path)
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._conn: sqlite3.Connection | None = None
+        # One connection shared by the loop (queries) and worker threads (inserts)
+        self._db_lock = threading.Lock()
+        self._buffer: list[tuple] = []
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._closed = False
+        self._flush_lock = asyncio.Lock()
+        self.events_written = 0
+        self.events_dropped = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def add(self, timestamp: str, event: dict) -> None:
+        """Buffer one EventSub notification payload. Never blocks on I/O.
+
+        Args:
+            timestamp: ISO timestamp the event was received
+            event: Notification payload ({"subscription": ..., "event": ...})
+        """
+        subscription = event.get("subscription", {})
+        event_type = subscription.get("type", "unknown")
+        data = event.get("event") or {}
+        self._buffer.append((
+            event.get("message_id"),
+            event_type,
+            timestamp,
+            _first(data, BROADCASTER_ID_FIELDS),
+            _first(data, USER_ID_FIELDS),
+            _first(data, USER_LOGIN_FIELDS),
+            _amount(event_type, data),
+            dumps(event),
+        ))
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        if len(self._buffer) >= self.max_batch:
+            self._wakeup.set()
+
+    async def flush(self) -> None:
+        """Write all buffered events."""
+        async with self._flush_lock:
+            if not self._buffer:
+                return
+            rows, self._buffer = self._buffer, []
+            try:
+                await asyncio.to_thread(self._insert, rows)
+            except Exception as e:
+                # The insert is one transaction: nothing was written, retry on the next flush
+                self._buffer[:0] = rows
+                excess = len(self._buffer) - self.max_batch * MAX_BUFFERED_BATCHES
+                if excess > 0:
+                    del self._buffer[:excess]
+                    self.events_dropped += excess
+                print(f"[EventSub] Event store insert failed, {len(rows)} events kept for retry: {type(e).__name__}: {e}")
+                return
+            self.events_written += len(rows)
+
+    def _insert(self, rows: list[tuple]) -> None:
+        with self._db_lock:
+            db = self._db()
+            with db:
+                db.executemany(
+                    "INSERT INTO events (message_id, event_type, timestamp, broadcaster_id, user_id, user_login, amount, payload)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def close(self) -> None:
+        """Flush buffered events and close the database."""
+        self._closed = True
+        if self._task is not None:
+            self._wakeup.set()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.flush()
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self._closed = False
+
+    def _where(
+        self,
+        event_type: str | None,
+        user: str | None,
+        broadcaster_id: str | None,
+        since: str | None,
+        until: str | None,
+    ) -> tuple[str, list]:
+        clauses: list[str] = []
+        params: list = []
+        if event_type:
+            if event_type.endswith("*"):
+                # Prefix match that can still use the event_type index
+                prefix = event_type[:-1]
+                clauses.append("event_type >= ? AND event_type < ?")
+                params += [prefix, prefix + "\uffff"]
+            else:
+                clauses.append("event_type = ?")
+                params.append(event_type)
+        if user:
+            if user.isdigit():
+                clauses.append("user_id = ?")
+                params.append(user)
+            else:
+                clauses.append("user_login = ?")
+                params.append(user.lower())
+        if broadcaster_id:
+            clauses.append("broadcaster_id = ?")
+            params.append(broadcaster_id)
+        if since:
+            clauses.append("timestamp >= ?")
+            params.append(since)
+        if until:
+            clauses.append("timestamp <= ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(
+        self,
+        event_type: str | None = None,
+        user: str | None = None,
+        broadcaster_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 50,
+    ) -> list[dict]:
+        """Get stored events, newest first.
+
+        Args:
+            event_type: Exact type, or a prefix ending in "*" (e.g. "channel.subscription.*")
+            user: User ID (all digits) or login the event is about
+            broadcaster_id: Broadcaster the event belongs to
+            since: Earliest timestamp (ISO)
+            until: Latest timestamp (ISO)
+            limit: Maximum events returned
+
+        Returns:
+            Rows with timestamp, event_type, user_id, user_login, amount and
+            the event data.
+        """
+        where, params = self._where(event_type, user, broadcaster_id, since, until)
+        sql = (
+            "SELECT timestamp, event_type, user_id, user_login, amount, payload FROM events"
+            f"{where} ORDER BY timestamp DESC LIMIT ?"
+        )
+        with self._db_lock:
+            rows = self._db().execute(sql, [*params, limit]).fetchall()
+        return [
+            {
+                "timestamp": timestamp,
+                "event_type": row_type,
+                "user_id": user_id,
+                "user_login": user_login,
+                "amount": amount,
+                "event": loads(payload).get("event"),
+            }
+            for timestamp, row_type, user_id, user_login, amount, payload in rows
+        ]
+
+    def aggregate(
+        self,
+        group_by: str = "event_type",
+        event_type: str | None = None,
+        user: str | None = None,
+        broadcaster_id: str | None = None,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int = 50,
+    ) -> list[dict]:
+        """Count events and sum their amounts per group, largest count first.
+
+        Args:
+            group_by: "event_type", "user", "hour" or "day"
+            (other filters as in query())
+
+        Returns:
+            Rows with group, count and amount (sum, None if no amounts).
+        """
+        if group_by not in GROUP_BY_COLUMNS:
+            raise ValueError(f"Unknown group_by: {group_by} (expected one of {', '.join(GROUP_BY_COLUMNS)})")
+        column = GROUP_BY_COLUMNS[group_by]
+        where, params = self._where(event_type, user, broadcaster_id, since, until)
+        order = "grp" if group_by in ("hour", "day") else "count DESC, amount DESC"
+        sql = (
+            f"SELECT {column} AS grp, COUNT(*) AS count, SUM(amount) AS amount FROM events"
+            f"{where} GROUP BY grp ORDER BY {order} LIMIT ?"
+        )
+        with self._db_lock:
+            rows = self._db().execute(sql, [*params, limit]).fetchall()
+        return [{"group": group, "count": count, "amount": amount} for group, count, amount in rows]
+
+    def stats(self) -> dict:
+        """Get the number of stored events and their time range."""
+        with self._db_lock:
+            count, first, last = self._db().execute(
+                "SELECT COUNT(*), MIN(timestamp), MAX(timestamp) FROM events"
+            ).fetchone()
+        return {
+            "path": self.path,
+            "events": count,
+            "first": first,
+            "last": last,
+            "buffered": len(self._buffer),
+            "dropped": self.events_dropped,
+        }
+
+
+# Global store instance
+_store: EventStore | None = None
+
+
+def get_event_store() -> EventStore:
+    """Get the global event store, configured from the environment."""
+    global _store
+    if _store is None:
+        _store = EventStore(os.environ.get("TWITCH_MCP_EVENT_STORE", DEFAULT_STORE_PATH))
+    return _store
@@ -0,0 +1,282 @@
+"""EventSub webhook receiver.
+
+A small asyncio HTTP/1.1 server for subscriptions created with a webhook
+transport. Twitch POSTs each message to the callback URL; the receiver:
+
+- verifies Twitch-Eventsub-Message-Signature, the HMAC-SHA256 of message
+  ID + timestamp + raw body under the subscription's secret, with a
+  constant-time compare, and rejects messages older than 10 minutes or
+  dated more than a minute in the future;
+- answers webhook_callback_verification with the challenge;
+- passes notifications and revocations to EventSubListener.feed(), which
+  drops redeliveries (same message ID) and queues the rest for the same
+  handlers, log and event store as the websocket listener.
+
+Connections are kept alive, and responses go out once an event is queued,
+not handled, so slow handlers do not hold up Twitch. Twitch only calls
+HTTPS URLs on port 443: run the receiver behind a TLS-terminating proxy
+or tunnel.
+"""
+
+import asyncio
+import hashlib
+import hmac
+from datetime import datetime, timedelta, timezone
+
+from twitch_sdk.schemas.base import TwitchResponse
+from twitch_sdk.schemas.eventsub import EventSubSubscription
+
+from ..codec import loads
+from .bootstrap import DEFAULT_CONCURRENCY, subscribe_all, summarize
+from .frames import webhook_frame
+
+DEFAULT_PORT = 8080
+MAX_MESSAGE_AGE = timedelta(minutes=10)
+# Clock difference tolerated for messages dated in the future
+MAX_CLOCK_SKEW = timedelta(minutes=1)
+MAX_BODY_BYTES = 1024 * 1024
+MAX_HEADER_BYTES = 16 * 1024
+# Idle keep-alive connections are closed after this many seconds
+KEEPALIVE_TIMEOUT = 75.0
+
+_REASONS = {
+    200: "OK",
+    204: "No Content",
+    400: "Bad Request",
+    403: "Forbidden",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    501: "Not Implemented",
+}
+
+
+def sign(secret: str | bytes, message_id: str, timestamp: str, body: bytes) -> str:
+    """Compute the Twitch-Eventsub-Message-Signature header value."""
+    if isinstance(secret, str):
+        secret = secret.encode()
+    digest = hmac.new(secret, message_id.encode() + timestamp.encode() + body, hashlib.sha256)
+    return "sha256=" + digest.hexdigest()
+
+
+def _parse_timestamp(value: str) -> datetime:
+    # Twitch sends nanoseconds; fromisoformat (3.10) wants exactly 6 digits
+    value = value.replace("Z", "+00:00")
+    head, sep, rest = value.partition(".")
+    if sep:
+        digits = len(rest) - len(rest.lstrip("0123456789"))
+        value = f"{head}.{rest[:digits][:6].ljust(6, '0')}{rest[digits:]}"
+    return datetime.fromisoformat(value)
+
+
+class WebhookReceiver:
+    """HTTP server receiving EventSub webhook messages for a listener."""
+
+    def __init__(
+        self,
+        listener,
+        secret: str,
+        host: str = "127.0.0.1",
+        port: int = DEFAULT_PORT,
+        path: str = "/",
+    ):
+        """Initialize the receiver.
+
+        Args:
+            listener: EventSubListener whose handlers receive the events
+            secret: Secret the webhook subscriptions were created with
+                (10-100 characters)
+            host: Interface to listen on
+            port: Port to listen on (0 picks a free port)
+            path: Callback path; other paths get 404
+        """
+        self.listener = listener
+        # Keyed once; copied per message instead of re-keying
+        self._mac = hmac.new(secret.encode(), digestmod=hashlib.sha256)
+        self.secret = secret
+        self.host = host
+        self.port = port
+        self.path = path
+        self._server: asyncio.AbstractServer | None = None
+        self.requests = 0
+        self.rejected = 0
+        self.challenges = 0
+        self.duplicates = 0
+
+    def verify(self, message_id: str, timestamp: str, body: bytes, signature: str) -> bool:
+        """Check a message's signature and age."""
+        mac = self._mac.copy()
+        mac.update(message_id.encode())
+        mac.update(timestamp.encode())
+        mac.update(body)
+        if not hmac.compare_digest(("sha256=" + mac.hexdigest()).encode(), signature.encode()):
+            return False
+        try:
+            sent = _parse_timestamp(timestamp)
+        except ValueError:
+            return False
+        return -MAX_CLOCK_SKEW <= datetime.now(timezone.utc) - sent <= MAX_MESSAGE_AGE
+
+    async def start(self) -> int:
+        """Start accepting connections.
+
+        Returns:
+            The port listened on.
+        """
+        self._server = await asyncio.start_server(
+            self._serve_connection, self.host, self.port, limit=MAX_HEADER_BYTES
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"[EventSub] Webhook receiver listening on http://{self.host}:{self.port}{self.path}")
+        return self.port
+
+    async def serve(self) -> None:
+        """Serve until cancelled (a source for EventSubListener.listen())."""
+        if self._server is None:
+            await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self) -> None:
+        """Stop accepting connections."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), KEEPALIVE_TIMEOUT)
+                except asyncio.LimitOverrunError:
+                    self._respond(writer, 413, keep_alive=False)
+                    break
+                lines = head[:-4].decode("latin-1").split("\r\n")
+                parts = lines[0].split(" ")
+                if len(parts) != 3:
+                    self._respond(writer, 400, keep_alive=False)
+                    break
+                method, target, version = parts
+                headers = {}
+                for line in lines[1:]:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                keep_alive = headers.get("connection", "").lower() != "close" and version == "HTTP/1.1"
+                if "chunked" in headers.get("transfer-encoding", ""):
+                    self._respond(writer, 501, keep_alive=False)
+                    break
+                length = int(headers.get("content-length") or 0)
+                if length > MAX_BODY_BYTES:
+                    self._respond(writer, 413, keep_alive=False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+
+                status, content = await self._handle(method, target, headers, body)
+                self._respond(writer, status, content, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def _respond(self, writer: asyncio.StreamWriter, status: int, content: bytes = b"", keep_alive: bool = True) -> None:
+        writer.write(
+            f"HTTP/1.1 {status} {_REASONS[status]}\r\n"
+            f"Content-Length: {len(content)}\r\n"
+            "Content-Type: text/plain\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode() + content
+        )
+
+    async def _handle(self, method: str, target: str, headers: dict, body: bytes) -> tuple[int, bytes]:
+        """Handle one request; returns (status, response body)."""
+        self.requests += 1
+        if target.split("?", 1)[0] != self.path:
+            return 404, b""
+        if method != "POST":
+            return 405, b""
+
+        message_id = headers.get("twitch-eventsub-message-id", "")
+        timestamp = headers.get("twitch-eventsub-message-timestamp", "")
+        signature = headers.get("twitch-eventsub-message-signature", "")
+        if not self.verify(message_id, timestamp, body, signature):
+            self.rejected += 1
+            return 403, b""
+
+        try:
+            payload = loads(body)
+        except ValueError:
+            return 400, b""
+        if not isinstance(payload, dict):
+            return 400, b""
+        message_type = headers.get("twitch-eventsub-message-type")
+
+        if message_type == "webhook_callback_verification":
+            self.challenges += 1
+            subscription = payload.get("subscription", {})
+            print(f"[EventSub] Webhook verified for {subscription.get('type')} ({subscription.get('id')})")
+            return 200, payload.get("challenge", "").encode()
+        if message_type == "notification":
+            event = payload
+        elif message_type == "revocation":
+            event = {"revocation": payload}
+        else:
+            return 204, b""
+
+        event["message_id"] = message_id
+        event["message_timestamp"] = timestamp
+        frame = webhook_frame(message_id, message_type, timestamp, body.decode())
+        if not await self.listener.feed(event, frame):
+            self.duplicates += 1
+        return 204, b""
+
+    async def subscribe_all(
+        self,
+        subscriptions: list[dict],
+        callback: str,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> list[dict]:
+        """Create webhook subscriptions pointing at this receiver (app access token).
+
+        The receiver must be reachable at callback (and started) first:
+        Twitch verifies each subscription by sending a challenge.
+
+        Args:
+            subscriptions: Configs with type, version and condition
+            callback: Public HTTPS URL that reaches this receiver
+            concurrency: Maximum subscription requests in flight
+
+        Returns:
+            Per-subscription results (see bootstrap.subscribe_all).
+        """
+        http = self.listener.sdk.http
+
+        async def subscribe(sub: dict) -> EventSubSubscription:
+            response = await http.post_app("/eventsub/subscriptions", data={
+                "type": sub["type"],
+                "version": sub["version"],
+                "condition": sub["condition"],
+                "transport": {"method": "webhook", "callback": callback, "secret": self.secret},
+            })
+            return TwitchResponse[EventSubSubscription].model_validate(response).data[0]
+
+        results = await subscribe_all(subscribe, subscriptions, concurrency)
+        for result in results:
+            if result["status"] == "failed":
+                print(f"[EventSub] Failed {result['type']}: {result['error']}")
+        print(f"[EventSub] Webhook {summarize(results)}")
+        return results
+
+    def stats(self) -> dict:
+        """Get request, rejection and duplicate counters."""
+        return {
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "challenges": self.challenges,
+            "duplicates": self.duplicates,
+        }
@@ -0,0 +1,252 @@
+"""EventSub WebSocket connection used by the listener.
+
+Besides keeping message metadata, the connection survives the two ways a
+session ends:
+
+- session_reconnect (Twitch moving the session to another edge): the new
+  reconnect_url is opened while the old socket keeps delivering. Once the
+  new session's welcome arrives, the old socket is drained until Twitch
+  closes it, and the drained messages are yielded before anything from the
+  new socket. Subscriptions carry over to the new session.
+- Connection loss (socket closed, or no message or keepalive in time): the
+  session and its subscriptions are gone. The connection reconnects with
+  exponential backoff and subscribes again to everything it had, then
+  calls its on_reconnect hook (conduit mode assigns the new session to
+  its shard there).
+"""
+
+import asyncio
+import itertools
+import random
+from collections import deque
+from typing import AsyncGenerator, Awaitable, Callable
+
+import websockets
+from twitch_sdk.endpoints.eventsub import EventSubWebSocket
+from twitch_sdk.schemas.eventsub import EventSubSubscription, WebSocketWelcome
+
+from ..codec import loads
+from .bootstrap import subscribe_all, summarize
+from .frames import message_event
+
+# Twitch limits per client ID and user: 300 enabled subscriptions per
+# session, 3 sessions with enabled subscriptions
+MAX_SUBSCRIPTIONS_PER_SESSION = 300
+MAX_SESSIONS = 3
+RECONNECT_BASE_DELAY = 1.0
+RECONNECT_MAX_DELAY = 60.0
+WELCOME_TIMEOUT = 10.0
+# Longest wait for the next message while draining a migrated session
+DRAIN_TIMEOUT = 2.0
+
+_CONNECTION_ERRORS = (OSError, asyncio.TimeoutError, websockets.WebSocketException, RuntimeError)
+
+
+class EventSubConnection(EventSubWebSocket):
+    """EventSubWebSocket that keeps message metadata and reconnects.
+
+    The SDK yields notification payloads without their metadata. This adds
+    ``message_id`` and ``message_timestamp`` to every payload so the
+    listener can drop redelivered notifications, and logs and the event
+    store record them.
+    """
+
+    def __init__(
+        self,
+        client,
+        url: str | None = None,
+        max_reconnect_attempts: int | None = None,
+    ):
+        """Initialize the connection.
+
+        Args:
+            client: TwitchHTTPClient for creating subscriptions
+            url: WebSocket URL (default: Twitch's EventSub endpoint)
+            max_reconnect_attempts: Give up after this many failed attempts
+                to reconnect a lost session (default: keep trying)
+        """
+        super().__init__(client)
+        self.url = url or self.EVENTSUB_WSS_URL
+        self.max_reconnect_attempts = max_reconnect_attempts
+        # (type, version, condition) of every subscription, for resubscribing
+        self._specs: list[tuple[str, str, dict]] = []
+        self._pending: deque[str] = deque()
+        self._closing = False
+        # Awaited with the connection after a lost session was replaced
+        self.on_reconnect: Callable[["EventSubConnection"], Awaitable[None]] | None = None
+        self.migrations = 0
+        self.reconnects = 0
+
+    async def _open(self, url: str):
+        """Open a socket and wait for its session_welcome."""
+        ws = await websockets.connect(url)
+        try:
+            message = loads(await asyncio.wait_for(ws.recv(), WELCOME_TIMEOUT))
+            if message.get("metadata", {}).get("message_type") != "session_welcome":
+                raise RuntimeError(f"Expected session_welcome, got: {message}")
+        except BaseException:
+            await ws.close()
+            raise
+        return ws, WebSocketWelcome.model_validate(message["payload"]["session"])
+
+    def _use(self, ws, welcome: WebSocketWelcome) -> None:
+        self._ws = ws
+        self._session_id = welcome.session_id
+        self._keepalive_timeout = welcome.keepalive_timeout_seconds
+
+    async def connect(self) -> str:
+        """Connect to EventSub WebSocket.
+
+        Returns:
+            Session ID for creating subscriptions.
+        """
+        self._closing = False
+        self._use(*await self._open(self.url))
+        return self._session_id
+
+    async def subscribe(self, event_type: str, version: str, condition: dict) -> EventSubSubscription:
+        """Subscribe to an event type, remembering it for reconnects."""
+        subscription = await super().subscribe(event_type, version, condition)
+        self._specs.append((event_type, version, condition))
+        return subscription
+
+    @property
+    def subscription_count(self) -> int:
+        """Number of subscriptions on this session."""
+        return len(self._specs)
+
+    async def events(self) -> AsyncGenerator[dict, None]:
+        """Yield notification payloads ({"subscription", "event"}) and
+        revocations ({"revocation": ...}), each with message_id and
+        message_timestamp, until close() is called."""
+        async for event, _ in self.frames():
+            yield event
+
+    async def frames(self) -> AsyncGenerator[tuple[dict, str], None]:
+        """Like events(), yielding (event, frame) with the frame's raw text
+        too, so it can be logged without serializing the event again."""
+        if not self._ws:
+            raise RuntimeError("Not connected. Call connect() first.")
+
+        while self._ws is not None:
+            if self._pending:
+                raw_message = self._pending.popleft()
+            else:
+                try:
+                    raw_message = await self._recv(self._keepalive_timeout + 10)
+                except (asyncio.TimeoutError, websockets.ConnectionClosed):
+                    if self._closing:
+                        return
+                    await self._recover()
+                    continue
+
+            message = loads(raw_message)
+            event = message_event(message)
+            if event is not None:
+                yield event, raw_message
+            elif message.get("metadata", {}).get("message_type") == "session_reconnect":
+                await self._migrate(message.get("payload", {}).get("session", {}).get("reconnect_url"))
+            # else: session_keepalive
+
+    async def _recv(self, timeout: float) -> str:
+        """Receive a message, raising asyncio.TimeoutError after timeout.
+
+        Unlike asyncio.wait_for before Python 3.12, never swallows a
+        cancellation that arrives as the message does: under a steady
+        stream of messages that would make the reader impossible to stop.
+        """
+        recv = asyncio.ensure_future(self._ws.recv())
+        try:
+            done, _ = await asyncio.wait((recv,), timeout=timeout)
+        except asyncio.CancelledError:
+            recv.cancel()
+            raise
+        if not done:
+            recv.cancel()
+            raise asyncio.TimeoutError
+        return recv.result()
+
+    async def _migrate(self, url: str | None) -> None:
+        """Move to the session at reconnect_url without losing messages."""
+        if not url:
+            return
+        print("[EventSub] Session reconnect requested, migrating...")
+        try:
+            ws, welcome = await self._open(url)
+        except _CONNECTION_ERRORS as e:
+            # Keep reading the old socket; if it closes, _recover() takes over
+            print(f"[EventSub] Migration failed: {e}")
+            return
+        old = self._ws
+        self._pending.extend(await self._drain(old))
+        self._use(ws, welcome)
+        self.migrations += 1
+        print(f"[EventSub] Migrated to session {self._session_id}")
+
+    async def _drain(self, ws) -> list[str]:
+        """Read what is left on a migrated socket until Twitch closes it."""
+        messages = []
+        try:
+            while True:
+                messages.append(await asyncio.wait_for(ws.recv(), DRAIN_TIMEOUT))
+        except (asyncio.TimeoutError, websockets.ConnectionClosed):
+            pass
+        await ws.close()
+        return messages
+
+    async def _recover(self) -> None:
+        """Reconnect a lost session with exponential backoff, then resubscribe."""
+        old, self._ws = self._ws, None
+        if old is not None:
+            await old.close()
+        for attempt in itertools.count():
+            if self.max_reconnect_attempts is not None and attempt >= self.max_reconnect_attempts:
+                raise ConnectionError(f"EventSub session lost; gave up after {attempt} reconnect attempts")
+            delay = min(RECONNECT_MAX_DELAY, RECONNECT_BASE_DELAY * 2 ** attempt)
+            print(f"[EventSub] Connection lost, reconnecting in {delay:g}s (attempt {attempt + 1})")
+            # Jitter so many sessions do not reconnect in lockstep
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            try:
+                self._use(*await self._open(self.url))
+                break
+            except _CONNECTION_ERRORS as e:
+                print(f"[EventSub] Reconnect failed: {e}")
+        self.reconnects += 1
+        print(f"[EventSub] Reconnected with session ID: {self._session_id}")
+        if self._specs:
+            await self._resubscribe()
+        if self.on_reconnect is not None:
+            try:
+                await self.on_reconnect(self)
+            except Exception as e:
+                print(f"[EventSub] Reconnect hook failed: {e}")
+
+    async def _resubscribe(self) -> None:
+        """Subscribe the new session to everything the lost one had."""
+        specs, self._specs = self._specs, []
+        self._subscriptions = []
+        results = await subscribe_all(
+            lambda sub: self.subscribe(sub["type"], sub["version"], sub["condition"]),
+            [{"type": t, "version": v, "condition": c} for t, v, c in specs],
+        )
+        for result in results:
+            if result["status"] == "failed":
+                print(f"[EventSub] Failed to resubscribe to {result['type']}: {result['error']}")
+                # Still wanted: retried on the next reconnect
+                self._specs.append((result["type"], result["version"], result["condition"]))
+        print(f"[EventSub] Resubscribed: {summarize(results)}")
+
+    async def close(self) -> None:
+        """Close the WebSocket connection."""
+        self._closing = True
+        self._pending.clear()
+        await super().close()
+
+    def stats(self) -> dict:
+        """Get session and reconnect counters."""
+        return {
+            "session_id": self._session_id,
+            "subscriptions": len(self._specs),
+            "migrations": self.migrations,
+            "reconnects": self.reconnects,
+        }
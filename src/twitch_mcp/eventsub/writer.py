@@ -0,0 +1,330 @@
+"""Buffered JSON lines writer for the EventSub event log."""
+
+import asyncio
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO
+
+from ..codec import dumps
+from .segments import compress_file, load_manifest, save_manifest, scan_segment, segment_path
+
+DEFAULT_MAX_BATCH = 500
+DEFAULT_MAX_BUFFER_BYTES = 256 * 1024
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+
+def frame_line(timestamp: str, frame: str) -> str:
+    """Log line for a raw frame: ``{"timestamp": ..., "frame": <frame>}``."""
+    if "\n" in frame or "\r" in frame:
+        # Whitespace between tokens (never inside JSON strings): keep one entry per line
+        frame = frame.replace("\r", " ").replace("\n", " ")
+    return '{"timestamp":"' + timestamp + '","frame":' + frame + "}\n"
+
+
+class _Segment:
+    """Segment being filled (tracked on the event loop)."""
+
+    __slots__ = ("path", "hour", "start", "end", "events", "bytes")
+
+    def __init__(self, path: Path, hour: str | None, start: str | None):
+        self.path = path
+        self.hour = hour
+        self.start = start
+        self.end = start
+        self.events = 0
+        self.bytes = 0
+
+
+class _OpenSegment:
+    """Buffer marker: start writing to a new segment."""
+
+    __slots__ = ("path", "start")
+
+    def __init__(self, segment: _Segment):
+        self.path = segment.path
+        self.start = segment.start
+
+
+class _CloseSegment:
+    """Buffer marker: close, compress and record the current segment."""
+
+    __slots__ = ("path", "end", "events", "bytes")
+
+    def __init__(self, segment: _Segment):
+        self.path = segment.path
+        self.end = segment.end
+        self.events = segment.events
+        self.bytes = segment.bytes
+
+
+class EventLogWriter:
+    """Append-only JSONL writer that batches lines and writes off the event loop.
+
+    write() only serializes the entry into an in-memory buffer. A background
+    task flushes the buffer in one write when it reaches max_batch lines or
+    max_buffer_bytes, or flush_interval seconds after the first buffered
+    line. The file is opened once and all file I/O runs in a worker thread.
+    Call close() on shutdown to flush what is left.
+
+    With max_segment_bytes or rotate_hourly set, the log is split into
+    segments (see segments.py): a new segment starts when the current one
+    would exceed max_segment_bytes or the UTC hour changes, and closed
+    segments are compressed and recorded in the manifest.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_buffer_bytes: int = DEFAULT_MAX_BUFFER_BYTES,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+        max_segment_bytes: int | None = None,
+        rotate_hourly: bool = False,
+        compression: str | None = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            path: Log file path (appended to; the base name for segments
+                when rotating)
+            max_batch: Flush once this many lines are buffered
+            max_buffer_bytes: Flush once the buffer reaches this size
+            flush_interval: Longest time in seconds a line stays buffered
+            max_segment_bytes: Rotate before a segment exceeds this size
+            rotate_hourly: Rotate when the UTC hour changes
+            compression: Compression for closed segments: "gzip", "zstd" or
+                None to keep them plain
+        """
+        self.path = Path(path)
+        self.max_batch = max_batch
+        self.max_buffer_bytes = max_buffer_bytes
+        self.flush_interval = flush_interval
+        self.max_segment_bytes = max_segment_bytes
+        self.rotate_hourly = rotate_hourly
+        self.compression = compression
+        self.rotating = bool(max_segment_bytes or rotate_hourly)
+        self._buffer: list[str | _OpenSegment | _CloseSegment] = []
+        self._buffer_lines = 0
+        self._buffer_bytes = 0
+        self._file: IO[str] | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self._closed = False
+        self._lock = asyncio.Lock()
+        # Manifest entries are only touched from the I/O thread after this
+        self._segments: list[dict] = load_manifest(self.path) if self.rotating else []
+        self._segment: _Segment | None = None
+        self._next_seq = len(self._segments) + 1
+        self._recovered = False
+        self.lines_written = 0
+        self.batches_written = 0
+        self.bytes_written = 0
+        self.segments_closed = 0
+        self.lines_dropped = 0
+
+    def write(self, entry: dict) -> None:
+        """Buffer one entry. Never blocks on file I/O."""
+        self._append(dumps(entry) + "\n", entry.get("timestamp"))
+
+    def write_frame(self, timestamp: str, frame: str) -> None:
+        """Buffer a received EventSub frame as is, without re-serializing it.
+
+        The line is ``{"timestamp": ..., "frame": <frame>}``;
+        segments.iter_log_entries() turns it back into an event entry.
+        """
+        self._append(frame_line(timestamp, frame), timestamp)
+
+    def _append(self, line: str, timestamp: str | None) -> None:
+        if self.rotating:
+            self._route(timestamp, len(line))
+        self._buffer.append(line)
+        self._buffer_lines += 1
+        self._buffer_bytes += len(line)
+        if self._task is None:
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+        if self._buffer_lines >= self.max_batch or self._buffer_bytes >= self.max_buffer_bytes:
+            self._wakeup.set()
+
+    def _route(self, timestamp: str | None, size: int) -> None:
+        """Start a new segment first if this line would cross a rotation boundary."""
+        now = datetime.now(timezone.utc)
+        hour = now.strftime("%Y%m%dT%H") if self.rotate_hourly else None
+        segment = self._segment
+        if segment is not None and segment.events and (
+            hour != segment.hour
+            or (self.max_segment_bytes and segment.bytes + size > self.max_segment_bytes)
+        ):
+            self._buffer.append(_CloseSegment(segment))
+            segment = None
+        if segment is None:
+            path = segment_path(self.path, now.strftime("%Y%m%dT%H%M%S"), self._next_seq)
+            self._next_seq += 1
+            segment = self._segment = _Segment(path, hour, timestamp)
+            self._buffer.append(_OpenSegment(segment))
+        segment.events += 1
+        segment.bytes += size
+        segment.end = timestamp or segment.end
+
+    async def flush(self) -> None:
+        """Write everything buffered so far."""
+        # Serialize flushes so batches reach the file in order
+        async with self._lock:
+            if not self._buffer:
+                return
+            items, self._buffer = self._buffer, []
+            lines, size = self._buffer_lines, self._buffer_bytes
+            self._buffer_lines = self._buffer_bytes = 0
+            try:
+                await asyncio.to_thread(self._write_sync, items)
+            except Exception as e:
+                # Part of the batch may be on disk, so it is not retried (no duplicates)
+                self.lines_dropped += lines
+                print(f"[EventSub] Event log write failed, {lines} lines dropped: {type(e).__name__}: {e}")
+                await asyncio.to_thread(self._reset_file)
+                if self.rotating:
+                    self._restart_segment()
+                return
+            self.lines_written += lines
+            self.batches_written += 1
+            self.bytes_written += size
+
+    def _reset_file(self) -> None:
+        """Start over after a failed batch (runs in a thread).
+
+        The file is reopened on the next write. When rotating, lines still
+        buffered go to a new segment, and segments the failed batch left
+        unfinished are closed like after a crash.
+        """
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
+        if self.rotating:
+            self._recovered = False
+
+    def _restart_segment(self) -> None:
+        """Route buffered lines to a new segment (on the event loop)."""
+        items, self._buffer = self._buffer, []
+        self._segment = None
+        for item in items:
+            if isinstance(item, str):
+                # Receive timestamps are not kept per line: the segment's range stays open
+                self._route(None, len(item))
+                self._buffer.append(item)
+
+    def _write_sync(self, items: list) -> None:
+        if self.rotating and not self._recovered:
+            self._recover_open_segments()
+        pending: list[str] = []
+        for item in items:
+            if isinstance(item, str):
+                pending.append(item)
+                continue
+            if pending:
+                self._write_lines("".join(pending))
+                pending = []
+            if isinstance(item, _OpenSegment):
+                self._open_segment(item)
+            else:
+                self._close_segment(item)
+        if pending:
+            self._write_lines("".join(pending))
+
+    def _write_lines(self, data: str) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "a", encoding="utf-8")
+        self._file.write(data)
+        self._file.flush()
+
+    def _open_segment(self, marker: _OpenSegment) -> None:
+        if self._file is not None:
+            self._file.close()
+        marker.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(marker.path, "a", encoding="utf-8")
+        self._segments.append({
+            "file": marker.path.name,
+            "start": marker.start,
+            "end": None,
+            "events": None,
+            "bytes": None,
+        })
+        save_manifest(self.path, self._segments)
+
+    def _close_segment(self, marker: _CloseSegment) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        path = compress_file(marker.path, self.compression) if self.compression else marker.path
+        self._finish_entry(marker.path.name, path.name, marker.end, marker.events, marker.bytes)
+        save_manifest(self.path, self._segments)
+        self.segments_closed += 1
+
+    def _finish_entry(self, name: str, file: str, end: str | None, events: int, size: int) -> None:
+        for entry in reversed(self._segments):
+            if entry["file"] == name:
+                entry.update(file=file, end=end, events=events, bytes=size)
+                return
+
+    def _recover_open_segments(self) -> None:
+        """Close segments left open by a run that did not shut down cleanly."""
+        self._recovered = True
+        changed = False
+        for entry in self._segments:
+            path = self.path.with_name(entry["file"])
+            if entry["events"] is not None or not path.exists():
+                continue
+            events, start, end, size = scan_segment(path)
+            entry["start"] = entry["start"] or start
+            if self.compression:
+                path = compress_file(path, self.compression)
+            self._finish_entry(entry["file"], path.name, end, events, size)
+            changed = True
+        if changed:
+            save_manifest(self.path, self._segments)
+
+    async def _run(self) -> None:
+        while not self._closed:
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+            await self.flush()
+
+    async def close(self) -> None:
+        """Flush remaining lines, stop the background task and close the file.
+
+        When rotating, the current segment is closed (and compressed) too.
+        A later write() starts over, reopening the file or a new segment.
+        """
+        self._closed = True
+        if self._task is not None:
+            self._wakeup.set()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._segment is not None:
+            self._buffer.append(_CloseSegment(self._segment))
+            self._segment = None
+        await self.flush()
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+        self._closed = False
+
+    def stats(self) -> dict:
+        """Get write counters."""
+        return {
+            "buffered": self._buffer_lines,
+            "lines_written": self.lines_written,
+            "batches_written": self.batches_written,
+            "bytes_written": self.bytes_written,
+            "segments_closed": self.segments_closed,
+            "lines_dropped": self.lines_dropped,
+        }
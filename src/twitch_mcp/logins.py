@@ -0,0 +1,276 @@
+"""Persistent login <-> user ID index.
+
+Most Helix endpoints take numeric user IDs, while agents usually know login
+names. The index keeps every user seen by twitch_get_users or
+twitch_get_chatters in a local SQLite file, so logins can be resolved
+without another Helix call. Tools accept ``broadcaster_login`` (and
+``moderator_login``, ``user_login``, ...) in place of the matching ID field;
+the server resolves them through the index before the handler runs.
+
+Entries older than the max age are refreshed from Helix on the next lookup,
+since logins can be renamed (IDs never change).
+
+Configured from the environment:
+    TWITCH_MCP_LOGIN_INDEX_PATH: SQLite file (default
+        ~/.cache/twitch-mcp/logins.db, ":memory:" to keep it in memory)
+    TWITCH_MCP_LOGIN_MAX_AGE: Seconds before an entry is refreshed
+        (default 7 days)
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable
+
+if TYPE_CHECKING:
+    from twitch_sdk import TwitchSDK
+
+
+DEFAULT_INDEX_PATH = Path.home() / ".cache" / "twitch-mcp" / "logins.db"
+DEFAULT_MAX_AGE = 7 * 24 * 3600
+
+# ID fields that may be given as a login instead, and the login field name
+LOGIN_FIELDS: dict[str, str] = {
+    "broadcaster_id": "broadcaster_login",
+    "from_broadcaster_id": "from_broadcaster_login",
+    "moderator_id": "moderator_login",
+    "to_broadcaster_id": "to_broadcaster_login",
+    "user_id": "user_login",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    id TEXT PRIMARY KEY,
+    login TEXT NOT NULL UNIQUE,
+    display_name TEXT,
+    updated_at REAL NOT NULL
+)
+"""
+
+
+def add_login_alternatives(schema: dict) -> tuple[dict, dict[str, dict]]:
+    """Add ``*_login`` alternatives for the user ID fields of a tool schema.
+
+    An ID field listed as required is no longer required by the schema; the
+    server checks that either the ID or the login is given.
+
+    Returns:
+        The new schema, and login field -> {"id": ID field, "required": bool}
+    """
+    properties = schema.get("properties", {})
+    required = schema.get("required", [])
+    logins: dict[str, dict] = {}
+    new_properties: dict[str, dict] = {}
+    for field, spec in properties.items():
+        new_properties[field] = spec
+        login_field = LOGIN_FIELDS.get(field)
+        if login_field is None or login_field in properties:
+            continue
+        is_required = field in required
+        note = f" (one of {field}/{login_field} is required)" if is_required else ""
+        if spec.get("type") == "string":
+            new_properties[login_field] = {"type": "string", "description": f"Login name, in place of {field}{note}"}
+        elif spec.get("type") == "array" and spec.get("items", {}).get("type") == "string":
+            new_properties[login_field] = {
+                "type": "array",
+                "items": {"type": "string"},
+                "description": f"Login names, in place of {field}{note}",
+            }
+        else:
+            continue
+        logins[login_field] = {"id": field, "required": is_required}
+    if not logins:
+        return schema, {}
+    new_schema = dict(schema, properties=new_properties)
+    still_required = [f for f in required if not any(spec["id"] == f for spec in logins.values())]
+    if still_required:
+        new_schema["required"] = still_required
+    else:
+        new_schema.pop("required", None)
+    return new_schema, logins
+
+
+class LoginIndex:
+    """SQLite-backed login <-> user ID index with staleness refresh."""
+
+    def __init__(self, path: str | Path = DEFAULT_INDEX_PATH, max_age: float = DEFAULT_MAX_AGE):
+        """Initialize the index.
+
+        Args:
+            path: SQLite file, or ":memory:"
+            max_age: Seconds before an entry is refreshed from Helix
+        """
+        self.path = str(path)
+        self.max_age = max_age
+        self._conn: sqlite3.Connection | None = None
+        self.hits = 0
+        self.misses = 0
+        self.refreshed = 0
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def record(self, users: Iterable[tuple[str, str, str | None]]) -> int:
+        """Store (id, login, display_name) rows, replacing older entries.
+
+        A login now held by a different ID (after a rename) is reassigned.
+
+        Returns:
+            Number of rows stored.
+        """
+        now = time.time()
+        rows = [(user_id, login.lower(), display_name, now) for user_id, login, display_name in users if user_id and login]
+        if not rows:
+            return 0
+        db = self._db()
+        with db:
+            db.executemany("DELETE FROM users WHERE login = ? AND id != ?", [(r[1], r[0]) for r in rows])
+            db.executemany(
+                "INSERT OR REPLACE INTO users (id, login, display_name, updated_at) VALUES (?, ?, ?, ?)", rows
+            )
+        return len(rows)
+
+    def lookup(self, logins: Iterable[str]) -> dict[str, str]:
+        """Get fresh IDs for logins already in the index (no Helix calls).
+
+        Returns:
+            Lowercased login -> user ID, for fresh entries only.
+        """
+        wanted = list({login.lower() for login in logins})
+        if not wanted:
+            return {}
+        cutoff = time.time() - self.max_age
+        found: dict[str, str] = {}
+        db = self._db()
+        # Stay well under SQLite's bound-parameter limit
+        for i in range(0, len(wanted), 500):
+            chunk = wanted[i:i + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = db.execute(
+                f"SELECT login, id FROM users WHERE updated_at >= ? AND login IN ({placeholders})",
+                [cutoff, *chunk],
+            )
+            found.update(rows)
+        return found
+
+    async def resolve(self, sdk: "TwitchSDK", logins: Iterable[str], strict: bool = True) -> dict[str, str]:
+        """Resolve logins to user IDs, fetching missing or stale entries.
+
+        Args:
+            sdk: SDK used to fetch unknown logins
+            logins: Login names (case-insensitive)
+            strict: Raise if a login does not exist, instead of leaving it
+                out of the result
+
+        Raises:
+            ValueError: If strict and a login does not exist on Twitch.
+
+        Returns:
+            Lowercased login -> user ID.
+        """
+        wanted = list(dict.fromkeys(login.lower() for login in logins))
+        found = self.lookup(wanted)
+        self.hits += len(found)
+        missing = [login for login in wanted if login not in found]
+        if missing:
+            self.misses += len(missing)
+            found.update(await self.refresh(sdk, missing))
+        unknown = [login for login in wanted if login not in found]
+        if unknown and strict:
+            raise ValueError(f"Unknown Twitch login: {', '.join(unknown)}")
+        return found
+
+    async def refresh(self, sdk: "TwitchSDK", logins: list[str]) -> dict[str, str]:
+        """Fetch logins from Helix (100 per request) and store them.
+
+        Returns:
+            Lowercased login -> user ID, for logins that exist.
+        """
+        from twitch_sdk.endpoints import users
+        from twitch_sdk.schemas.users import GetUsersRequest
+
+        from .chunking import fetch_chunked
+
+        found = await fetch_chunked(
+            lambda p: users.get_users(sdk.http, p),
+            GetUsersRequest,
+            {"login": logins},
+            fields={"login": lambda u: u.login},
+            item_key=lambda u: u.id,
+        )
+        self.refreshed += self.record((u.id, u.login, u.display_name) for u in found)
+        return {u.login.lower(): u.id for u in found}
+
+    async def resolve_arguments(self, sdk: "TwitchSDK", arguments: dict, logins: dict[str, dict]) -> dict:
+        """Replace ``*_login`` arguments with the matching ID arguments.
+
+        An explicit ID wins over a login given for the same field.
+
+        Args:
+            sdk: SDK used to fetch unknown logins
+            arguments: Tool arguments
+            logins: Login field -> {"id": ID field, "required": bool}
+
+        Raises:
+            ValueError: If a required ID is given neither as ID nor as login,
+                or a login does not exist.
+        """
+        resolved = dict(arguments)
+        pending: dict[str, str | list[str]] = {}
+        for login_field, spec in logins.items():
+            id_field = spec["id"]
+            login = resolved.pop(login_field, None)
+            if resolved.get(id_field) is not None:
+                continue
+            if login:
+                pending[id_field] = login
+            elif spec["required"]:
+                raise ValueError(f"{id_field} or {login_field} is required")
+        if pending:
+            wanted = [login for value in pending.values() for login in ([value] if isinstance(value, str) else value)]
+            ids = await self.resolve(sdk, wanted)
+            for id_field, value in pending.items():
+                if isinstance(value, str):
+                    resolved[id_field] = ids[value.lower()]
+                else:
+                    resolved[id_field] = [ids[login.lower()] for login in value]
+        return resolved
+
+    def stats(self) -> dict:
+        """Get entry count and lookup counters."""
+        entries = self._db().execute("SELECT COUNT(*) FROM users").fetchone()[0]
+        return {
+            "entries": entries,
+            "path": self.path,
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshed": self.refreshed,
+        }
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+# Global index instance
+_index: LoginIndex | None = None
+
+
+def get_login_index() -> LoginIndex:
+    """Get the global login index, configured from the environment."""
+    global _index
+    if _index is None:
+        _index = LoginIndex(
+            os.environ.get("TWITCH_MCP_LOGIN_INDEX_PATH", DEFAULT_INDEX_PATH),
+            float(os.environ.get("TWITCH_MCP_LOGIN_MAX_AGE", DEFAULT_MAX_AGE)),
+        )
+    return _index
@@ -0,0 +1,244 @@
+"""Structured JSON output mode.
+
+By default tools answer with human-readable text. In JSON mode a tool
+answers with the Helix response data itself, serialized as compact JSON, so
+automation does not have to parse formatted text back:
+
+    {"data": [...], "total": 42}
+
+Data from every Helix response a call made (all pages, all chunks) is merged
+into one ``data`` list. Tools that do not map to a Helix response (e.g.
+twitch_bulk_ban_users) publish their own payload with set_structured();
+calls that returned no data answer with ``{"message": <text result>}``.
+
+List tools check is_structured() and skip text rendering in JSON mode:
+paginated tools return structured_pages(), and chunked lookups return
+structured_items() so the data keeps their input order and deduplication.
+
+The mode is chosen per call with the ``output`` argument ("text" or
+"json"), falling back to TWITCH_MCP_OUTPUT (default "text"). ``fields``
+limits each item to the listed keys (dotted paths select nested keys).
+"""
+
+import contextvars
+import os
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+from mcp.types import TextContent
+
+from . import codec
+
+if TYPE_CHECKING:
+    from twitch_client import TwitchHTTPClient
+
+    from .pagination import Paginator
+
+
+OUTPUT_MODES = ("text", "json")
+
+OUTPUT_PROPERTIES = {
+    "output": {"type": "string", "enum": list(OUTPUT_MODES), "description": "Result format"},
+    "fields": {"type": "array", "items": {"type": "string"}, "description": "JSON output: fields to keep"},
+}
+
+
+class _Capture:
+    """Helix responses and explicit payload collected during one call."""
+
+    __slots__ = ("responses", "structured")
+
+    def __init__(self):
+        self.responses: list[dict] = []
+        self.structured: Any = None
+
+
+# Capture for the call currently in progress (None when in text mode)
+_current_capture: contextvars.ContextVar[_Capture | None] = contextvars.ContextVar(
+    "twitch_mcp_output_capture", default=None
+)
+
+
+def add_output_properties(schema: dict) -> dict:
+    """Add the ``output``/``fields`` arguments to a tool schema."""
+    return dict(schema, properties={**schema.get("properties", {}), **OUTPUT_PROPERTIES})
+
+
+def install_capture(http: "TwitchHTTPClient") -> None:
+    """Wrap a TwitchHTTPClient so JSON-mode calls record Helix responses."""
+    from .ratelimit import REQUEST_METHODS
+
+    if getattr(http, "_output_capture", False):
+        return
+    for method in REQUEST_METHODS:
+        setattr(http, method, _wrap(getattr(http, method)))
+    http._output_capture = True
+
+
+def _wrap(func: Callable[..., Awaitable[dict[str, Any]]]) -> Callable[..., Awaitable[dict[str, Any]]]:
+    async def captured(*args, **kwargs) -> dict[str, Any]:
+        response = await func(*args, **kwargs)
+        capture = _current_capture.get()
+        if capture is not None and response:
+            capture.responses.append(response)
+        return response
+
+    captured.__wrapped__ = func
+    return captured
+
+
+def set_structured(payload: Any) -> None:
+    """Publish a tool's JSON-mode payload (ignored in text mode).
+
+    For tools whose result is not a Helix response, e.g. a summary of many
+    requests. Takes precedence over captured responses.
+    """
+    capture = _current_capture.get()
+    if capture is not None:
+        capture.structured = payload
+
+
+def is_structured() -> bool:
+    """Whether the call in progress answers in JSON mode (text is discarded)."""
+    return _current_capture.get() is not None
+
+
+def structured_items(items: list, key: str = "id") -> list[TextContent]:
+    """Publish already merged result items as ``{"data": [...]}``.
+
+    Each item is replaced by the raw Helix object with the same ``key``
+    (keeping fields the SDK model does not declare), in the given order.
+
+    Returns:
+        An empty text result (JSON mode replaces it).
+    """
+    capture = _current_capture.get()
+    if capture is not None:
+        raw = {
+            item.get(key): item
+            for response in capture.responses
+            for item in _as_list(response.get("data"))
+            if isinstance(item, dict)
+        }
+        capture.structured = {
+            "data": [raw.get(getattr(item, key, None)) or item.model_dump(mode="json") for item in items]
+        }
+    return []
+
+
+async def structured_pages(pages: "Paginator") -> list[TextContent]:
+    """Follow a paginator for JSON mode without rendering its items.
+
+    The payload is built from the captured pages, cut to ``max_items``
+    (the last page may hold more items than were asked for).
+
+    Returns:
+        An empty text result (JSON mode replaces it).
+    """
+    async for _ in pages:
+        pass
+    capture = _current_capture.get()
+    if capture is not None and capture.responses:
+        payload = _merge(capture.responses)
+        if pages.max_items is not None and isinstance(payload.get("data"), list):
+            payload["data"] = payload["data"][:pages.max_items]
+        capture.structured = payload
+    return []
+
+
+def split_output_arguments(arguments: dict) -> tuple[dict, str, list[str] | None]:
+    """Separate ``output``/``fields`` from a tool's own arguments.
+
+    Raises:
+        ValueError: If the output mode is unknown.
+
+    Returns:
+        (tool arguments, output mode, fields)
+    """
+    arguments = dict(arguments)
+    mode = arguments.pop("output", None) or get_default_mode()
+    fields = arguments.pop("fields", None)
+    if mode not in OUTPUT_MODES:
+        raise ValueError(f"Unknown output mode: {mode} (expected one of {', '.join(OUTPUT_MODES)})")
+    return arguments, mode, fields
+
+
+async def run_structured(
+    func: Callable[[], Awaitable[list[TextContent]]],
+    fields: list[str] | None = None,
+) -> list[TextContent]:
+    """Run a tool call in JSON mode and return its compact JSON result."""
+    capture = _Capture()
+    token = _current_capture.set(capture)
+    try:
+        result = await func()
+    finally:
+        _current_capture.reset(token)
+
+    if capture.structured is not None:
+        payload = capture.structured
+    elif capture.responses:
+        payload = _merge(capture.responses)
+    else:
+        payload = {"message": "\n".join(item.text for item in result if isinstance(item, TextContent))}
+    if fields:
+        payload = _project_payload(payload, fields)
+    return [TextContent(type="text", text=dumps(payload))]
+
+
+def dumps(payload: Any) -> str:
+    """Serialize a payload as compact JSON."""
+    return codec.dumps(payload)
+
+
+def _merge(responses: list[dict]) -> dict:
+    """Merge Helix responses into one, concatenating their data lists."""
+    first = responses[0]
+    if len(responses) == 1 and not isinstance(first.get("data"), list):
+        merged = dict(first)
+    else:
+        merged = {"data": [item for response in responses for item in _as_list(response.get("data"))]}
+        for key, value in first.items():
+            if key not in ("data", "pagination"):
+                merged[key] = value
+    # Cursors were already followed (or dropped) by the tool
+    merged.pop("pagination", None)
+    return merged
+
+
+def _as_list(data: Any) -> list:
+    if data is None:
+        return []
+    return data if isinstance(data, list) else [data]
+
+
+def _project_payload(payload: Any, fields: list[str]) -> Any:
+    if isinstance(payload, dict) and isinstance(payload.get("data"), list):
+        return {**payload, "data": [_project(item, fields) for item in payload["data"]]}
+    if isinstance(payload, list):
+        return [_project(item, fields) for item in payload]
+    return _project(payload, fields)
+
+
+def _project(item: Any, fields: list[str]) -> Any:
+    """Keep only the given (possibly dotted) fields of a dict."""
+    if not isinstance(item, dict):
+        return item
+    projected: dict = {}
+    for path in fields:
+        value: Any = item
+        parts = path.split(".")
+        for part in parts:
+            if not isinstance(value, dict) or part not in value:
+                break
+            value = value[part]
+        else:
+            target = projected
+            for part in parts[:-1]:
+                target = target.setdefault(part, {})
+            target[parts[-1]] = value
+    return projected
+
+
+def get_default_mode() -> str:
+    """Get the output mode used when a call does not pass ``output``."""
+    return os.environ.get("TWITCH_MCP_OUTPUT", "text")
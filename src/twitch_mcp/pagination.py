@@ -0,0 +1,174 @@
+"""Cursor pagination for list-style Helix endpoints.
+
+Helix list endpoints return one page plus ``pagination.cursor``. Paginator
+follows the cursor as an async iterator, fetching the next page while the
+current one is being consumed, so at most two pages are held in memory.
+
+Tools expose it through two optional arguments (PAGINATION_PROPERTIES):
+``max_items`` follows pages until that many results are collected, and
+``all_pages`` follows every page. Without either, one page is fetched.
+
+render_items() turns the items into text while they stream: it formats the
+first DISPLAY_LIMIT items (or max_items, if given) and only counts the rest,
+so rendering keeps the two-page bound too.
+"""
+
+import asyncio
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from pydantic import BaseModel
+
+PAGINATION_PROPERTIES = {
+    "max_items": {"type": "integer", "description": "Follow pagination until this many results are collected"},
+    "all_pages": {"type": "boolean", "description": "Follow pagination through every page"},
+}
+
+# Items shown in text results unless max_items asks for more
+DISPLAY_LIMIT = 50
+
+
+def get_cursor(page: Any) -> str | None:
+    """Get the next-page cursor from a Helix response model."""
+    pagination = getattr(page, "pagination", None)
+    if isinstance(pagination, dict):
+        return pagination.get("cursor") or None
+    return getattr(pagination, "cursor", None) or None
+
+
+class Paginator:
+    """Async iterator over the items of a cursor-paginated endpoint.
+
+    Attributes set once the first page arrives:
+        first_page: The first response (for totals and other metadata)
+        total: The response's ``total`` field, if the endpoint reports one
+        pages: Number of pages fetched so far
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[BaseModel], Awaitable[Any]],
+        params: BaseModel,
+        max_items: int | None = None,
+        follow: bool = True,
+        page_size: int | None = None,
+    ):
+        """Initialize the paginator.
+
+        Args:
+            fetch: Coroutine function taking request params, returning a page
+            params: Request params for the first page
+            max_items: Stop after this many items (None for no limit)
+            follow: Follow cursors past the first page
+            page_size: Max page size of the endpoint; used as ``first`` when
+                following pages and the caller did not set one
+        """
+        self._fetch = fetch
+        self._params = params
+        self.max_items = max_items
+        self.follow = follow
+        self.page_size = page_size
+        self.first_page: Any = None
+        self.total: int | None = None
+        self.pages = 0
+
+    @classmethod
+    def from_arguments(
+        cls,
+        fetch: Callable[[BaseModel], Awaitable[Any]],
+        request_cls: type[BaseModel],
+        arguments: dict,
+        page_size: int | None = None,
+    ) -> "Paginator":
+        """Build a paginator from tool arguments.
+
+        Pops ``max_items``/``all_pages`` from arguments and validates the
+        rest into request_cls.
+        """
+        arguments = dict(arguments)
+        max_items = arguments.pop("max_items", None)
+        all_pages = bool(arguments.pop("all_pages", False))
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be at least 1")
+        follow = all_pages or max_items is not None
+        if all_pages:
+            max_items = None
+        return cls(
+            fetch,
+            request_cls(**arguments),
+            max_items=max_items,
+            follow=follow,
+            page_size=page_size if follow else None,
+        )
+
+    def _page_params(self, cursor: str | None, remaining: int | None) -> BaseModel:
+        update: dict[str, Any] = {}
+        if cursor:
+            update["after"] = cursor
+        if self.page_size and "first" in type(self._params).model_fields:
+            first = getattr(self._params, "first", None) or self.page_size
+            if remaining is not None:
+                first = min(first, remaining)
+            update["first"] = first
+        return self._params.model_copy(update=update) if update else self._params
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        remaining = self.max_items
+        if remaining is not None and remaining <= 0:
+            return
+        pending = asyncio.ensure_future(self._fetch(self._page_params(None, remaining)))
+        try:
+            while pending is not None:
+                page = await pending
+                pending = None
+                self.pages += 1
+                if self.first_page is None:
+                    self.first_page = page
+                    self.total = getattr(page, "total", None)
+
+                items = page.data
+                if remaining is not None:
+                    items = items[:remaining]
+                    remaining -= len(items)
+
+                # Prefetch the next page while the caller consumes this one
+                cursor = get_cursor(page)
+                if self.follow and cursor and items and (remaining is None or remaining > 0):
+                    pending = asyncio.ensure_future(self._fetch(self._page_params(cursor, remaining)))
+
+                for item in items:
+                    yield item
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+
+async def render_items(
+    pages: Paginator,
+    format_item: Callable[[Any], str],
+    limit: int | None = None,
+) -> str:
+    """Format a paginator's items as lines of text while following it.
+
+    Items past the display limit are counted, not formatted, and summed up
+    as a final "... N more" line.
+
+    Args:
+        pages: Paginator to follow
+        format_item: Text for one item
+        limit: Items to show (default: max_items if set, else DISPLAY_LIMIT)
+
+    Returns:
+        The lines joined by newlines ("" if there were no items).
+    """
+    if limit is None:
+        limit = max(pages.max_items or 0, DISPLAY_LIMIT)
+    lines: list[str] = []
+    hidden = 0
+    async for item in pages:
+        if len(lines) < limit:
+            lines.append(format_item(item))
+        else:
+            hidden += 1
+    if hidden:
+        lines.append(f"... {hidden} more")
+    return "\n".join(lines)
@@ -0,0 +1,22 @@
+"""Progress notifications for long-running tools.
+
+MCP clients that send a ``progressToken`` with a tools/call request receive
+``notifications/progress`` messages while the tool runs. Outside a request,
+or when the client sent no token, report_progress does nothing.
+"""
+
+from mcp.server.lowlevel.server import request_ctx
+
+
+async def report_progress(progress: float, total: float | None = None, message: str | None = None) -> None:
+    """Send a progress notification for the current tool call, if requested."""
+    try:
+        ctx = request_ctx.get()
+    except LookupError:
+        return
+    token = ctx.meta.progressToken if ctx.meta else None
+    if token is None:
+        return
+    await ctx.session.send_progress_notification(
+        token, progress, total, message, related_request_id=str(ctx.request_id)
+    )
@@ -0,0 +1,240 @@
+"""Helix rate-limit governor shared by all tools.
+
+Twitch meters Helix requests with a token bucket per token (800 points per
+minute for user tokens) and reports it on every response through the
+``Ratelimit-Limit``, ``Ratelimit-Remaining`` and ``Ratelimit-Reset`` headers.
+The governor tracks those headers, paces outgoing requests before the
+bucket runs dry, and retries with jittered backoff when a 429 does happen.
+
+Reads (GET) stop short of an empty bucket, keeping a reserve of points for
+writes so moderation actions still go through while bulk reads are paced.
+The user and app tokens are tracked as separate buckets.
+"""
+
+import asyncio
+import contextvars
+import os
+import random
+import time
+from typing import TYPE_CHECKING, Any, Awaitable, Callable
+
+import httpx
+from twitch_client import TwitchRateLimitError
+
+if TYPE_CHECKING:
+    from twitch_client import TwitchHTTPClient
+
+
+DEFAULT_LIMIT = 800
+DEFAULT_READ_RESERVE = 0.1
+DEFAULT_MAX_RETRIES = 3
+
+# TwitchHTTPClient request methods wrapped by the governor
+REQUEST_METHODS = (
+    "get",
+    "post",
+    "patch",
+    "put",
+    "delete",
+    "get_app",
+    "post_app",
+    "patch_app",
+    "delete_app",
+)
+
+# Bucket used by the request currently in progress (read by the response hook)
+_current_bucket: contextvars.ContextVar["_Bucket | None"] = contextvars.ContextVar(
+    "twitch_mcp_rate_bucket", default=None
+)
+
+
+class _Bucket:
+    """Local view of one Helix token bucket."""
+
+    def __init__(self, name: str, limit: int = DEFAULT_LIMIT):
+        self.name = name
+        self.limit = limit
+        self.remaining: float = limit
+        self.reset_at: float | None = None
+        self.updated_at = time.time()
+        self.requests = 0
+        self.paced = 0
+        self.paced_seconds = 0.0
+        self.rate_limited = 0
+
+    def refill(self, now: float) -> None:
+        """Credit points refilled since the last update."""
+        if self.reset_at is not None and now >= self.reset_at:
+            self.remaining = self.limit
+            self.reset_at = None
+        else:
+            # Twitch refills the bucket continuously at limit points/minute
+            elapsed = max(0.0, now - self.updated_at)
+            self.remaining = min(self.limit, self.remaining + elapsed * self.limit / 60.0)
+        self.updated_at = now
+
+    def update(self, headers: httpx.Headers) -> None:
+        """Update from Ratelimit-* response headers."""
+        try:
+            if "Ratelimit-Limit" in headers:
+                self.limit = int(headers["Ratelimit-Limit"])
+            if "Ratelimit-Remaining" in headers:
+                self.remaining = int(headers["Ratelimit-Remaining"])
+            if "Ratelimit-Reset" in headers:
+                self.reset_at = float(headers["Ratelimit-Reset"])
+        except ValueError:
+            return
+        self.updated_at = time.time()
+
+    def as_dict(self, now: float) -> dict:
+        reset_in = max(0.0, self.reset_at - now) if self.reset_at else 0.0
+        return {
+            "limit": self.limit,
+            "remaining": int(self.remaining),
+            "reset_in_s": round(reset_in, 1),
+            "requests": self.requests,
+            "paced": self.paced,
+            "paced_seconds": round(self.paced_seconds, 2),
+            "rate_limited": self.rate_limited,
+        }
+
+
+class RateLimitGovernor:
+    """Paces Helix requests from Ratelimit-* headers and retries 429s.
+
+    Install it on a TwitchHTTPClient with install(); every request method is
+    then wrapped, and the client's httpx hooks feed response headers back.
+    """
+
+    def __init__(
+        self,
+        read_reserve: float = DEFAULT_READ_RESERVE,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        base_backoff: float = 0.5,
+    ):
+        """Initialize the governor.
+
+        Args:
+            read_reserve: Fraction of the bucket reads leave for writes
+            max_retries: Retries after a 429 before giving up
+            base_backoff: Base delay in seconds for jittered backoff
+        """
+        self.read_reserve = read_reserve
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self._buckets = {"user": _Bucket("user"), "app": _Bucket("app")}
+        self.retries = 0
+        self.failures = 0
+
+    def install(self, http: "TwitchHTTPClient") -> None:
+        """Wrap a TwitchHTTPClient's request methods with the governor."""
+        if getattr(http, "_rate_governor", None) is self:
+            return
+        for method in REQUEST_METHODS:
+            bucket = self._buckets["app" if method.endswith("_app") else "user"]
+            is_read = method.startswith("get")
+            setattr(http, method, self._wrap(getattr(http, method), bucket, is_read))
+
+        # Hook into the lazily created httpx client to read response headers
+        get_client = http._get_client
+
+        async def _get_client() -> httpx.AsyncClient:
+            client = await get_client()
+            hooks = client.event_hooks
+            if self._on_response not in hooks["response"]:
+                client.event_hooks = {
+                    "request": hooks["request"],
+                    "response": [*hooks["response"], self._on_response],
+                }
+            return client
+
+        http._get_client = _get_client
+        http._rate_governor = self
+
+    def _wrap(
+        self,
+        func: Callable[..., Awaitable[dict[str, Any]]],
+        bucket: _Bucket,
+        is_read: bool,
+    ) -> Callable[..., Awaitable[dict[str, Any]]]:
+        async def governed(*args, **kwargs) -> dict[str, Any]:
+            attempt = 0
+            while True:
+                await self.acquire(bucket, is_read)
+                token = _current_bucket.set(bucket)
+                try:
+                    return await func(*args, **kwargs)
+                except TwitchRateLimitError as e:
+                    bucket.rate_limited += 1
+                    bucket.remaining = 0
+                    if e.retry_after:
+                        # Ratelimit-Reset is an epoch timestamp
+                        bucket.reset_at = float(e.retry_after)
+                    if attempt >= self.max_retries:
+                        self.failures += 1
+                        raise
+                    attempt += 1
+                    self.retries += 1
+                    await asyncio.sleep(self._backoff(bucket, attempt))
+                finally:
+                    _current_bucket.reset(token)
+
+        governed.__wrapped__ = func
+        return governed
+
+    def _backoff(self, bucket: _Bucket, attempt: int) -> float:
+        """Delay before retrying: wait for the reset, plus full jitter."""
+        until_reset = max(0.0, bucket.reset_at - time.time()) if bucket.reset_at else 0.0
+        return until_reset + random.uniform(0, self.base_backoff * 2 ** attempt)
+
+    async def acquire(self, bucket: _Bucket, is_read: bool) -> None:
+        """Wait until the bucket has a point to spend, then spend it."""
+        floor = int(bucket.limit * self.read_reserve) if is_read else 0
+        waited = 0.0
+        while True:
+            now = time.time()
+            bucket.refill(now)
+            if bucket.remaining >= floor + 1:
+                bucket.remaining -= 1
+                bucket.requests += 1
+                if waited:
+                    bucket.paced += 1
+                    bucket.paced_seconds += waited
+                return
+            # Sleep until enough points have refilled (or the bucket resets),
+            # with jitter so paced callers do not wake in lockstep
+            delay = (floor + 1 - bucket.remaining) * 60.0 / max(bucket.limit, 1)
+            if bucket.reset_at:
+                delay = min(delay, max(0.0, bucket.reset_at - now))
+            delay += random.uniform(0, 0.05)
+            await asyncio.sleep(delay)
+            waited += delay
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        bucket = _current_bucket.get()
+        if bucket is not None:
+            bucket.update(response.headers)
+
+    def stats(self) -> dict:
+        """Get bucket state and pacing/retry counters."""
+        now = time.time()
+        return {
+            "buckets": {name: b.as_dict(now) for name, b in self._buckets.items()},
+            "retries": self.retries,
+            "failures": self.failures,
+        }
+
+
+# Global governor instance
+_governor: RateLimitGovernor | None = None
+
+
+def get_governor() -> RateLimitGovernor:
+    """Get the global governor, configured from the environment."""
+    global _governor
+    if _governor is None:
+        _governor = RateLimitGovernor(
+            read_reserve=float(os.environ.get("TWITCH_MCP_RATE_READ_RESERVE", DEFAULT_READ_RESERVE)),
+            max_retries=int(os.environ.get("TWITCH_MCP_RATE_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+        )
+    return _governor
@@ -0,0 +1,98 @@
+"""Lazy tool registry backed by a static manifest.
+
+The manifest (``tools/manifest.py``) holds every tool's name, description
+and input schema as plain data, so ``list_tools`` can be answered without
+importing the Twitch SDK. A tool module is imported the first time one of
+its tools is called.
+
+Regenerate the manifest after adding or changing a tool:
+
+    poetry run python scripts/generate_tool_manifest.py
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Awaitable, Callable
+
+from mcp.types import TextContent, Tool
+
+from .tools import __all__ as TOOL_MODULES
+from .tools.manifest import TOOL_MANIFEST
+
+if TYPE_CHECKING:
+    from twitch_sdk import TwitchSDK
+
+
+# Type for tool handlers
+ToolHandler = Callable[["TwitchSDK", dict], Awaitable[list[TextContent]]]
+
+
+class ToolRegistry:
+    """Registry that resolves tool handlers on demand.
+
+    Tool definitions come from the static manifest; handlers are loaded
+    per module when first needed.
+    """
+
+    def __init__(self, manifest: dict[str, dict] | None = None):
+        """Initialize the registry.
+
+        Args:
+            manifest: Tool manifest mapping tool name to module, description,
+                inputSchema and login fields. Defaults to the generated
+                TOOL_MANIFEST.
+        """
+        self._manifest = TOOL_MANIFEST if manifest is None else manifest
+        self._tools: list[Tool] | None = None
+        self._handlers: dict[str, ToolHandler] = {}
+        self._loaded_modules: set[str] = set()
+
+    def list_tools(self) -> list[Tool]:
+        """Return all tool definitions without importing any tool module."""
+        if self._tools is None:
+            self._tools = [
+                Tool(
+                    name=name,
+                    description=entry["description"],
+                    inputSchema=entry["inputSchema"],
+                )
+                for name, entry in self._manifest.items()
+            ]
+        return self._tools
+
+    def get_module_name(self, name: str) -> str | None:
+        """Get the tool module that implements a tool."""
+        entry = self._manifest.get(name)
+        return entry["module"] if entry else None
+
+    def get_login_fields(self, name: str) -> dict[str, dict]:
+        """Get a tool's login fields: login field -> {"id": ID field, "required": bool}."""
+        entry = self._manifest.get(name)
+        return entry.get("logins", {}) if entry else {}
+
+    def get_handler(self, name: str) -> ToolHandler | None:
+        """Get the handler for a tool, importing its module if needed."""
+        handler = self._handlers.get(name)
+        if handler is None:
+            module_name = self.get_module_name(name)
+            if module_name is None or module_name in self._loaded_modules:
+                return None
+            self._load_module(module_name)
+            handler = self._handlers.get(name)
+        return handler
+
+    def load_all(self) -> None:
+        """Import every tool module (eager mode, used by benchmarks)."""
+        for module_name in TOOL_MODULES:
+            if module_name not in self._loaded_modules:
+                self._load_module(module_name)
+
+    @property
+    def loaded_modules(self) -> set[str]:
+        """Names of tool modules imported so far."""
+        return set(self._loaded_modules)
+
+    def _load_module(self, module_name: str) -> None:
+        module = importlib.import_module(f".tools.{module_name}", __package__)
+        self._handlers.update(module.get_handlers())
+        self._loaded_modules.add(module_name)
+
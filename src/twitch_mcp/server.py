@@ -5,12 +5,11 @@ import os
 import sys
 from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Callable, Awaitable
+from typing import TYPE_CHECKING
 
 import httpx
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, TextContent
 
 
 REQUIRED_VARS = [
@@ -127,45 +126,41 @@ Get credentials at: https://dev.twitch.tv/console/apps
 if not fetch_credentials_from_backend():
     load_env_file()
 
-# Import SDK after env is loaded
-from twitch_sdk import TwitchSDK
-
-from .tools import (
-    ads,
-    analytics,
-    bits,
-    channel_points,
-    channels,
-    charity,
-    chat,
-    clips,
-    eventsub,
-    games,
-    goals,
-    guest_star,
-    moderation,
-    polls,
-    predictions,
-    raids,
-    schedule,
-    search,
-    streams,
-    subscriptions,
-    teams,
-    users,
-    videos,
-    whispers,
-)
+from .cache import ResponseCache, get_cache, make_key
+from .dispatch import Priority, SingleFlight, ToolDispatcher, classify, get_dispatcher, get_single_flight
+from .logins import LoginIndex, get_login_index
+from .output import run_structured, split_output_arguments
+from .registry import ToolRegistry
+
+if TYPE_CHECKING:
+    from twitch_sdk import TwitchSDK
 
 # Global SDK instance
-_sdk: TwitchSDK | None = None
+_sdk: "TwitchSDK | None" = None
+
+
+def _create_sdk() -> "TwitchSDK":
+    """Create an SDK whose HTTP client is paced by the rate-limit governor.
+
+    Its responses are also recorded for JSON output mode.
+    """
+    # Import SDK lazily (after env is loaded) to keep cold start fast
+    from twitch_sdk import TwitchSDK
+
+    from .output import install_capture
+    from .ratelimit import get_governor
+
+    sdk = TwitchSDK()
+    get_governor().install(sdk.http)
+    install_capture(sdk.http)
+    return sdk
 
 
-def get_sdk() -> TwitchSDK:
+def get_sdk() -> "TwitchSDK":
     """Get the global SDK instance."""
     global _sdk
     if _sdk is None:
-        _sdk = TwitchSDK()
+        _sdk = _create_sdk()
     return _sdk
 
 
@@ -180,7 +175,7 @@ async def sdk_lifespan():
         print_credential_error(missing)
         sys.exit(1)
 
-    _sdk = TwitchSDK()
+    _sdk = _create_sdk()
     try:
         yield
     finally:
@@ -189,64 +184,73 @@ async def sdk_lifespan():
             _sdk = None
 
 
-# Type for tool handlers
-ToolHandler = Callable[[TwitchSDK, dict], Awaitable[list[TextContent]]]
-
-
-def create_server() -> Server:
-    """Create and configure the MCP server."""
+def create_server(
+    registry: ToolRegistry | None = None,
+    dispatcher: ToolDispatcher | None = None,
+    cache: ResponseCache | None = None,
+    single_flight: SingleFlight | None = None,
+    login_index: LoginIndex | None = None,
+) -> Server:
+    """Create and configure the MCP server.
+
+    Tool definitions are served from the static manifest; each tool module
+    (and the SDK schemas it uses) is imported on the first call to one of
+    its tools. Calls run through the dispatcher, which bounds concurrency
+    and lets writes jump ahead of bulk reads. Read-only results are served
+    from the response cache when fresh; writes invalidate affected reads.
+    Identical concurrent reads share a single execution. ``*_login``
+    arguments are resolved to user IDs through the login index first.
+    With ``output: "json"`` (or TWITCH_MCP_OUTPUT=json) the result is the
+    compact Helix response data instead of formatted text.
+    """
     server = Server("twitch-mcp")
-
-    # Collect all tools and handlers from modules
-    tool_modules = [
-        ads,
-        analytics,
-        bits,
-        channel_points,
-        channels,
-        charity,
-        chat,
-        clips,
-        eventsub,
-        games,
-        goals,
-        guest_star,
-        moderation,
-        polls,
-        predictions,
-        raids,
-        schedule,
-        search,
-        streams,
-        subscriptions,
-        teams,
-        users,
-        videos,
-        whispers,
-    ]
-
-    # Aggregate all tools and handlers
-    all_tools: list[Tool] = []
-    all_handlers: dict[str, ToolHandler] = {}
-
-    for module in tool_modules:
-        all_tools.extend(module.get_tools())
-        all_handlers.update(module.get_handlers())
+    registry = registry or ToolRegistry()
+    dispatcher = dispatcher or get_dispatcher()
+    cache = cache or get_cache()
+    single_flight = single_flight or get_single_flight()
+    login_index = login_index or get_login_index()
 
     # Register single list_tools handler
     @server.list_tools()
     async def list_tools():
-        return all_tools
+        return registry.list_tools()
 
     # Register single call_tool handler
     @server.call_tool()
     async def call_tool(name: str, arguments: dict):
-        handler = all_handlers.get(name)
+        handler = registry.get_handler(name)
         if handler is None:
             raise ValueError(f"Unknown tool: {name}")
 
+        arguments, mode, fields = split_output_arguments(arguments)
+        logins = registry.get_login_fields(name)
+        if logins:
+            arguments = await login_index.resolve_arguments(get_sdk(), arguments, logins)
+        # Text and JSON results of the same call are cached separately
+        key_arguments = arguments if mode == "text" else {**arguments, "output": mode, "fields": fields}
+
+        if cache.is_cacheable(name):
+            cached = cache.get(name, key_arguments)
+            if cached is not None:
+                return cached
+
         sdk = get_sdk()
-        return await handler(sdk, arguments)
+
+        def call():
+            # Handlers may consume their arguments; keep the original for the cache
+            if mode == "json":
+                return run_structured(lambda: handler(sdk, dict(arguments)), fields)
+            return handler(sdk, dict(arguments))
+
+        async def execute():
+            result = await dispatcher.run(name, call)
+            cache.invalidate_for(name, arguments)
+            cache.put(name, key_arguments, result)
+            return result
+
+        if classify(name) is Priority.WRITE:
+            return await execute()
+        return await single_flight.run(make_key(name, key_arguments), execute)
 
     return server
 
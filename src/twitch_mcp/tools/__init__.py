@@ -1,31 +1,10 @@
-"""MCP tool definitions for Twitch SDK endpoints."""
+"""MCP tool definitions for Twitch SDK endpoints.
 
-from . import (
-    ads,
-    analytics,
-    bits,
-    channel_points,
-    channels,
-    charity,
-    chat,
-    clips,
-    eventsub,
-    games,
-    goals,
-    guest_star,
-    moderation,
-    polls,
-    predictions,
-    raids,
-    schedule,
-    search,
-    streams,
-    subscriptions,
-    teams,
-    users,
-    videos,
-    whispers,
-)
+Submodules are imported on first attribute access, so importing this package
+(e.g. to read the static tool manifest) does not pull in the Twitch SDK.
+"""
+
+import importlib
 
 __all__ = [
     "ads",
@@ -36,6 +15,8 @@ __all__ = [
     "charity",
     "chat",
     "clips",
+    "diagnostics",
+    "events",
     "eventsub",
     "games",
     "goals",
@@ -53,3 +34,10 @@ __all__ = [
     "videos",
     "whispers",
 ]
+
+
+def __getattr__(name: str):
+    """Import tool modules lazily."""
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
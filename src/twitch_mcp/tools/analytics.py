@@ -6,6 +6,9 @@ from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import analytics
 from twitch_sdk.schemas.analytics import GetExtensionAnalyticsRequest, GetGameAnalyticsRequest
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return analytics tools."""
@@ -18,6 +21,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "extension_id": {"type": "string", "description": "Extension ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
             },
         ),
@@ -29,6 +33,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "game_id": {"type": "string", "description": "Game ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
             },
         ),
@@ -36,17 +41,23 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_get_extension_analytics(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetExtensionAnalyticsRequest(**arguments) if arguments else None
-    result = await analytics.get_extension_analytics(sdk.http, params)
-    analytics_list = [f"- Extension {a.extension_id}: {a.URL}" for a in result.data]
-    return [TextContent(type="text", text="\n".join(analytics_list) if analytics_list else "No extension analytics")]
+    pages = Paginator.from_arguments(
+        lambda p: analytics.get_extension_analytics(sdk.http, p), GetExtensionAnalyticsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    analytics_list = await render_items(pages, lambda a: f"- Extension {a.extension_id}: {a.URL}")
+    return [TextContent(type="text", text=analytics_list or "No extension analytics")]
 
 
 async def _handle_get_game_analytics(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetGameAnalyticsRequest(**arguments) if arguments else None
-    result = await analytics.get_game_analytics(sdk.http, params)
-    analytics_list = [f"- Game {a.game_id}: {a.URL}" for a in result.data]
-    return [TextContent(type="text", text="\n".join(analytics_list) if analytics_list else "No game analytics")]
+    pages = Paginator.from_arguments(
+        lambda p: analytics.get_game_analytics(sdk.http, p), GetGameAnalyticsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    analytics_list = await render_items(pages, lambda a: f"- Game {a.game_id}: {a.URL}")
+    return [TextContent(type="text", text=analytics_list or "No game analytics")]
 
 
 def get_handlers() -> dict:
@@ -6,6 +6,9 @@ from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import bits
 from twitch_sdk.schemas.bits import GetBitsLeaderboardRequest, GetCheermotesRequest, GetExtensionTransactionsRequest
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return bits tools."""
@@ -41,6 +44,7 @@ def get_tools() -> list[Tool]:
                     "extension_id": {"type": "string", "description": "Extension ID"},
                     "id": {"type": "array", "items": {"type": "string"}, "description": "Specific transaction IDs"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["extension_id"],
             },
@@ -63,10 +67,13 @@ async def _handle_get_cheermotes(sdk: TwitchSDK, arguments: dict) -> list[TextCo
 
 
 async def _handle_get_extension_transactions(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetExtensionTransactionsRequest(**arguments)
-    result = await bits.get_extension_transactions(sdk.http, params)
-    txs = [f"- {t.id}: {t.user_name} ({t.product_type})" for t in result.data]
-    return [TextContent(type="text", text=f"Extension Transactions:\n" + "\n".join(txs) if txs else "No transactions")]
+    pages = Paginator.from_arguments(
+        lambda p: bits.get_extension_transactions(sdk.http, p), GetExtensionTransactionsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    txs = await render_items(pages, lambda t: f"- {t.id}: {t.user_name} ({t.product_type})")
+    return [TextContent(type="text", text=f"Extension Transactions:\n{txs}" if txs else "No transactions")]
 
 
 def get_handlers() -> dict:
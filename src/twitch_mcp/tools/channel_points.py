@@ -13,6 +13,9 @@ from twitch_sdk.schemas.channel_points import (
     UpdateRedemptionStatusRequest,
 )
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return channel points tools."""
@@ -84,6 +87,7 @@ def get_tools() -> list[Tool]:
                     "reward_id": {"type": "string", "description": "The reward ID"},
                     "status": {"type": "string", "description": "Filter: UNFULFILLED, FULFILLED, CANCELED"},
                     "first": {"type": "integer", "description": "Max results (max 50)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id", "reward_id"],
             },
@@ -133,10 +137,16 @@ async def _handle_delete_custom_reward(sdk: TwitchSDK, arguments: dict) -> list[
 
 
 async def _handle_get_redemptions(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetCustomRewardRedemptionRequest(**arguments)
-    result = await channel_points.get_custom_reward_redemption(sdk.http, params)
-    redemptions = [f"- {r.user_name}: {r.user_input or 'No input'} ({r.status})" for r in result.data]
-    return [TextContent(type="text", text=f"Redemptions:\n" + "\n".join(redemptions) if redemptions else "No redemptions")]
+    pages = Paginator.from_arguments(
+        lambda p: channel_points.get_custom_reward_redemption(sdk.http, p),
+        GetCustomRewardRedemptionRequest,
+        arguments,
+        page_size=50,
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    redemptions = await render_items(pages, lambda r: f"- {r.user_name}: {r.user_input or 'No input'} ({r.status})")
+    return [TextContent(type="text", text=f"Redemptions:\n{redemptions}" if redemptions else "No redemptions")]
 
 
 async def _handle_update_redemption_status(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
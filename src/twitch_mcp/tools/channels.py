@@ -15,6 +15,9 @@ from twitch_sdk.schemas.channels import (
     RemoveVIPRequest,
 )
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return channels tools."""
@@ -53,6 +56,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -66,6 +70,7 @@ def get_tools() -> list[Tool]:
                     "user_id": {"type": "string", "description": "The user ID"},
                     "broadcaster_id": {"type": "string", "description": "Check if following specific broadcaster"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["user_id"],
             },
@@ -78,6 +83,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -142,24 +148,33 @@ async def _handle_modify_channel_info(sdk: TwitchSDK, arguments: dict) -> list[T
 
 
 async def _handle_get_channel_followers(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetChannelFollowersRequest(**arguments)
-    result = await channels.get_channel_followers(sdk.http, params)
-    followers = [f"- {f.user_name} (since {f.followed_at.date()})" for f in result.data]
-    return [TextContent(type="text", text=f"Followers ({result.total}):\n" + "\n".join(followers[:50]))]
+    pages = Paginator.from_arguments(
+        lambda p: channels.get_channel_followers(sdk.http, p), GetChannelFollowersRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    followers = await render_items(pages, lambda f: f"- {f.user_name} (since {f.followed_at.date()})")
+    return [TextContent(type="text", text=f"Followers ({pages.total}):\n{followers}")]
 
 
 async def _handle_get_followed_channels(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetFollowedChannelsRequest(**arguments)
-    result = await channels.get_followed_channels(sdk.http, params)
-    followed = [f"- {f.broadcaster_name}" for f in result.data]
-    return [TextContent(type="text", text=f"Following:\n" + "\n".join(followed))]
+    pages = Paginator.from_arguments(
+        lambda p: channels.get_followed_channels(sdk.http, p), GetFollowedChannelsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    followed = await render_items(pages, lambda f: f"- {f.broadcaster_name}")
+    return [TextContent(type="text", text=f"Following:\n{followed}")]
 
 
 async def _handle_get_vips(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetVIPsRequest(**arguments)
-    result = await channels.get_vips(sdk.http, params)
-    vips = [f"- {v.user_name}" for v in result.data]
-    return [TextContent(type="text", text=f"VIPs:\n" + "\n".join(vips) if vips else "No VIPs")]
+    pages = Paginator.from_arguments(
+        lambda p: channels.get_vips(sdk.http, p), GetVIPsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    vips = await render_items(pages, lambda v: f"- {v.user_name}")
+    return [TextContent(type="text", text=f"VIPs:\n{vips}" if vips else "No VIPs")]
 
 
 async def _handle_add_vip(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
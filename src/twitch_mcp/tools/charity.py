@@ -6,6 +6,9 @@ from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import charity
 from twitch_sdk.schemas.charity import GetCharityCampaignRequest, GetCharityDonationsRequest
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return charity tools."""
@@ -29,6 +32,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -49,10 +53,15 @@ async def _handle_get_charity_campaign(sdk: TwitchSDK, arguments: dict) -> list[
 
 
 async def _handle_get_charity_donations(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetCharityDonationsRequest(**arguments)
-    result = await charity.get_charity_campaign_donations(sdk.http, params)
-    donations = [f"- {d.user_name}: {d.amount.value / (10 ** d.amount.decimal_places)} {d.amount.currency}" for d in result.data]
-    return [TextContent(type="text", text=f"Donations:\n" + "\n".join(donations) if donations else "No donations yet")]
+    pages = Paginator.from_arguments(
+        lambda p: charity.get_charity_campaign_donations(sdk.http, p), GetCharityDonationsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    donations = await render_items(
+        pages, lambda d: f"- {d.user_name}: {d.amount.value / (10 ** d.amount.decimal_places)} {d.amount.currency}"
+    )
+    return [TextContent(type="text", text=f"Donations:\n{donations}" if donations else "No donations yet")]
 
 
 def get_handlers() -> dict:
@@ -14,6 +14,10 @@ from twitch_sdk.schemas.chat import (
     UpdateChatSettingsRequest,
 )
 
+from ..logins import get_login_index
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return chat tools."""
@@ -41,6 +45,7 @@ def get_tools() -> list[Tool]:
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "moderator_id": {"type": "string", "description": "The moderator's user ID"},
                     "first": {"type": "integer", "description": "Max number of results (max 1000)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id", "moderator_id"],
             },
@@ -123,10 +128,19 @@ async def _handle_send_chat_message(sdk: TwitchSDK, arguments: dict) -> list[Tex
 
 
 async def _handle_get_chatters(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetChattersRequest(**arguments)
-    result = await chat.get_chatters(sdk.http, params)
-    chatters = [f"{c.user_name} ({c.user_id})" for c in result.data]
-    return [TextContent(type="text", text=f"Chatters ({result.total}):\n" + "\n".join(chatters[:50]))]
+    index = get_login_index()
+
+    async def fetch(params: GetChattersRequest):
+        page = await chat.get_chatters(sdk.http, params)
+        # Chatter lists warm the login index for later *_login arguments
+        index.record((c.user_id, c.user_login, c.user_name) for c in page.data)
+        return page
+
+    pages = Paginator.from_arguments(fetch, GetChattersRequest, arguments, page_size=1000)
+    if is_structured():
+        return await structured_pages(pages)
+    chatters = await render_items(pages, lambda c: f"{c.user_name} ({c.user_id})")
+    return [TextContent(type="text", text=f"Chatters ({pages.total}):\n{chatters}")]
 
 
 async def _handle_send_announcement(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
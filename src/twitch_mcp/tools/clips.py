@@ -6,6 +6,9 @@ from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import clips
 from twitch_sdk.schemas.clips import CreateClipRequest, GetClipsRequest
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return clips tools."""
@@ -32,6 +35,7 @@ def get_tools() -> list[Tool]:
                     "game_id": {"type": "string", "description": "The game ID"},
                     "id": {"type": "array", "items": {"type": "string"}, "description": "Specific clip IDs"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
             },
         ),
@@ -46,16 +50,17 @@ async def _handle_create_clip(sdk: TwitchSDK, arguments: dict) -> list[TextConte
 
 
 async def _handle_get_clips(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetClipsRequest(**arguments)
-    result = await clips.get_clips(sdk.http, params)
-    clip_list = []
-    for c in result.data:
-        clip_list.append(
-            f"- {c.title}\n"
-            f"  By: {c.creator_name} | Views: {c.view_count}\n"
-            f"  URL: {c.url}"
-        )
-    return [TextContent(type="text", text="\n".join(clip_list) if clip_list else "No clips found")]
+    pages = Paginator.from_arguments(
+        lambda p: clips.get_clips(sdk.http, p), GetClipsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    clip_list = await render_items(pages, lambda c: (
+        f"- {c.title}\n"
+        f"  By: {c.creator_name} | Views: {c.view_count}\n"
+        f"  URL: {c.url}"
+    ))
+    return [TextContent(type="text", text=clip_list or "No clips found")]
 
 
 def get_handlers() -> dict:
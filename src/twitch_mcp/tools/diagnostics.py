@@ -0,0 +1,97 @@
+"""Server diagnostics MCP tools."""
+
+from mcp.types import Tool, TextContent
+
+from twitch_sdk import TwitchSDK
+
+from ..cache import get_cache
+from ..dispatch import get_dispatcher, get_single_flight
+from ..logins import get_login_index
+from ..output import set_structured
+from ..ratelimit import get_governor
+
+
+def get_tools() -> list[Tool]:
+    """Return diagnostics tools."""
+    return [
+        Tool(
+            name="twitch_get_server_stats",
+            description="Get MCP server diagnostics: tool-call queue depth and wait times, Helix rate-limit state, response cache hit/miss counters, login index size",
+            inputSchema={
+                "type": "object",
+                "properties": {},
+            },
+        ),
+    ]
+
+
+def _format_dispatch_stats(stats: dict, flight: dict) -> list[str]:
+    lines = [
+        "Dispatcher:",
+        f"  In flight: {stats['in_flight']}/{stats['max_concurrency']}",
+        f"  Queue depth: {stats['queue_depth']}",
+        f"  Coalesced reads: {flight['coalesced']} joined, {flight['executed']} executed",
+    ]
+    for name, c in stats["classes"].items():
+        lines.append(
+            f"  {name}: queued {c['queued']}, dispatched {c['dispatched']}, "
+            f"avg wait {c['avg_wait_ms']} ms, max wait {c['max_wait_ms']} ms"
+        )
+    return lines
+
+
+def _format_rate_limit_stats(stats: dict) -> list[str]:
+    lines = [
+        "Rate limit:",
+        f"  Retries after 429: {stats['retries']}, gave up: {stats['failures']}",
+    ]
+    for name, b in stats["buckets"].items():
+        lines.append(
+            f"  {name} token: {b['remaining']}/{b['limit']} points (resets in {b['reset_in_s']}s), "
+            f"{b['requests']} requests, {b['paced']} paced ({b['paced_seconds']}s), "
+            f"{b['rate_limited']} rate limited"
+        )
+    return lines
+
+
+def _format_cache_stats(stats: dict) -> list[str]:
+    lines = [
+        "Response cache:",
+        f"  Entries: {stats['entries']} ({stats['bytes']}/{stats['max_bytes']} bytes)",
+        f"  Hits: {stats['hits']}, misses: {stats['misses']} (hit rate {stats['hit_rate']:.0%})",
+        f"  Evictions: {stats['evictions']}, invalidations: {stats['invalidations']}",
+    ]
+    for name, c in stats["tools"].items():
+        lines.append(f"  {name}: {c['hits']} hits, {c['misses']} misses")
+    return lines
+
+
+def _format_login_index_stats(stats: dict) -> list[str]:
+    return [
+        "Login index:",
+        f"  Entries: {stats['entries']} ({stats['path']})",
+        f"  Hits: {stats['hits']}, misses: {stats['misses']}, refreshed from Twitch: {stats['refreshed']}",
+    ]
+
+
+async def _handle_get_server_stats(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
+    stats = {
+        "dispatcher": get_dispatcher().stats(),
+        "single_flight": get_single_flight().stats(),
+        "rate_limit": get_governor().stats(),
+        "cache": get_cache().stats(),
+        "login_index": get_login_index().stats(),
+    }
+    set_structured(stats)
+    lines = _format_dispatch_stats(stats["dispatcher"], stats["single_flight"])
+    lines += _format_rate_limit_stats(stats["rate_limit"])
+    lines += _format_cache_stats(stats["cache"])
+    lines += _format_login_index_stats(stats["login_index"])
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
+def get_handlers() -> dict:
+    """Return handlers for diagnostics tools."""
+    return {
+        "twitch_get_server_stats": _handle_get_server_stats,
+    }
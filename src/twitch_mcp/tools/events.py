@@ -0,0 +1,70 @@
+"""Stored EventSub event MCP tools."""
+
+import asyncio
+
+from mcp.types import Tool, TextContent
+
+from twitch_sdk import TwitchSDK
+
+from ..eventsub.store import GROUP_BY_COLUMNS, get_event_store, parse_time
+from ..output import set_structured
+
+
+def get_tools() -> list[Tool]:
+    """Return stored event tools."""
+    return [
+        Tool(
+            name="twitch_query_events",
+            description="Query EventSub events recorded by `eventsub-listen --store`: filter by type, user and time range, or aggregate counts/amounts (bits, raid viewers, gifted subs) per type, user, hour or day",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "event_type": {"type": "string", "description": "Event type, or a prefix ending in * (e.g. channel.cheer, channel.subscription.*)"},
+                    "user": {"type": "string", "description": "User ID or login the event is about"},
+                    "broadcaster_id": {"type": "string", "description": "Broadcaster the events belong to"},
+                    "since": {"type": "string", "description": "Start of the time range: ISO timestamp (UTC) or age such as 15m, 1h, 7d"},
+                    "until": {"type": "string", "description": "End of the time range: ISO timestamp (UTC) or age"},
+                    "group_by": {"type": "string", "enum": list(GROUP_BY_COLUMNS), "description": "Aggregate: count events and sum amounts per group"},
+                    "limit": {"type": "integer", "description": "Max events or groups (default 50)"},
+                },
+            },
+        ),
+    ]
+
+
+async def _handle_query_events(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
+    store = get_event_store()
+    filters = {
+        "event_type": arguments.get("event_type"),
+        "user": arguments.get("user"),
+        "broadcaster_id": arguments.get("broadcaster_id"),
+        "since": parse_time(arguments.get("since")),
+        "until": parse_time(arguments.get("until")),
+        "limit": arguments.get("limit") or 50,
+    }
+    group_by = arguments.get("group_by")
+
+    if group_by:
+        groups = await asyncio.to_thread(store.aggregate, group_by, **filters)
+        set_structured(groups)
+        lines = [
+            f"- {g['group']}: {g['count']} events" + (f", amount {g['amount']}" if g["amount"] is not None else "")
+            for g in groups
+        ]
+        return [TextContent(type="text", text=f"Events by {group_by}:\n" + "\n".join(lines) if lines else "No events found")]
+
+    events = await asyncio.to_thread(store.query, **filters)
+    set_structured(events)
+    lines = []
+    for e in events:
+        who = e["user_login"] or e["user_id"] or "-"
+        amount = f" ({e['amount']})" if e["amount"] is not None else ""
+        lines.append(f"- {e['timestamp']} {e['event_type']}: {who}{amount}")
+    return [TextContent(type="text", text=f"Events ({len(events)}):\n" + "\n".join(lines) if lines else "No events found")]
+
+
+def get_handlers() -> dict:
+    """Return handlers for stored event tools."""
+    return {
+        "twitch_query_events": _handle_query_events,
+    }
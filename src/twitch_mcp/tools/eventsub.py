@@ -15,6 +15,9 @@ from twitch_sdk.schemas.eventsub import (
     UpdateConduitShardsRequest,
 )
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return eventsub tools."""
@@ -28,6 +31,7 @@ def get_tools() -> list[Tool]:
                     "status": {"type": "string", "description": "Filter by status"},
                     "type": {"type": "string", "description": "Filter by event type"},
                     "user_id": {"type": "string", "description": "Filter by user ID"},
+                    **PAGINATION_PROPERTIES,
                 },
             },
         ),
@@ -126,12 +130,14 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_get_eventsub_subscriptions(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetEventSubSubscriptionsRequest(**arguments) if arguments else None
-    result = await eventsub.get_eventsub_subscriptions(sdk.http, params)
-    subs = []
-    for s in result.data:
-        subs.append(f"- {s.type} ({s.status})\n  ID: {s.id}")
-    return [TextContent(type="text", text=f"EventSub Subscriptions ({result.total}, cost: {result.total_cost}/{result.max_total_cost}):\n" + "\n".join(subs))]
+    pages = Paginator.from_arguments(
+        lambda p: eventsub.get_eventsub_subscriptions(sdk.http, p), GetEventSubSubscriptionsRequest, arguments
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    subs = await render_items(pages, lambda s: f"- {s.type} ({s.status})\n  ID: {s.id}")
+    result = pages.first_page
+    return [TextContent(type="text", text=f"EventSub Subscriptions ({result.total}, cost: {result.total_cost}/{result.max_total_cost}):\n{subs}")]
 
 
 async def _handle_create_eventsub_subscription(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
@@ -1,18 +1,24 @@
 """Games MCP tools."""
 
+import itertools
+
 from mcp.types import Tool, TextContent
 
 from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import games
 from twitch_sdk.schemas.games import GetGamesRequest, GetTopGamesRequest
 
+from ..chunking import fetch_chunked
+from ..output import is_structured, structured_items, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return games tools."""
     return [
         Tool(
             name="twitch_get_games",
-            description="Get game/category information by ID or name",
+            description="Get game/category information by ID or name (any number; looked up 100 at a time)",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -28,6 +34,7 @@ def get_tools() -> list[Tool]:
                 "type": "object",
                 "properties": {
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
             },
         ),
@@ -35,17 +42,28 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_get_games(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetGamesRequest(**arguments)
-    result = await games.get_games(sdk.http, params)
-    game_list = [f"- {g.name} (ID: {g.id})" for g in result.data]
+    found = await fetch_chunked(
+        lambda p: games.get_games(sdk.http, p),
+        GetGamesRequest,
+        arguments,
+        fields={"id": lambda g: g.id, "name": lambda g: g.name, "igdb_id": lambda g: g.igdb_id},
+        item_key=lambda g: g.id,
+    )
+    if is_structured():
+        return structured_items(found)
+    game_list = [f"- {g.name} (ID: {g.id})" for g in found]
     return [TextContent(type="text", text="\n".join(game_list) if game_list else "No games found")]
 
 
 async def _handle_get_top_games(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetTopGamesRequest(**arguments) if arguments else None
-    result = await games.get_top_games(sdk.http, params)
-    game_list = [f"{i+1}. {g.name} (ID: {g.id})" for i, g in enumerate(result.data)]
-    return [TextContent(type="text", text=f"Top Games:\n" + "\n".join(game_list))]
+    pages = Paginator.from_arguments(
+        lambda p: games.get_top_games(sdk.http, p), GetTopGamesRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    rank = itertools.count(1)
+    game_list = await render_items(pages, lambda g: f"{next(rank)}. {g.name} (ID: {g.id})")
+    return [TextContent(type="text", text=f"Top Games:\n{game_list}")]
 
 
 def get_handlers() -> dict:
@@ -0,0 +1,5205 @@
+"""Static tool manifest: name -> module, description and inputSchema.
+
+Generated by scripts/generate_tool_manifest.py - do not edit by hand.
+"""
+
+TOOL_MANIFEST: dict[str, dict] = {
+    'twitch_start_commercial': {
+        'module': 'ads',
+        'description': 'Start a commercial break on a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'length': {
+                    'type': 'integer',
+                    'description': 'Commercial length: 30, 60, 90, 120, 150, or 180 seconds',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['length'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_ad_schedule': {
+        'module': 'ads',
+        'description': 'Get ad schedule for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_snooze_next_ad': {
+        'module': 'ads',
+        'description': 'Snooze the next scheduled ad break',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_extension_analytics': {
+        'module': 'analytics',
+        'description': 'Get analytics for extensions',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'extension_id': {
+                    'type': 'string',
+                    'description': 'Extension ID',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_game_analytics': {
+        'module': 'analytics',
+        'description': 'Get analytics for games',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'game_id': {
+                    'type': 'string',
+                    'description': 'Game ID',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_bits_leaderboard': {
+        'module': 'bits',
+        'description': 'Get bits leaderboard for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'count': {
+                    'type': 'integer',
+                    'description': 'Number of entries (max 100)',
+                },
+                'period': {
+                    'type': 'string',
+                    'description': 'Time period: day, week, month, year, all',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'Get rank for specific user',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'user_login': {
+                'id': 'user_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_get_cheermotes': {
+        'module': 'bits',
+        'description': 'Get cheermotes for a channel or global',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': 'Broadcaster ID (omit for global)',
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_get_extension_transactions': {
+        'module': 'bits',
+        'description': 'Get extension transactions (for extension developers)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'extension_id': {
+                    'type': 'string',
+                    'description': 'Extension ID',
+                },
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Specific transaction IDs',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['extension_id'],
+        },
+    },
+    'twitch_get_custom_rewards': {
+        'module': 'channel_points',
+        'description': 'Get custom channel point rewards',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'only_manageable_rewards': {
+                    'type': 'boolean',
+                    'description': 'Only show rewards the app can manage',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_create_custom_reward': {
+        'module': 'channel_points',
+        'description': 'Create a custom channel point reward',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'title': {
+                    'type': 'string',
+                    'description': 'Reward title (max 45 chars)',
+                },
+                'cost': {
+                    'type': 'integer',
+                    'description': 'Cost in channel points',
+                },
+                'prompt': {
+                    'type': 'string',
+                    'description': 'Prompt for user input (max 200 chars)',
+                },
+                'is_enabled': {
+                    'type': 'boolean',
+                    'description': 'Whether the reward is enabled',
+                },
+                'is_user_input_required': {
+                    'type': 'boolean',
+                    'description': 'Require user input',
+                },
+                'background_color': {
+                    'type': 'string',
+                    'description': 'Hex color code',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['title', 'cost'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_custom_reward': {
+        'module': 'channel_points',
+        'description': 'Update a custom channel point reward',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'id': {
+                    'type': 'string',
+                    'description': 'The reward ID',
+                },
+                'title': {
+                    'type': 'string',
+                    'description': 'Reward title',
+                },
+                'cost': {
+                    'type': 'integer',
+                    'description': 'Cost in channel points',
+                },
+                'is_enabled': {
+                    'type': 'boolean',
+                    'description': 'Whether the reward is enabled',
+                },
+                'is_paused': {
+                    'type': 'boolean',
+                    'description': 'Whether the reward is paused',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_delete_custom_reward': {
+        'module': 'channel_points',
+        'description': 'Delete a custom channel point reward',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'id': {
+                    'type': 'string',
+                    'description': 'The reward ID',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_redemptions': {
+        'module': 'channel_points',
+        'description': 'Get redemptions for a custom reward',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'reward_id': {
+                    'type': 'string',
+                    'description': 'The reward ID',
+                },
+                'status': {
+                    'type': 'string',
+                    'description': 'Filter: UNFULFILLED, FULFILLED, CANCELED',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 50)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['reward_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_redemption_status': {
+        'module': 'channel_points',
+        'description': 'Update the status of a redemption (fulfill or cancel)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'reward_id': {
+                    'type': 'string',
+                    'description': 'The reward ID',
+                },
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Redemption IDs',
+                },
+                'status': {
+                    'type': 'string',
+                    'description': 'New status: FULFILLED or CANCELED',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['reward_id', 'id', 'status'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_channel_info': {
+        'module': 'channels',
+        'description': 'Get information about one or more channels',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Broadcaster IDs',
+                },
+                'broadcaster_login': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Login names, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_modify_channel_info': {
+        'module': 'channels',
+        'description': 'Modify channel information (title, game, etc.)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'game_id': {
+                    'type': 'string',
+                    'description': 'The game/category ID',
+                },
+                'title': {
+                    'type': 'string',
+                    'description': 'The stream title',
+                },
+                'broadcaster_language': {
+                    'type': 'string',
+                    'description': "Language code (e.g., 'en')",
+                },
+                'tags': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Stream tags',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_channel_followers': {
+        'module': 'channels',
+        'description': 'Get list of users that follow a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_followed_channels': {
+        'module': 'channels',
+        'description': 'Get channels that a user follows',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'user_id': {
+                    'type': 'string',
+                    'description': 'The user ID',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': 'Check if following specific broadcaster',
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_get_vips': {
+        'module': 'channels',
+        'description': 'Get list of VIPs for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_add_vip': {
+        'module': 'channels',
+        'description': 'Add a VIP to the channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'The user ID to make VIP',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_remove_vip': {
+        'module': 'channels',
+        'description': 'Remove a VIP from the channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'The user ID to remove as VIP',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_channel_editors': {
+        'module': 'channels',
+        'description': 'Get list of channel editors',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_charity_campaign': {
+        'module': 'charity',
+        'description': "Get the broadcaster's active charity campaign",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_charity_donations': {
+        'module': 'charity',
+        'description': 'Get donations to the charity campaign',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_send_chat_message': {
+        'module': 'chat',
+        'description': "Send a message to a broadcaster's chat",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'sender_id': {
+                    'type': 'string',
+                    'description': "The sender's user ID",
+                },
+                'message': {
+                    'type': 'string',
+                    'description': 'The message to send',
+                },
+                'reply_parent_message_id': {
+                    'type': 'string',
+                    'description': 'Message ID to reply to (optional)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['sender_id', 'message'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_chatters': {
+        'module': 'chat',
+        'description': "Get list of users in a broadcaster's chat",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max number of results (max 1000)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_send_announcement': {
+        'module': 'chat',
+        'description': 'Send an announcement message to the chat',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'message': {
+                    'type': 'string',
+                    'description': 'The announcement message',
+                },
+                'color': {
+                    'type': 'string',
+                    'description': 'Color: blue, green, orange, purple, primary',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['message'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_send_shoutout': {
+        'module': 'chat',
+        'description': 'Send a shoutout to another broadcaster',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'from_broadcaster_id': {
+                    'type': 'string',
+                    'description': 'Your broadcaster ID',
+                },
+                'from_broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of from_broadcaster_id (one of from_broadcaster_id/from_broadcaster_login is required)',
+                },
+                'to_broadcaster_id': {
+                    'type': 'string',
+                    'description': 'Broadcaster to shoutout',
+                },
+                'to_broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of to_broadcaster_id (one of to_broadcaster_id/to_broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'from_broadcaster_login': {
+                'id': 'from_broadcaster_id',
+                'required': True,
+            },
+            'to_broadcaster_login': {
+                'id': 'to_broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_chat_settings': {
+        'module': 'chat',
+        'description': 'Get chat settings for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_chat_settings': {
+        'module': 'chat',
+        'description': 'Update chat settings for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'emote_mode': {
+                    'type': 'boolean',
+                    'description': 'Enable emote-only mode',
+                },
+                'follower_mode': {
+                    'type': 'boolean',
+                    'description': 'Enable follower-only mode',
+                },
+                'follower_mode_duration': {
+                    'type': 'integer',
+                    'description': 'Minutes user must follow before chatting',
+                },
+                'slow_mode': {
+                    'type': 'boolean',
+                    'description': 'Enable slow mode',
+                },
+                'slow_mode_wait_time': {
+                    'type': 'integer',
+                    'description': 'Seconds between messages',
+                },
+                'subscriber_mode': {
+                    'type': 'boolean',
+                    'description': 'Enable subscriber-only mode',
+                },
+                'unique_chat_mode': {
+                    'type': 'boolean',
+                    'description': 'Enable unique messages only',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_channel_emotes': {
+        'module': 'chat',
+        'description': 'Get custom emotes for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_create_clip': {
+        'module': 'clips',
+        'description': 'Create a clip from a live stream',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'has_delay': {
+                    'type': 'boolean',
+                    'description': 'Add delay for clip processing',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_clips': {
+        'module': 'clips',
+        'description': 'Get clips for a broadcaster or game',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id',
+                },
+                'game_id': {
+                    'type': 'string',
+                    'description': 'The game ID',
+                },
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Specific clip IDs',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_get_server_stats': {
+        'module': 'diagnostics',
+        'description': 'Get MCP server diagnostics: tool-call queue depth and wait times, Helix rate-limit state, response cache hit/miss counters, login index size',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_query_events': {
+        'module': 'events',
+        'description': 'Query EventSub events recorded by `eventsub-listen --store`: filter by type, user and time range, or aggregate counts/amounts (bits, raid viewers, gifted subs) per type, user, hour or day',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'event_type': {
+                    'type': 'string',
+                    'description': 'Event type, or a prefix ending in * (e.g. channel.cheer, channel.subscription.*)',
+                },
+                'user': {
+                    'type': 'string',
+                    'description': 'User ID or login the event is about',
+                },
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': 'Broadcaster the events belong to',
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id',
+                },
+                'since': {
+                    'type': 'string',
+                    'description': 'Start of the time range: ISO timestamp (UTC) or age such as 15m, 1h, 7d',
+                },
+                'until': {
+                    'type': 'string',
+                    'description': 'End of the time range: ISO timestamp (UTC) or age',
+                },
+                'group_by': {
+                    'type': 'string',
+                    'enum': ['event_type', 'user', 'hour', 'day'],
+                    'description': 'Aggregate: count events and sum amounts per group',
+                },
+                'limit': {
+                    'type': 'integer',
+                    'description': 'Max events or groups (default 50)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_get_eventsub_subscriptions': {
+        'module': 'eventsub',
+        'description': 'Get list of EventSub subscriptions',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'status': {
+                    'type': 'string',
+                    'description': 'Filter by status',
+                },
+                'type': {
+                    'type': 'string',
+                    'description': 'Filter by event type',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'Filter by user ID',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'user_login': {
+                'id': 'user_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_create_eventsub_subscription': {
+        'module': 'eventsub',
+        'description': 'Create an EventSub subscription (webhook)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'type': {
+                    'type': 'string',
+                    'description': 'Event type (e.g., channel.follow)',
+                },
+                'version': {
+                    'type': 'string',
+                    'description': 'Subscription version',
+                },
+                'condition': {
+                    'type': 'object',
+                    'description': 'Subscription condition',
+                },
+                'transport': {
+                    'type': 'object',
+                    'description': 'Transport config (method, callback, secret)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['type', 'version', 'condition', 'transport'],
+        },
+    },
+    'twitch_delete_eventsub_subscription': {
+        'module': 'eventsub',
+        'description': 'Delete an EventSub subscription',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'id': {
+                    'type': 'string',
+                    'description': 'Subscription ID to delete',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id'],
+        },
+    },
+    'twitch_get_conduits': {
+        'module': 'eventsub',
+        'description': 'Get list of conduits for event distribution',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_create_conduit': {
+        'module': 'eventsub',
+        'description': 'Create a conduit for distributing events across shards',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'shard_count': {
+                    'type': 'integer',
+                    'description': 'Number of shards (min 1)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['shard_count'],
+        },
+    },
+    'twitch_update_conduit': {
+        'module': 'eventsub',
+        'description': "Update a conduit's shard count",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'id': {
+                    'type': 'string',
+                    'description': 'Conduit ID',
+                },
+                'shard_count': {
+                    'type': 'integer',
+                    'description': 'New shard count (min 1)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id', 'shard_count'],
+        },
+    },
+    'twitch_delete_conduit': {
+        'module': 'eventsub',
+        'description': 'Delete a conduit',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'id': {
+                    'type': 'string',
+                    'description': 'Conduit ID to delete',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id'],
+        },
+    },
+    'twitch_get_conduit_shards': {
+        'module': 'eventsub',
+        'description': 'Get shards for a conduit',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'conduit_id': {
+                    'type': 'string',
+                    'description': 'Conduit ID',
+                },
+                'status': {
+                    'type': 'string',
+                    'description': 'Filter by status',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['conduit_id'],
+        },
+    },
+    'twitch_update_conduit_shards': {
+        'module': 'eventsub',
+        'description': 'Update conduit shards (configure transport for each shard)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'conduit_id': {
+                    'type': 'string',
+                    'description': 'Conduit ID',
+                },
+                'shards': {
+                    'type': 'array',
+                    'description': 'Array of shard configs with id and transport',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['conduit_id', 'shards'],
+        },
+    },
+    'twitch_get_games': {
+        'module': 'games',
+        'description': 'Get game/category information by ID or name (any number; looked up 100 at a time)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Game IDs',
+                },
+                'name': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Game names (exact match)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_top_games': {
+        'module': 'games',
+        'description': 'Get top games by current viewers',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_creator_goals': {
+        'module': 'goals',
+        'description': "Get the broadcaster's active creator goals",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_guest_star_settings': {
+        'module': 'guest_star',
+        'description': 'Get guest star settings for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_guest_star_session': {
+        'module': 'guest_star',
+        'description': 'Get active guest star session',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_create_guest_star_session': {
+        'module': 'guest_star',
+        'description': 'Create a guest star session',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_end_guest_star_session': {
+        'module': 'guest_star',
+        'description': 'End a guest star session',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'session_id': {
+                    'type': 'string',
+                    'description': 'The session ID',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['session_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_send_guest_star_invite': {
+        'module': 'guest_star',
+        'description': 'Send a guest star invite',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'session_id': {
+                    'type': 'string',
+                    'description': 'The session ID',
+                },
+                'guest_id': {
+                    'type': 'string',
+                    'description': 'User ID to invite',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['session_id', 'guest_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_guest_star_settings': {
+        'module': 'guest_star',
+        'description': 'Update guest star settings for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'is_moderator_send_live_enabled': {
+                    'type': 'boolean',
+                    'description': 'Allow mods to send guests live',
+                },
+                'slot_count': {
+                    'type': 'integer',
+                    'description': 'Number of slots (1-6)',
+                },
+                'is_browser_source_audio_enabled': {
+                    'type': 'boolean',
+                    'description': 'Enable browser source audio',
+                },
+                'group_layout': {
+                    'type': 'string',
+                    'description': 'Layout: TILED_LAYOUT, SCREENSHARE_LAYOUT, HORIZONTAL_LAYOUT, VERTICAL_LAYOUT',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_guest_star_invites': {
+        'module': 'guest_star',
+        'description': 'Get pending guest star invites for a session',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'session_id': {
+                    'type': 'string',
+                    'description': 'The session ID',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['session_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_delete_guest_star_invite': {
+        'module': 'guest_star',
+        'description': 'Revoke a pending guest star invite',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'session_id': {
+                    'type': 'string',
+                    'description': 'The session ID',
+                },
+                'guest_id': {
+                    'type': 'string',
+                    'description': 'User ID of invited guest',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['session_id', 'guest_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_assign_guest_star_slot': {
+        'module': 'guest_star',
+        'description': 'Assign a guest to a slot',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'session_id': {
+                    'type': 'string',
+                    'description': 'The session ID',
+                },
+                'guest_id': {
+                    'type': 'string',
+                    'description': 'User ID of the guest',
+                },
+                'slot_id': {
+                    'type': 'string',
+                    'description': 'Slot ID to assign to',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['session_id', 'guest_id', 'slot_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_guest_star_slot': {
+        'module': 'guest_star',
+        'description': 'Move a guest between slots',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'session_id': {
+                    'type': 'string',
+                    'description': 'The session ID',
+                },
+                'source_slot_id': {
+                    'type': 'string',
+                    'description': 'Current slot ID',
+                },
+                'destination_slot_id': {
+                    'type': 'string',
+                    'description': 'Target slot ID (omit to remove from slot)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['session_id', 'source_slot_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_delete_guest_star_slot': {
+        'module': 'guest_star',
+        'description': 'Remove a guest from their slot',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'session_id': {
+                    'type': 'string',
+                    'description': 'The session ID',
+                },
+                'guest_id': {
+                    'type': 'string',
+                    'description': 'User ID of the guest',
+                },
+                'slot_id': {
+                    'type': 'string',
+                    'description': 'Slot ID',
+                },
+                'should_reinvite_guest': {
+                    'type': 'boolean',
+                    'description': 'Re-invite the guest after removal',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['session_id', 'guest_id', 'slot_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_guest_star_slot_settings': {
+        'module': 'guest_star',
+        'description': 'Update slot settings (audio, video, volume, live status)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'session_id': {
+                    'type': 'string',
+                    'description': 'The session ID',
+                },
+                'slot_id': {
+                    'type': 'string',
+                    'description': 'Slot ID',
+                },
+                'is_audio_enabled': {
+                    'type': 'boolean',
+                    'description': 'Enable/disable audio',
+                },
+                'is_video_enabled': {
+                    'type': 'boolean',
+                    'description': 'Enable/disable video',
+                },
+                'is_live': {
+                    'type': 'boolean',
+                    'description': 'Set live status',
+                },
+                'volume': {
+                    'type': 'integer',
+                    'description': 'Volume level (0-100)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['session_id', 'slot_id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_ban_user': {
+        'module': 'moderation',
+        'description': 'Ban a user from a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'User ID to ban',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'duration': {
+                    'type': 'integer',
+                    'description': 'Timeout duration in seconds (omit for permanent)',
+                },
+                'reason': {
+                    'type': 'string',
+                    'description': 'Reason for the ban',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_bulk_ban_users': {
+        'module': 'moderation',
+        'description': 'Ban or time out many users at once (e.g. a bot raid) with a shared reason and duration; returns per-user results',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'user_ids': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'User IDs to ban',
+                },
+                'user_logins': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'User login names to ban',
+                },
+                'duration': {
+                    'type': 'integer',
+                    'description': 'Timeout duration in seconds for every user (omit for permanent)',
+                },
+                'reason': {
+                    'type': 'string',
+                    'description': 'Reason for the bans',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_unban_user': {
+        'module': 'moderation',
+        'description': 'Unban a user from a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'User ID to unban',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_banned_users': {
+        'module': 'moderation',
+        'description': 'Get list of banned users',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_warn_user': {
+        'module': 'moderation',
+        'description': 'Send a warning to a user in chat',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'User ID to warn',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'reason': {
+                    'type': 'string',
+                    'description': 'Reason for the warning',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['reason'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_delete_chat_messages': {
+        'module': 'moderation',
+        'description': 'Delete chat messages (specific message or all)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'message_id': {
+                    'type': 'string',
+                    'description': 'Specific message ID to delete (omit to clear all)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_moderators': {
+        'module': 'moderation',
+        'description': 'Get list of moderators for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_add_moderator': {
+        'module': 'moderation',
+        'description': 'Add a moderator to the channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'User ID to make moderator',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_remove_moderator': {
+        'module': 'moderation',
+        'description': 'Remove a moderator from the channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'User ID to remove as moderator',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_blocked_terms': {
+        'module': 'moderation',
+        'description': 'Get list of blocked terms',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_add_blocked_term': {
+        'module': 'moderation',
+        'description': 'Add a blocked term',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'text': {
+                    'type': 'string',
+                    'description': 'Term to block (2-500 chars)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['text'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_shield_mode_status': {
+        'module': 'moderation',
+        'description': 'Get shield mode status',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_shield_mode': {
+        'module': 'moderation',
+        'description': 'Enable or disable shield mode',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'is_active': {
+                    'type': 'boolean',
+                    'description': 'True to enable, false to disable',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['is_active'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_unban_requests': {
+        'module': 'moderation',
+        'description': 'Get pending unban requests for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'status': {
+                    'type': 'string',
+                    'description': 'Filter by status: pending, approved, denied, acknowledged, canceled',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'Filter by user ID',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_resolve_unban_request': {
+        'module': 'moderation',
+        'description': 'Approve or deny an unban request',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'unban_request_id': {
+                    'type': 'string',
+                    'description': 'The unban request ID',
+                },
+                'status': {
+                    'type': 'string',
+                    'description': 'approved or denied',
+                },
+                'resolution_text': {
+                    'type': 'string',
+                    'description': 'Optional resolution message',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['unban_request_id', 'status'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_remove_blocked_term': {
+        'module': 'moderation',
+        'description': 'Remove a blocked term from a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'id': {
+                    'type': 'string',
+                    'description': 'The blocked term ID to remove',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_automod_settings': {
+        'module': 'moderation',
+        'description': 'Get AutoMod settings for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_automod_settings': {
+        'module': 'moderation',
+        'description': 'Update AutoMod settings for a channel (levels 0-4)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'moderator_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'moderator_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of moderator_id (one of moderator_id/moderator_login is required)',
+                },
+                'overall_level': {
+                    'type': 'integer',
+                    'description': 'Overall level (0-4), overrides individual settings',
+                },
+                'aggression': {
+                    'type': 'integer',
+                    'description': 'Aggression filter level (0-4)',
+                },
+                'bullying': {
+                    'type': 'integer',
+                    'description': 'Bullying filter level (0-4)',
+                },
+                'disability': {
+                    'type': 'integer',
+                    'description': 'Disability filter level (0-4)',
+                },
+                'misogyny': {
+                    'type': 'integer',
+                    'description': 'Misogyny filter level (0-4)',
+                },
+                'race_ethnicity_or_religion': {
+                    'type': 'integer',
+                    'description': 'Race/ethnicity/religion filter (0-4)',
+                },
+                'sex_based_terms': {
+                    'type': 'integer',
+                    'description': 'Sex-based terms filter (0-4)',
+                },
+                'sexuality_sex_or_gender': {
+                    'type': 'integer',
+                    'description': 'Sexuality/gender filter (0-4)',
+                },
+                'swearing': {
+                    'type': 'integer',
+                    'description': 'Swearing filter level (0-4)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'moderator_login': {
+                'id': 'moderator_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_manage_held_automod_message': {
+        'module': 'moderation',
+        'description': 'Allow or deny a message held by AutoMod',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'user_id': {
+                    'type': 'string',
+                    'description': "The moderator's user ID",
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'msg_id': {
+                    'type': 'string',
+                    'description': 'The held message ID',
+                },
+                'action': {
+                    'type': 'string',
+                    'description': 'ALLOW or DENY',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['msg_id', 'action'],
+        },
+        'logins': {
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_create_poll': {
+        'module': 'polls',
+        'description': 'Create a poll on a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'title': {
+                    'type': 'string',
+                    'description': 'Poll title (max 60 chars)',
+                },
+                'choices': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'List of choice titles (2-5 choices, max 25 chars each)',
+                },
+                'duration': {
+                    'type': 'integer',
+                    'description': 'Duration in seconds (15-1800)',
+                },
+                'channel_points_voting_enabled': {
+                    'type': 'boolean',
+                    'description': 'Allow channel points voting',
+                },
+                'channel_points_per_vote': {
+                    'type': 'integer',
+                    'description': 'Channel points cost per vote',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['title', 'choices', 'duration'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_polls': {
+        'module': 'polls',
+        'description': 'Get polls for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Specific poll IDs',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 20)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_end_poll': {
+        'module': 'polls',
+        'description': 'End an active poll',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'id': {
+                    'type': 'string',
+                    'description': 'The poll ID',
+                },
+                'status': {
+                    'type': 'string',
+                    'description': 'TERMINATED (show results) or ARCHIVED (hide results)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id', 'status'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_create_prediction': {
+        'module': 'predictions',
+        'description': 'Create a prediction on a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'title': {
+                    'type': 'string',
+                    'description': 'Prediction title (max 45 chars)',
+                },
+                'outcomes': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'List of outcome titles (2-10 outcomes, max 25 chars each)',
+                },
+                'prediction_window': {
+                    'type': 'integer',
+                    'description': 'Seconds users can make predictions (30-1800)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['title', 'outcomes', 'prediction_window'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_predictions': {
+        'module': 'predictions',
+        'description': 'Get predictions for a channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Specific prediction IDs',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 25)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_end_prediction': {
+        'module': 'predictions',
+        'description': 'End/resolve a prediction',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'id': {
+                    'type': 'string',
+                    'description': 'The prediction ID',
+                },
+                'status': {
+                    'type': 'string',
+                    'description': 'RESOLVED, CANCELED, or LOCKED',
+                },
+                'winning_outcome_id': {
+                    'type': 'string',
+                    'description': 'The winning outcome ID (required for RESOLVED)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id', 'status'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_start_raid': {
+        'module': 'raids',
+        'description': 'Start a raid to another channel',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'from_broadcaster_id': {
+                    'type': 'string',
+                    'description': 'Your broadcaster ID',
+                },
+                'from_broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of from_broadcaster_id (one of from_broadcaster_id/from_broadcaster_login is required)',
+                },
+                'to_broadcaster_id': {
+                    'type': 'string',
+                    'description': 'Channel to raid',
+                },
+                'to_broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of to_broadcaster_id (one of to_broadcaster_id/to_broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'from_broadcaster_login': {
+                'id': 'from_broadcaster_id',
+                'required': True,
+            },
+            'to_broadcaster_login': {
+                'id': 'to_broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_cancel_raid': {
+        'module': 'raids',
+        'description': 'Cancel a pending raid',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': 'Your broadcaster ID',
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_channel_schedule': {
+        'module': 'schedule',
+        'description': "Get a broadcaster's streaming schedule",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max segments (max 25)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_channel_schedule': {
+        'module': 'schedule',
+        'description': 'Update channel schedule settings (vacation mode)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'is_vacation_enabled': {
+                    'type': 'boolean',
+                    'description': 'Enable vacation mode',
+                },
+                'vacation_start_time': {
+                    'type': 'string',
+                    'description': 'Vacation start (RFC3339)',
+                },
+                'vacation_end_time': {
+                    'type': 'string',
+                    'description': 'Vacation end (RFC3339)',
+                },
+                'timezone': {
+                    'type': 'string',
+                    'description': 'Timezone (e.g., America/New_York)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_create_schedule_segment': {
+        'module': 'schedule',
+        'description': 'Create a scheduled stream segment',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'start_time': {
+                    'type': 'string',
+                    'description': 'Start time (RFC3339)',
+                },
+                'timezone': {
+                    'type': 'string',
+                    'description': 'Timezone (e.g., America/New_York)',
+                },
+                'duration': {
+                    'type': 'integer',
+                    'description': 'Duration in minutes (30-1440)',
+                },
+                'is_recurring': {
+                    'type': 'boolean',
+                    'description': 'Whether this is weekly recurring',
+                },
+                'category_id': {
+                    'type': 'string',
+                    'description': 'Game/category ID',
+                },
+                'title': {
+                    'type': 'string',
+                    'description': 'Stream title',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['start_time', 'timezone', 'duration'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_delete_schedule_segment': {
+        'module': 'schedule',
+        'description': 'Delete a scheduled stream segment',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'id': {
+                    'type': 'string',
+                    'description': 'Segment ID to delete',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_schedule_icalendar': {
+        'module': 'schedule',
+        'description': "Get a broadcaster's schedule as iCalendar data",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_update_schedule_segment': {
+        'module': 'schedule',
+        'description': 'Update a scheduled stream segment',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'id': {
+                    'type': 'string',
+                    'description': 'Segment ID to update',
+                },
+                'start_time': {
+                    'type': 'string',
+                    'description': 'New start time (RFC3339)',
+                },
+                'timezone': {
+                    'type': 'string',
+                    'description': 'Timezone (e.g., America/New_York)',
+                },
+                'duration': {
+                    'type': 'integer',
+                    'description': 'Duration in minutes (30-1440)',
+                },
+                'is_canceled': {
+                    'type': 'boolean',
+                    'description': 'Cancel this segment',
+                },
+                'category_id': {
+                    'type': 'string',
+                    'description': 'Game/category ID',
+                },
+                'title': {
+                    'type': 'string',
+                    'description': 'Stream title (max 140 chars)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id'],
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_search_categories': {
+        'module': 'search',
+        'description': 'Search for game/category names',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'query': {
+                    'type': 'string',
+                    'description': 'Search query',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['query'],
+        },
+    },
+    'twitch_search_channels': {
+        'module': 'search',
+        'description': 'Search for channels by name',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'query': {
+                    'type': 'string',
+                    'description': 'Search query',
+                },
+                'live_only': {
+                    'type': 'boolean',
+                    'description': 'Only show live channels',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['query'],
+        },
+    },
+    'twitch_get_streams': {
+        'module': 'streams',
+        'description': 'Get active live streams, optionally filtered by user/game (any number of users; looked up 100 at a time)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'user_id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Filter by user IDs',
+                },
+                'user_login': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Filter by user logins',
+                },
+                'game_id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Filter by game IDs',
+                },
+                'language': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Filter by language',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_followed_streams': {
+        'module': 'streams',
+        'description': 'Get streams from channels that a user follows',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'user_id': {
+                    'type': 'string',
+                    'description': 'The user ID to get followed streams for',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_create_stream_marker': {
+        'module': 'streams',
+        'description': 'Create a marker in a live stream',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'user_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'description': {
+                    'type': 'string',
+                    'description': 'Description for the marker (max 140 chars)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_broadcaster_subscriptions': {
+        'module': 'subscriptions',
+        'description': 'Get list of subscribers for a broadcaster',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'user_id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Filter to specific users',
+                },
+                'user_login': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Login names, in place of user_id',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_check_user_subscription': {
+        'module': 'subscriptions',
+        'description': 'Check if a user is subscribed to a broadcaster',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'The user ID to check',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id (one of user_id/user_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+            'user_login': {
+                'id': 'user_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_teams': {
+        'module': 'teams',
+        'description': 'Get team information by name or ID',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'name': {
+                    'type': 'string',
+                    'description': 'Team name',
+                },
+                'id': {
+                    'type': 'string',
+                    'description': 'Team ID',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_channel_teams': {
+        'module': 'teams',
+        'description': 'Get teams that a broadcaster is a member of',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_get_users': {
+        'module': 'users',
+        'description': 'Get user information by ID or login name (any number; looked up 100 at a time)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'User IDs',
+                },
+                'login': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'User login names',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_user_ids': {
+        'module': 'users',
+        'description': 'Resolve login names to user IDs from the local login index (unknown or stale logins are fetched, 100 at a time)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'logins': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'User login names',
+                },
+                'refresh': {
+                    'type': 'boolean',
+                    'description': 'Fetch every login from Twitch instead of using the index',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['logins'],
+        },
+    },
+    'twitch_update_user': {
+        'module': 'users',
+        'description': "Update the authenticated user's description",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'description': {
+                    'type': 'string',
+                    'description': 'New channel description',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_user_block_list': {
+        'module': 'users',
+        'description': 'Get list of users the broadcaster has blocked',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'broadcaster_id': {
+                    'type': 'string',
+                    'description': "The broadcaster's user ID",
+                },
+                'broadcaster_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of broadcaster_id (one of broadcaster_id/broadcaster_login is required)',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'broadcaster_login': {
+                'id': 'broadcaster_id',
+                'required': True,
+            },
+        },
+    },
+    'twitch_block_user': {
+        'module': 'users',
+        'description': 'Block a user',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'target_user_id': {
+                    'type': 'string',
+                    'description': 'User ID to block',
+                },
+                'source_context': {
+                    'type': 'string',
+                    'description': 'Context: chat or whisper',
+                },
+                'reason': {
+                    'type': 'string',
+                    'description': 'Reason: harassment, spam, or other',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['target_user_id'],
+        },
+    },
+    'twitch_unblock_user': {
+        'module': 'users',
+        'description': 'Unblock a user',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'target_user_id': {
+                    'type': 'string',
+                    'description': 'User ID to unblock',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['target_user_id'],
+        },
+    },
+    'twitch_get_user_extensions': {
+        'module': 'users',
+        'description': 'Get list of extensions the authenticated user has installed',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+    },
+    'twitch_get_user_active_extensions': {
+        'module': 'users',
+        'description': "Get user's currently active extensions",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'user_id': {
+                    'type': 'string',
+                    'description': 'User ID (omit for authenticated user)',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'user_login': {
+                'id': 'user_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_update_user_extensions': {
+        'module': 'users',
+        'description': "Update user's active extensions configuration",
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'data': {
+                    'type': 'object',
+                    'description': 'Extension config with panel, overlay, component objects',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['data'],
+        },
+    },
+    'twitch_get_videos': {
+        'module': 'videos',
+        'description': 'Get videos by ID, user, or game',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Video IDs',
+                },
+                'user_id': {
+                    'type': 'string',
+                    'description': 'User ID to get videos for',
+                },
+                'user_login': {
+                    'type': 'string',
+                    'description': 'Login name, in place of user_id',
+                },
+                'game_id': {
+                    'type': 'string',
+                    'description': 'Game ID to get videos for',
+                },
+                'type': {
+                    'type': 'string',
+                    'description': 'Filter: all, archive, highlight, upload',
+                },
+                'sort': {
+                    'type': 'string',
+                    'description': 'Sort: time, trending, views',
+                },
+                'first': {
+                    'type': 'integer',
+                    'description': 'Max results (max 100)',
+                },
+                'max_items': {
+                    'type': 'integer',
+                    'description': 'Follow pagination until this many results are collected',
+                },
+                'all_pages': {
+                    'type': 'boolean',
+                    'description': 'Follow pagination through every page',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+        },
+        'logins': {
+            'user_login': {
+                'id': 'user_id',
+                'required': False,
+            },
+        },
+    },
+    'twitch_delete_videos': {
+        'module': 'videos',
+        'description': 'Delete videos (max 5 at once)',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'id': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'Video IDs to delete (max 5)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['id'],
+        },
+    },
+    'twitch_send_whisper': {
+        'module': 'whispers',
+        'description': 'Send a whisper (private message) to another user',
+        'inputSchema': {
+            'type': 'object',
+            'properties': {
+                'from_user_id': {
+                    'type': 'string',
+                    'description': 'Your user ID',
+                },
+                'to_user_id': {
+                    'type': 'string',
+                    'description': "Recipient's user ID",
+                },
+                'message': {
+                    'type': 'string',
+                    'description': 'Message to send (max 10000 chars)',
+                },
+                'output': {
+                    'type': 'string',
+                    'enum': ['text', 'json'],
+                    'description': 'Result format',
+                },
+                'fields': {
+                    'type': 'array',
+                    'items': {
+                        'type': 'string',
+                    },
+                    'description': 'JSON output: fields to keep',
+                },
+            },
+            'required': ['from_user_id', 'to_user_id', 'message'],
+        },
+    },
+}
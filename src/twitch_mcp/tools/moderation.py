@@ -1,7 +1,10 @@
 """Moderation MCP tools."""
 
+import asyncio
+
 from mcp.types import Tool, TextContent
 
+from twitch_client import TwitchAPIError
 from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import moderation
 from twitch_sdk.schemas.moderation import (
@@ -26,6 +29,15 @@ from twitch_sdk.schemas.moderation import (
     WarnUserRequest,
 )
 
+from ..logins import get_login_index
+from ..output import is_structured, set_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+from ..progress import report_progress
+
+# Bans in flight at once for twitch_bulk_ban_users (the rate-limit governor
+# still paces the requests themselves)
+BULK_BAN_CONCURRENCY = 20
+
 
 def get_tools() -> list[Tool]:
     """Return moderation tools."""
@@ -45,6 +57,22 @@ def get_tools() -> list[Tool]:
                 "required": ["broadcaster_id", "moderator_id", "user_id"],
             },
         ),
+        Tool(
+            name="twitch_bulk_ban_users",
+            description="Ban or time out many users at once (e.g. a bot raid) with a shared reason and duration; returns per-user results",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
+                    "moderator_id": {"type": "string", "description": "The moderator's user ID"},
+                    "user_ids": {"type": "array", "items": {"type": "string"}, "description": "User IDs to ban"},
+                    "user_logins": {"type": "array", "items": {"type": "string"}, "description": "User login names to ban"},
+                    "duration": {"type": "integer", "description": "Timeout duration in seconds for every user (omit for permanent)"},
+                    "reason": {"type": "string", "description": "Reason for the bans"},
+                },
+                "required": ["broadcaster_id", "moderator_id"],
+            },
+        ),
         Tool(
             name="twitch_unban_user",
             description="Unban a user from a channel",
@@ -66,6 +94,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -105,6 +134,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -142,6 +172,7 @@ def get_tools() -> list[Tool]:
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "moderator_id": {"type": "string", "description": "The moderator's user ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id", "moderator_id"],
             },
@@ -195,6 +226,7 @@ def get_tools() -> list[Tool]:
                     "status": {"type": "string", "description": "Filter by status: pending, approved, denied, acknowledged, canceled"},
                     "user_id": {"type": "string", "description": "Filter by user ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id", "moderator_id"],
             },
@@ -288,6 +320,64 @@ async def _handle_ban_user(sdk: TwitchSDK, arguments: dict) -> list[TextContent]
     return [TextContent(type="text", text=f"User {ban.user_id} banned until {ban.end_time or 'permanent'}")]
 
 
+async def _handle_bulk_ban_users(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
+    # Keyed by user ID; logins that do not resolve to an ID are listed separately
+    failures: dict[str, str] = {}
+    unknown_logins: list[str] = []
+    user_ids = list(dict.fromkeys(arguments.get("user_ids") or []))
+    logins = list(dict.fromkeys(login.lower() for login in arguments.get("user_logins") or []))
+    if logins:
+        ids = await get_login_index().resolve(sdk, logins, strict=False)
+        for login in logins:
+            if login not in ids:
+                unknown_logins.append(login)
+            elif ids[login] not in user_ids:
+                user_ids.append(ids[login])
+    if not user_ids and not unknown_logins:
+        raise ValueError("user_ids or user_logins is required")
+
+    total = len(user_ids)
+    step = max(1, total // 20)
+    banned: list[str] = []
+    done = 0
+    semaphore = asyncio.Semaphore(BULK_BAN_CONCURRENCY)
+
+    async def ban(user_id: str) -> None:
+        nonlocal done
+        async with semaphore:
+            # Any error only fails this user: the others keep their results
+            try:
+                params = BanUserRequest(
+                    broadcaster_id=arguments["broadcaster_id"],
+                    moderator_id=arguments["moderator_id"],
+                    data=BanUserData(user_id=user_id, duration=arguments.get("duration"), reason=arguments.get("reason")),
+                )
+                await moderation.ban_user(sdk.http, params)
+                banned.append(user_id)
+            except TwitchAPIError as e:
+                failures[user_id] = e.message
+            except Exception as e:
+                failures[user_id] = f"{type(e).__name__}: {e}"
+        done += 1
+        if done % step == 0 or done == total:
+            await report_progress(done, total, f"{len(banned)} banned, {len(failures)} failed")
+
+    await asyncio.gather(*(ban(user_id) for user_id in user_ids))
+
+    set_structured({"banned": banned, "failed": failures, "unknown_logins": unknown_logins})
+    duration = arguments.get("duration")
+    action = f"Timed out for {duration}s" if duration else "Banned"
+    lines = [f"{action}: {len(banned)}/{total + len(unknown_logins)} users"]
+    if banned:
+        lines.append("Succeeded: " + ", ".join(banned))
+    if failures:
+        lines.append(f"Failed ({len(failures)}):")
+        lines.extend(f"- {user_id}: {error}" for user_id, error in failures.items())
+    if unknown_logins:
+        lines.append(f"Unknown logins ({len(unknown_logins)}): " + ", ".join(unknown_logins))
+    return [TextContent(type="text", text="\n".join(lines))]
+
+
 async def _handle_unban_user(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
     params = UnbanUserRequest(**arguments)
     await moderation.unban_user(sdk.http, params)
@@ -295,10 +385,15 @@ async def _handle_unban_user(sdk: TwitchSDK, arguments: dict) -> list[TextConten
 
 
 async def _handle_get_banned_users(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetBannedUsersRequest(**arguments)
-    result = await moderation.get_banned_users(sdk.http, params)
-    banned = [f"- {b.user_name}: {b.reason or 'No reason'} (expires: {b.expires_at or 'never'})" for b in result.data]
-    return [TextContent(type="text", text=f"Banned users:\n" + "\n".join(banned) if banned else "No banned users")]
+    pages = Paginator.from_arguments(
+        lambda p: moderation.get_banned_users(sdk.http, p), GetBannedUsersRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    banned = await render_items(
+        pages, lambda b: f"- {b.user_name}: {b.reason or 'No reason'} (expires: {b.expires_at or 'never'})"
+    )
+    return [TextContent(type="text", text=f"Banned users:\n{banned}" if banned else "No banned users")]
 
 
 async def _handle_warn_user(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
@@ -315,10 +410,13 @@ async def _handle_delete_chat_messages(sdk: TwitchSDK, arguments: dict) -> list[
 
 
 async def _handle_get_moderators(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetModeratorsRequest(**arguments)
-    result = await moderation.get_moderators(sdk.http, params)
-    mods = [f"- {m.user_name}" for m in result.data]
-    return [TextContent(type="text", text=f"Moderators:\n" + "\n".join(mods) if mods else "No moderators")]
+    pages = Paginator.from_arguments(
+        lambda p: moderation.get_moderators(sdk.http, p), GetModeratorsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    mods = await render_items(pages, lambda m: f"- {m.user_name}")
+    return [TextContent(type="text", text=f"Moderators:\n{mods}" if mods else "No moderators")]
 
 
 async def _handle_add_moderator(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
@@ -334,10 +432,13 @@ async def _handle_remove_moderator(sdk: TwitchSDK, arguments: dict) -> list[Text
 
 
 async def _handle_get_blocked_terms(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetBlockedTermsRequest(**arguments)
-    result = await moderation.get_blocked_terms(sdk.http, params)
-    terms = [f"- {t.text}" for t in result.data]
-    return [TextContent(type="text", text=f"Blocked terms:\n" + "\n".join(terms) if terms else "No blocked terms")]
+    pages = Paginator.from_arguments(
+        lambda p: moderation.get_blocked_terms(sdk.http, p), GetBlockedTermsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    terms = await render_items(pages, lambda t: f"- {t.text}")
+    return [TextContent(type="text", text=f"Blocked terms:\n{terms}" if terms else "No blocked terms")]
 
 
 async def _handle_add_blocked_term(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
@@ -361,10 +462,13 @@ async def _handle_update_shield_mode(sdk: TwitchSDK, arguments: dict) -> list[Te
 
 
 async def _handle_get_unban_requests(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetUnbanRequestsRequest(**arguments)
-    result = await moderation.get_unban_requests(sdk.http, params)
-    requests = [f"- {r.user_name}: {r.text} ({r.status})" for r in result.data]
-    return [TextContent(type="text", text=f"Unban requests:\n" + "\n".join(requests) if requests else "No unban requests")]
+    pages = Paginator.from_arguments(
+        lambda p: moderation.get_unban_requests(sdk.http, p), GetUnbanRequestsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    requests = await render_items(pages, lambda r: f"- {r.user_name}: {r.text} ({r.status})")
+    return [TextContent(type="text", text=f"Unban requests:\n{requests}" if requests else "No unban requests")]
 
 
 async def _handle_resolve_unban_request(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
@@ -411,6 +515,7 @@ def get_handlers() -> dict:
     """Return handlers for moderation tools."""
     return {
         "twitch_ban_user": _handle_ban_user,
+        "twitch_bulk_ban_users": _handle_bulk_ban_users,
         "twitch_unban_user": _handle_unban_user,
         "twitch_get_banned_users": _handle_get_banned_users,
         "twitch_warn_user": _handle_warn_user,
@@ -6,6 +6,9 @@ from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import polls
 from twitch_sdk.schemas.polls import CreatePollRequest, EndPollRequest, GetPollsRequest, PollChoiceInput
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return polls tools."""
@@ -39,6 +42,7 @@ def get_tools() -> list[Tool]:
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "id": {"type": "array", "items": {"type": "string"}, "description": "Specific poll IDs"},
                     "first": {"type": "integer", "description": "Max results (max 20)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -69,16 +73,14 @@ async def _handle_create_poll(sdk: TwitchSDK, arguments: dict) -> list[TextConte
 
 
 async def _handle_get_polls(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetPollsRequest(**arguments)
-    result = await polls.get_polls(sdk.http, params)
-    poll_list = []
-    for p in result.data:
-        choices_str = "\n".join([f"    {c.title}: {c.votes} votes" for c in p.choices])
-        poll_list.append(
-            f"- {p.title} ({p.status})\n"
-            f"  Choices:\n{choices_str}"
-        )
-    return [TextContent(type="text", text="\n".join(poll_list) if poll_list else "No polls found")]
+    pages = Paginator.from_arguments(lambda p: polls.get_polls(sdk.http, p), GetPollsRequest, arguments, page_size=20)
+    if is_structured():
+        return await structured_pages(pages)
+    poll_list = await render_items(pages, lambda p: (
+        f"- {p.title} ({p.status})\n"
+        "  Choices:\n" + "\n".join(f"    {c.title}: {c.votes} votes" for c in p.choices)
+    ))
+    return [TextContent(type="text", text=poll_list or "No polls found")]
 
 
 async def _handle_end_poll(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
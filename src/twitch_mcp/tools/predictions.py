@@ -11,6 +11,9 @@ from twitch_sdk.schemas.predictions import (
     PredictionOutcomeInput,
 )
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return predictions tools."""
@@ -42,6 +45,7 @@ def get_tools() -> list[Tool]:
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "id": {"type": "array", "items": {"type": "string"}, "description": "Specific prediction IDs"},
                     "first": {"type": "integer", "description": "Max results (max 25)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -74,16 +78,16 @@ async def _handle_create_prediction(sdk: TwitchSDK, arguments: dict) -> list[Tex
 
 
 async def _handle_get_predictions(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetPredictionsRequest(**arguments)
-    result = await predictions.get_predictions(sdk.http, params)
-    pred_list = []
-    for p in result.data:
-        outcomes_str = "\n".join([f"    {o.title}: {o.channel_points} points ({o.users} users)" for o in p.outcomes])
-        pred_list.append(
-            f"- {p.title} ({p.status})\n"
-            f"  Outcomes:\n{outcomes_str}"
-        )
-    return [TextContent(type="text", text="\n".join(pred_list) if pred_list else "No predictions found")]
+    pages = Paginator.from_arguments(
+        lambda p: predictions.get_predictions(sdk.http, p), GetPredictionsRequest, arguments, page_size=25
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    pred_list = await render_items(pages, lambda p: (
+        f"- {p.title} ({p.status})\n"
+        "  Outcomes:\n" + "\n".join(f"    {o.title}: {o.channel_points} points ({o.users} users)" for o in p.outcomes)
+    ))
+    return [TextContent(type="text", text=pred_list or "No predictions found")]
 
 
 async def _handle_end_prediction(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
@@ -1,5 +1,7 @@
 """Schedule MCP tools."""
 
+from types import SimpleNamespace
+
 from mcp.types import Tool, TextContent
 
 from twitch_sdk import TwitchSDK
@@ -13,6 +15,9 @@ from twitch_sdk.schemas.schedule import (
     UpdateScheduleSegmentRequest,
 )
 
+from ..output import is_structured, set_structured
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return schedule tools."""
@@ -25,6 +30,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "first": {"type": "integer", "description": "Max segments (max 25)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -106,14 +112,23 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_get_channel_schedule(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetScheduleRequest(**arguments)
-    result = await schedule.get_channel_stream_schedule(sdk.http, params)
-    sched = result.get("data", {})
-    segments = sched.get("segments", [])
-    seg_list = []
-    for s in segments:
-        seg_list.append(f"- {s.get('title', 'Untitled')}\n  {s.get('start_time')} - {s.get('end_time')}")
-    return [TextContent(type="text", text=f"Schedule:\n" + "\n".join(seg_list) if seg_list else "No scheduled streams")]
+    pages = Paginator.from_arguments(
+        lambda p: _get_schedule_page(sdk, p), GetScheduleRequest, arguments, page_size=25
+    )
+    if is_structured():
+        # data is the schedule object; its segments are merged across pages
+        segments = [s async for s in pages]
+        set_structured({"data": {**(pages.first_page.schedule if pages.first_page else {}), "segments": segments}})
+        return []
+    seg_list = await render_items(pages, lambda s: f"- {s.get('title', 'Untitled')}\n  {s.get('start_time')} - {s.get('end_time')}")
+    return [TextContent(type="text", text=f"Schedule:\n{seg_list}" if seg_list else "No scheduled streams")]
+
+
+async def _get_schedule_page(sdk: TwitchSDK, params: GetScheduleRequest) -> SimpleNamespace:
+    """One page of segments; the endpoint returns the schedule as ``data``."""
+    response = await schedule.get_channel_stream_schedule(sdk.http, params)
+    sched = response.get("data") or {}
+    return SimpleNamespace(data=sched.get("segments") or [], pagination=response.get("pagination"), schedule=sched)
 
 
 async def _handle_update_channel_schedule(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
@@ -6,6 +6,9 @@ from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import search
 from twitch_sdk.schemas.search import SearchCategoriesRequest, SearchChannelsRequest
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return search tools."""
@@ -18,6 +21,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "query": {"type": "string", "description": "Search query"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["query"],
             },
@@ -31,6 +35,7 @@ def get_tools() -> list[Tool]:
                     "query": {"type": "string", "description": "Search query"},
                     "live_only": {"type": "boolean", "description": "Only show live channels"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["query"],
             },
@@ -39,20 +44,25 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_search_categories(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = SearchCategoriesRequest(**arguments)
-    result = await search.search_categories(sdk.http, params)
-    categories = [f"- {c.name} (ID: {c.id})" for c in result.data]
-    return [TextContent(type="text", text=f"Categories:\n" + "\n".join(categories) if categories else "No categories found")]
+    pages = Paginator.from_arguments(
+        lambda p: search.search_categories(sdk.http, p), SearchCategoriesRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    categories = await render_items(pages, lambda c: f"- {c.name} (ID: {c.id})")
+    return [TextContent(type="text", text=f"Categories:\n{categories}" if categories else "No categories found")]
 
 
 async def _handle_search_channels(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = SearchChannelsRequest(**arguments)
-    result = await search.search_channels(sdk.http, params)
-    channels = []
-    for ch in result.data:
-        live = " [LIVE]" if ch.is_live else ""
-        channels.append(f"- {ch.display_name}{live}: {ch.title[:50]}... (ID: {ch.id})")
-    return [TextContent(type="text", text=f"Channels:\n" + "\n".join(channels) if channels else "No channels found")]
+    pages = Paginator.from_arguments(
+        lambda p: search.search_channels(sdk.http, p), SearchChannelsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    channels = await render_items(
+        pages, lambda ch: f"- {ch.display_name}{' [LIVE]' if ch.is_live else ''}: {ch.title[:50]}... (ID: {ch.id})"
+    )
+    return [TextContent(type="text", text=f"Channels:\n{channels}" if channels else "No channels found")]
 
 
 def get_handlers() -> dict:
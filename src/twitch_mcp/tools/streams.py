@@ -10,13 +10,17 @@ from twitch_sdk.schemas.streams import (
     GetStreamsRequest,
 )
 
+from ..chunking import fetch_chunked
+from ..output import is_structured, structured_items, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return streams tools."""
     return [
         Tool(
             name="twitch_get_streams",
-            description="Get active live streams, optionally filtered by user/game",
+            description="Get active live streams, optionally filtered by user/game (any number of users; looked up 100 at a time)",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -36,6 +40,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "user_id": {"type": "string", "description": "The user ID to get followed streams for"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["user_id"],
             },
@@ -56,10 +61,19 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_get_streams(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetStreamsRequest(**arguments) if arguments else None
-    result = await streams.get_streams(sdk.http, params)
+    live = await fetch_chunked(
+        lambda p: streams.get_streams(sdk.http, p),
+        GetStreamsRequest,
+        arguments,
+        fields={"user_id": lambda s: s.user_id, "user_login": lambda s: s.user_login},
+        item_key=lambda s: s.id,
+        # Each chunk can match up to 100 live streams
+        chunk_overrides={"first": 100},
+    )
+    if is_structured():
+        return structured_items(live)
     stream_list = []
-    for s in result.data:
+    for s in live:
         stream_list.append(
             f"- {s.user_name}: {s.title}\n"
             f"  Game: {s.game_name} | Viewers: {s.viewer_count} | Started: {s.started_at}"
@@ -68,12 +82,13 @@ async def _handle_get_streams(sdk: TwitchSDK, arguments: dict) -> list[TextConte
 
 
 async def _handle_get_followed_streams(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetFollowedStreamsRequest(**arguments)
-    result = await streams.get_followed_streams(sdk.http, params)
-    stream_list = []
-    for s in result.data:
-        stream_list.append(f"- {s.user_name}: {s.title} ({s.viewer_count} viewers)")
-    return [TextContent(type="text", text=f"Followed Streams:\n" + "\n".join(stream_list) if stream_list else "No followed streams live")]
+    pages = Paginator.from_arguments(
+        lambda p: streams.get_followed_streams(sdk.http, p), GetFollowedStreamsRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    stream_list = await render_items(pages, lambda s: f"- {s.user_name}: {s.title} ({s.viewer_count} viewers)")
+    return [TextContent(type="text", text=f"Followed Streams:\n{stream_list}" if stream_list else "No followed streams live")]
 
 
 async def _handle_create_stream_marker(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
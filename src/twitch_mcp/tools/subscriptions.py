@@ -6,6 +6,9 @@ from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import subscriptions
 from twitch_sdk.schemas.subscriptions import CheckUserSubscriptionRequest, GetBroadcasterSubscriptionsRequest
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return subscriptions tools."""
@@ -19,6 +22,7 @@ def get_tools() -> list[Tool]:
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "user_id": {"type": "array", "items": {"type": "string"}, "description": "Filter to specific users"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -39,10 +43,17 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_get_broadcaster_subscriptions(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetBroadcasterSubscriptionsRequest(**arguments)
-    result = await subscriptions.get_broadcaster_subscriptions(sdk.http, params)
-    subs = [f"- {s.user_name} (Tier {s.tier})" + (" [Gift]" if s.is_gift else "") for s in result.data]
-    return [TextContent(type="text", text=f"Subscribers ({result.total}, {result.points} points):\n" + "\n".join(subs[:50]))]
+    pages = Paginator.from_arguments(
+        lambda p: subscriptions.get_broadcaster_subscriptions(sdk.http, p),
+        GetBroadcasterSubscriptionsRequest,
+        arguments,
+        page_size=100,
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    subs = await render_items(pages, lambda s: f"- {s.user_name} (Tier {s.tier})" + (" [Gift]" if s.is_gift else ""))
+    points = pages.first_page.points if pages.first_page else 0
+    return [TextContent(type="text", text=f"Subscribers ({pages.total}, {points} points):\n{subs}")]
 
 
 async def _handle_check_user_subscription(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
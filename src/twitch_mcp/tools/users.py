@@ -13,13 +13,18 @@ from twitch_sdk.schemas.users import (
     UpdateUserRequest,
 )
 
+from ..chunking import fetch_chunked
+from ..logins import get_login_index
+from ..output import is_structured, set_structured, structured_items, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return users tools."""
     return [
         Tool(
             name="twitch_get_users",
-            description="Get user information by ID or login name",
+            description="Get user information by ID or login name (any number; looked up 100 at a time)",
             inputSchema={
                 "type": "object",
                 "properties": {
@@ -28,6 +33,18 @@ def get_tools() -> list[Tool]:
                 },
             },
         ),
+        Tool(
+            name="twitch_get_user_ids",
+            description="Resolve login names to user IDs from the local login index (unknown or stale logins are fetched, 100 at a time)",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "logins": {"type": "array", "items": {"type": "string"}, "description": "User login names"},
+                    "refresh": {"type": "boolean", "description": "Fetch every login from Twitch instead of using the index"},
+                },
+                "required": ["logins"],
+            },
+        ),
         Tool(
             name="twitch_update_user",
             description="Update the authenticated user's description",
@@ -46,6 +63,7 @@ def get_tools() -> list[Tool]:
                 "properties": {
                     "broadcaster_id": {"type": "string", "description": "The broadcaster's user ID"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
                 "required": ["broadcaster_id"],
             },
@@ -107,10 +125,18 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_get_users(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetUsersRequest(**arguments) if arguments else None
-    result = await users.get_users(sdk.http, params)
+    found = await fetch_chunked(
+        lambda p: users.get_users(sdk.http, p),
+        GetUsersRequest,
+        arguments,
+        fields={"id": lambda u: u.id, "login": lambda u: u.login},
+        item_key=lambda u: u.id,
+    )
+    get_login_index().record((u.id, u.login, u.display_name) for u in found)
+    if is_structured():
+        return structured_items(found)
     user_list = []
-    for u in result.data:
+    for u in found:
         user_list.append(
             f"- {u.display_name} ({u.login})\n"
             f"  ID: {u.id}\n"
@@ -120,6 +146,18 @@ async def _handle_get_users(sdk: TwitchSDK, arguments: dict) -> list[TextContent
     return [TextContent(type="text", text="\n".join(user_list) if user_list else "No users found")]
 
 
+async def _handle_get_user_ids(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
+    index = get_login_index()
+    logins = [login.lower() for login in arguments["logins"]]
+    if arguments.get("refresh"):
+        ids = await index.refresh(sdk, logins)
+    else:
+        ids = await index.resolve(sdk, logins, strict=False)
+    set_structured({login: ids.get(login) for login in logins})
+    lines = [f"- {login}: {ids.get(login, 'not found')}" for login in dict.fromkeys(logins)]
+    return [TextContent(type="text", text="\n".join(lines) if lines else "No logins given")]
+
+
 async def _handle_update_user(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
     params = UpdateUserRequest(**arguments)
     result = await users.update_user(sdk.http, params)
@@ -128,10 +166,13 @@ async def _handle_update_user(sdk: TwitchSDK, arguments: dict) -> list[TextConte
 
 
 async def _handle_get_user_block_list(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetUserBlockListRequest(**arguments)
-    result = await users.get_user_block_list(sdk.http, params)
-    blocked = [f"- {b.display_name} ({b.user_id})" for b in result.data]
-    return [TextContent(type="text", text=f"Blocked users:\n" + "\n".join(blocked) if blocked else "No blocked users")]
+    pages = Paginator.from_arguments(
+        lambda p: users.get_user_block_list(sdk.http, p), GetUserBlockListRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    blocked = await render_items(pages, lambda b: f"- {b.display_name} ({b.user_id})")
+    return [TextContent(type="text", text=f"Blocked users:\n{blocked}" if blocked else "No blocked users")]
 
 
 async def _handle_block_user(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
@@ -176,6 +217,7 @@ def get_handlers() -> dict:
     """Return handlers for users tools."""
     return {
         "twitch_get_users": _handle_get_users,
+        "twitch_get_user_ids": _handle_get_user_ids,
         "twitch_update_user": _handle_update_user,
         "twitch_get_user_block_list": _handle_get_user_block_list,
         "twitch_block_user": _handle_block_user,
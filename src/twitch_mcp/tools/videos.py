@@ -6,6 +6,9 @@ from twitch_sdk import TwitchSDK
 from twitch_sdk.endpoints import videos
 from twitch_sdk.schemas.videos import DeleteVideosRequest, GetVideosRequest
 
+from ..output import is_structured, structured_pages
+from ..pagination import PAGINATION_PROPERTIES, Paginator, render_items
+
 
 def get_tools() -> list[Tool]:
     """Return videos tools."""
@@ -22,6 +25,7 @@ def get_tools() -> list[Tool]:
                     "type": {"type": "string", "description": "Filter: all, archive, highlight, upload"},
                     "sort": {"type": "string", "description": "Sort: time, trending, views"},
                     "first": {"type": "integer", "description": "Max results (max 100)"},
+                    **PAGINATION_PROPERTIES,
                 },
             },
         ),
@@ -40,16 +44,17 @@ def get_tools() -> list[Tool]:
 
 
 async def _handle_get_videos(sdk: TwitchSDK, arguments: dict) -> list[TextContent]:
-    params = GetVideosRequest(**arguments)
-    result = await videos.get_videos(sdk.http, params)
-    video_list = []
-    for v in result.data:
-        video_list.append(
-            f"- {v.title}\n"
-            f"  By: {v.user_name} | Views: {v.view_count} | Duration: {v.duration}\n"
-            f"  URL: {v.url}"
-        )
-    return [TextContent(type="text", text="\n".join(video_list) if video_list else "No videos found")]
+    pages = Paginator.from_arguments(
+        lambda p: videos.get_videos(sdk.http, p), GetVideosRequest, arguments, page_size=100
+    )
+    if is_structured():
+        return await structured_pages(pages)
+    video_list = await render_items(pages, lambda v: (
+        f"- {v.title}\n"
+        f"  By: {v.user_name} | Views: {v.view_count} | Duration: {v.duration}\n"
+        f"  URL: {v.url}"
+    ))
+    return [TextContent(type="text", text=video_list or "No videos found")]
 
 
 async def _handle_delete_videos(sdk: TwitchSDK, arguments: dict) -> list[TextContent]: